@@ -26,6 +26,7 @@ Examples
 >>> frames = fn.get_frames_by_lemma("give")
 """
 
+import multiprocessing
 import os
 import sys
 import warnings
@@ -43,6 +44,7 @@ def _check_initialization() -> None:
             "sphinx" in sys.modules,  # Building docs
             "pytest" in sys.modules,  # Running tests
             os.environ.get("CI"),  # CI environment
+            multiprocessing.current_process().name != "MainProcess",  # Worker process
         ]
     ):
         return
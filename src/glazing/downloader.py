@@ -46,9 +46,10 @@ import tempfile
 import zipfile
 from abc import ABC, abstractmethod
 from pathlib import Path
-from typing import cast
+from typing import IO, cast
 
 import requests
+import urllib3
 from tqdm import tqdm
 
 from glazing.types import DatasetType
@@ -183,6 +184,50 @@ class BaseDownloader(ABC):
             msg = f"Failed to write file {output_path}: {e}"
             raise DownloadError(msg) from e
 
+    def _stream_tar_archive(self, url: str, output_dir: Path, desc: str) -> None:
+        """Download a gzipped tar archive and extract it while it arrives.
+
+        Parameters
+        ----------
+        url : str
+            URL of the ``.tar.gz`` archive.
+        output_dir : Path
+            Directory to extract into.
+        desc : str
+            Progress bar description.
+
+        Raises
+        ------
+        DownloadError
+            If the request or the transfer fails.
+        ExtractionError
+            If the received data is not a valid gzipped tar archive.
+
+        Notes
+        -----
+        The response body is fed to ``tarfile`` in stream mode (``"r|gz"``),
+        so gzip decoding and unpacking overlap with the network transfer and
+        no archive file is written to disk.
+        """
+        try:
+            with requests.get(url, stream=True, timeout=30) as response:
+                response.raise_for_status()
+                response.raw.decode_content = True
+
+                total_size = int(response.headers.get("content-length", 0))
+                with (
+                    tqdm.wrapattr(response.raw, "read", total=total_size, desc=desc) as stream,
+                    tarfile.open(fileobj=cast(IO[bytes], stream), mode="r|gz") as tar_ref,
+                ):
+                    tar_ref.extractall(output_dir, filter="data")
+
+        except (requests.RequestException, urllib3.exceptions.HTTPError) as e:
+            msg = f"Failed to download {url}: {e}"
+            raise DownloadError(msg) from e
+        except (tarfile.TarError, OSError) as e:
+            msg = f"Failed to extract archive from {url}: {e}"
+            raise ExtractionError(msg) from e
+
     def _extract_archive(self, archive_path: Path, output_dir: Path) -> Path:
         """Extract archive and return extracted directory path.
 
@@ -438,13 +483,16 @@ class WordNetDownloader(BaseDownloader):
         """Version of WordNet."""
         return "3.1"
 
-    def download(self, output_dir: Path) -> Path:
+    def download(self, output_dir: Path, streaming: bool = True) -> Path:
         """Download WordNet dataset.
 
         Parameters
         ----------
         output_dir : Path
             Directory to download WordNet to.
+        streaming : bool, default=True
+            Extract the archive while it downloads instead of saving it
+            to disk first.
 
         Returns
         -------
@@ -460,6 +508,18 @@ class WordNetDownloader(BaseDownloader):
         """
         url = "https://wordnetcode.princeton.edu/wn3.1.dict.tar.gz"
         archive_name = "wordnet-3.1.tar.gz"
+
+        if streaming:
+            output_dir.mkdir(parents=True, exist_ok=True)
+            with tempfile.TemporaryDirectory() as temp_dir:
+                temp_path = Path(temp_dir)
+                self._stream_tar_archive(url, temp_path, f"Downloading {archive_name}")
+                try:
+                    return self._install_dict(temp_path, output_dir)
+                except OSError as e:
+                    msg = f"Failed to extract WordNet archive: {e}"
+                    raise ExtractionError(msg) from e
+
         archive_path = output_dir / archive_name
 
         self._download_file(url, archive_path)
@@ -474,16 +534,7 @@ class WordNetDownloader(BaseDownloader):
                 with tarfile.open(str(archive_path), "r:gz") as tar_ref:
                     tar_ref.extractall(temp_path, filter="data")
 
-                # The archive contains a 'dict' folder
-                extracted_dict = temp_path / "dict"
-                if not extracted_dict.exists():
-                    raise ExtractionError("Expected 'dict' folder in WordNet archive")
-
-                # Move to final location
-                final_dict = output_dir / "wn31-dict"
-                if final_dict.exists():
-                    shutil.rmtree(final_dict)
-                shutil.move(str(extracted_dict), str(final_dict))
+                final_dict = self._install_dict(temp_path, output_dir)
 
                 # Clean up archive file
                 archive_path.unlink()
@@ -496,6 +547,38 @@ class WordNetDownloader(BaseDownloader):
             msg = f"Failed to extract WordNet archive: {e}"
             raise ExtractionError(msg) from e
 
+    def _install_dict(self, extracted_dir: Path, output_dir: Path) -> Path:
+        """Move the extracted 'dict' folder to its final location.
+
+        Parameters
+        ----------
+        extracted_dir : Path
+            Directory the archive was extracted into.
+        output_dir : Path
+            Directory to install WordNet into.
+
+        Returns
+        -------
+        Path
+            Path to the installed WordNet directory.
+
+        Raises
+        ------
+        ExtractionError
+            If the archive did not contain a 'dict' folder.
+        """
+        # The archive contains a 'dict' folder
+        extracted_dict = extracted_dir / "dict"
+        if not extracted_dict.exists():
+            raise ExtractionError("Expected 'dict' folder in WordNet archive")
+
+        # Move to final location
+        final_dict = output_dir / "wn31-dict"
+        if final_dict.exists():
+            shutil.rmtree(final_dict)
+        shutil.move(str(extracted_dict), str(final_dict))
+        return final_dict
+
 
 class FrameNetDownloader(BaseDownloader):
     """Downloads FrameNet from NLTK data repository.
@@ -7,6 +7,8 @@ Classes
 -------
 LRUCache
     Thread-safe Least Recently Used cache implementation.
+FIFOCache
+    Thread-safe First In, First Out cache with lock-free hits.
 TTLCache
     Time-To-Live cache with automatic expiration.
 QueryCache
@@ -223,6 +225,95 @@ class LRUCache[T](CacheBase):
             return key in self._cache
 
 
+class FIFOCache[T](CacheBase):
+    """Thread-safe First In, First Out cache without recency tracking.
+
+    A lookup is a single dict probe: hits do not reorder entries and take
+    no lock, so this suits per-object caches on hot paths. Writes hold a
+    lock so concurrent evictions stay consistent. When full, the oldest
+    inserted entry is evicted.
+
+    Parameters
+    ----------
+    max_size : int
+        Maximum number of entries to store.
+
+    Methods
+    -------
+    get(key, default=None)
+        Get a value from the cache.
+    put(key, value)
+        Store a value in the cache.
+    clear()
+        Clear all entries.
+
+    Examples
+    --------
+    >>> cache = FIFOCache[str](max_size=100)
+    >>> cache.put("key1", "value1")
+    >>> value = cache.get("key1")
+    """
+
+    def __init__(self, max_size: int = 128) -> None:
+        """Initialize the FIFO cache."""
+        super().__init__()
+        self.max_size = max_size
+        self._cache: dict[Hashable, T] = {}
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: T | None = None) -> T | None:
+        """Get a value from the cache.
+
+        Parameters
+        ----------
+        key : Hashable
+            The cache key.
+        default : T | None
+            Default value if key not found.
+
+        Returns
+        -------
+        T | None
+            The cached value or default.
+        """
+        if not CACHING_ENABLED:
+            return default
+        return self._cache.get(key, default)
+
+    def put(self, key: Hashable, value: T) -> None:
+        """Store a value in the cache.
+
+        Parameters
+        ----------
+        key : Hashable
+            The cache key.
+        value : T
+            The value to cache.
+        """
+        if not CACHING_ENABLED or self.max_size <= 0:
+            return
+
+        cache = self._cache
+        with self._lock:
+            if key not in cache and len(cache) >= self.max_size:
+                # Dicts keep insertion order, so the first key is the oldest
+                del cache[next(iter(cache))]
+            cache[key] = value
+
+    def clear(self) -> None:
+        """Clear all entries from the cache."""
+        with self._lock:
+            self._cache.clear()
+
+    def size(self) -> int:
+        """Get the number of entries in the cache."""
+        return len(self._cache)
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Check if a key is in the cache."""
+        return key in self._cache
+
+
 class TTLCache[T](CacheBase):
     """Time-To-Live cache with automatic expiration.
 
@@ -218,7 +218,7 @@ class VerbNetConverter:
             raise ValueError(msg)
 
         # Validate class ID format
-        if not re.match(VERBNET_CLASS_PATTERN, class_id):
+        if not re.fullmatch(VERBNET_CLASS_PATTERN, class_id):
             msg = f"Invalid VerbNet class ID format: {class_id}"
             raise ValueError(msg)
 
@@ -469,7 +469,7 @@ class VerbNetConverter:
         xtag = str(attrs.get("xtag", "")).strip()
 
         # Validate description number format
-        if not re.match(DESCRIPTION_NUMBER_PATTERN, description_number):
+        if not re.fullmatch(DESCRIPTION_NUMBER_PATTERN, description_number):
             description_number = "0.0"
 
         # Parse primary pattern into elements
@@ -60,9 +60,10 @@ Examples
 from __future__ import annotations
 
 import re
+import sys
 from typing import Self
 
-from pydantic import Field, ValidationInfo, field_validator
+from pydantic import ConfigDict, Field, PrivateAttr, ValidationInfo, field_validator
 
 from glazing.base import GlazingBaseModel
 from glazing.references.models import (
@@ -87,6 +88,12 @@ from glazing.verbnet.types import (
     WordNetSense,
 )
 
+# Percentage notation with captured lemma, ss_type, lex_filenum and lex_id
+PERCENTAGE_NOTATION_REGEX = re.compile(r"^([a-z_-]+)%([1-5]):([0-9]{2}):([0-9]{2})$")
+
+# WordNet ss_type digit to part of speech
+SS_TYPE_TO_POS = {"1": "n", "2": "v", "3": "a", "4": "r", "5": "s"}
+
 
 class SelectionalRestriction(GlazingBaseModel):
     """Single selectional restriction.
@@ -105,6 +112,8 @@ class SelectionalRestriction(GlazingBaseModel):
     'animate'
     """
 
+    model_config = ConfigDict(frozen=True)
+
     value: RestrictionValue
     type: SelectionalRestrictionType
 
@@ -240,12 +249,22 @@ class ThematicRole(GlazingBaseModel):
     ... )
     >>> print(role.type)
     'Agent'
+
+    Notes
+    -----
+    Roles are immutable so they can be shared between a class and the
+    subclasses that inherit them. Validation against the ThematicRoleType
+    literal returns the literal's own string object, so equal role types
+    share identity and compare by pointer first.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     type: ThematicRoleType
     sel_restrictions: SelectionalRestrictions | None = Field(
         None, description="Selectional restrictions on this role"
     )
+    _class_id: str | None = PrivateAttr(default=None)
 
     def class_id(self) -> str | None:
         """Get the class ID this role belongs to (for inheritance).
@@ -255,7 +274,7 @@ class ThematicRole(GlazingBaseModel):
         str | None
             The class ID if set, None otherwise.
         """
-        return getattr(self, "_class_id", None)
+        return self._class_id
 
 
 class WordNetCrossRef(GlazingBaseModel):
@@ -328,22 +347,17 @@ class WordNetCrossRef(GlazingBaseModel):
         ValueError
             If notation format is invalid.
         """
-        match = re.match(r"^([a-z_-]+)%([1-5]):([0-9]{2}):([0-9]{2})$", notation)
+        match = PERCENTAGE_NOTATION_REGEX.fullmatch(notation)
         if not match:
             msg = f"Invalid percentage notation: {notation}"
             raise ValueError(msg)
 
-        lemma = match.group(1)
-        ss_type = int(match.group(2))
-        lex_filenum = match.group(3)
-        lex_id = match.group(4)
-
-        pos_map = {1: "n", 2: "v", 3: "a", 4: "r", 5: "s"}
-        pos = pos_map[ss_type]
-
+        lemma, ss_type, lex_filenum, lex_id = match.groups()
+        pos = SS_TYPE_TO_POS[ss_type]
         sense_key = f"{lemma}%{ss_type}:{lex_filenum}:{lex_id}::"
 
-        return cls(sense_key=sense_key, lemma=lemma, pos=pos)
+        # The regex has already validated every field, so skip re-validation
+        return cls.model_construct(sense_key=sense_key, lemma=lemma, pos=pos)
 
 
 class Member(GlazingBaseModel):
@@ -422,7 +436,7 @@ class Member(GlazingBaseModel):
         Returns
         -------
         str
-            Validated member name.
+            Validated member name, interned since lemmas recur across classes.
 
         Raises
         ------
@@ -432,7 +446,7 @@ class Member(GlazingBaseModel):
         if not re.match(r"^[a-zA-Z][a-zA-Z0-9_\-\.\s]*$", v):
             msg = f"Invalid member name format: {v}"
             raise ValueError(msg)
-        return v
+        return sys.intern(v)
 
     @field_validator("verbnet_key")
     @classmethod
@@ -454,7 +468,7 @@ class Member(GlazingBaseModel):
         ValueError
             If VerbNet key format is invalid.
         """
-        if not re.match(VERBNET_KEY_PATTERN, v):
+        if not re.fullmatch(VERBNET_KEY_PATTERN, v):
             msg = f"Invalid verbnet_key format: {v}"
             raise ValueError(msg)
         return v
@@ -527,10 +541,13 @@ class Member(GlazingBaseModel):
         bool
             True if multiple high-confidence FrameNet mappings exist.
         """
-        high_conf_fn = [
-            m for m in self.framenet_mappings if m.confidence and m.confidence.score > 0.7
-        ]
-        return len(high_conf_fn) > 1
+        high_conf_count = 0
+        for mapping in self.framenet_mappings:
+            if mapping.confidence and mapping.confidence.score > 0.7:
+                high_conf_count += 1
+                if high_conf_count > 1:
+                    return True
+        return False
 
 
 class VerbClass(GlazingBaseModel):
@@ -609,7 +626,7 @@ class VerbClass(GlazingBaseModel):
         ValueError
             If class ID format is invalid.
         """
-        if not re.match(VERBNET_CLASS_PATTERN, v):
+        if not re.fullmatch(VERBNET_CLASS_PATTERN, v):
             msg = f"Invalid VerbNet class ID format: {v}"
             raise ValueError(msg)
         return v
@@ -637,11 +654,8 @@ class VerbClass(GlazingBaseModel):
         if not self.themroles and parent_roles:
             return parent_roles
         if parent_roles:
-            final_roles = self.themroles.copy()
-            for parent_role in parent_roles:
-                if not any(r.type == parent_role.type for r in self.themroles):
-                    final_roles.append(parent_role)
-            return final_roles
+            overridden = {r.type for r in self.themroles}
+            return self.themroles + [r for r in parent_roles if r.type not in overridden]
         return self.themroles
 
     def get_all_members(self, include_subclasses: bool = True) -> list[Member]:
@@ -708,6 +722,8 @@ class Example(GlazingBaseModel):
     >>> example = Example(text="John gave Mary a book")
     """
 
+    model_config = ConfigDict(frozen=True)
+
     text: str
 
 
@@ -765,7 +781,7 @@ class FrameDescription(GlazingBaseModel):
         ValueError
             If description number format is invalid.
         """
-        if v and not re.match(r"^[0-9]+(?:\.[0-9]+)*$", v):
+        if v and not re.fullmatch(r"^[0-9]+(?:\.[0-9]+)*$", v):
             msg = f"Invalid description number format: {v}"
             raise ValueError(msg)
         return v
@@ -822,6 +838,8 @@ class SyntacticRestriction(GlazingBaseModel):
     ... )
     """
 
+    model_config = ConfigDict(frozen=True)
+
     type: SyntacticRestrictionType
     value: RestrictionValue
 
@@ -852,6 +870,8 @@ class SyntaxElement(GlazingBaseModel):
     ... )
     """
 
+    model_config = ConfigDict(frozen=True)
+
     pos: SyntacticPOS
     value: str | None = None
     synrestrs: list[SyntacticRestriction] = Field(default_factory=list)
@@ -872,13 +892,16 @@ class SyntaxElement(GlazingBaseModel):
         Returns
         -------
         str | None
-            Validated value.
+            Validated value, interned since role names and prepositions recur
+            across frames.
 
         Raises
         ------
         ValueError
             If preposition value format is invalid.
         """
+        if v is None:
+            return None
         if (
             v
             and info.data.get("pos") == "PREP"
@@ -886,7 +909,7 @@ class SyntaxElement(GlazingBaseModel):
         ):
             msg = f"Invalid preposition value format: {v}"
             raise ValueError(msg)
-        return v
+        return sys.intern(v)
 
 
 class Syntax(GlazingBaseModel):
@@ -925,6 +948,8 @@ class PredicateArgument(GlazingBaseModel):
     >>> event_arg = PredicateArgument(type="Event", value="e1")
     """
 
+    model_config = ConfigDict(frozen=True)
+
     type: ArgumentType
     value: str
 
@@ -943,7 +968,8 @@ class PredicateArgument(GlazingBaseModel):
         Returns
         -------
         str
-            Validated value.
+            Validated value, interned since event variables and role names
+            recur across predicates.
 
         Raises
         ------
@@ -954,7 +980,7 @@ class PredicateArgument(GlazingBaseModel):
         if arg_type == "Event" and not re.match(r"^[eEë]\d*$", v):
             msg = f"Invalid event variable format: {v}"
             raise ValueError(msg)
-        return v
+        return sys.intern(v)
 
 
 class Predicate(GlazingBaseModel):
@@ -8,15 +8,12 @@ selectional restrictions, and member verbs.
 from __future__ import annotations
 
 from collections import defaultdict
+from functools import cached_property
 from pathlib import Path
 
-from glazing.syntax.models import UnifiedSyntaxPattern
+from glazing.syntax.models import BaseConstituentType, UnifiedSyntaxPattern
 from glazing.syntax.parser import SyntaxParser
-from glazing.verbnet.models import (
-    SelectionalRestriction,
-    SelectionalRestrictions,
-    VerbClass,
-)
+from glazing.verbnet.models import VerbClass
 from glazing.verbnet.symbol_parser import filter_roles_by_properties
 from glazing.verbnet.types import (
     PredicateType,
@@ -26,6 +23,9 @@ from glazing.verbnet.types import (
     VerbClassID,
 )
 
+type RestrictionKey = tuple[ThematicRoleType, SelectionalRestrictionType, RestrictionValue]
+type SyntaxKey = tuple[BaseConstituentType, ...]
+
 
 class VerbNetSearch:
     """Search interface for VerbNet data.
@@ -49,6 +49,18 @@ class VerbNetSearch:
         Mapping from thematic role to class IDs.
     _classes_by_predicate : dict[PredicateType, set[VerbClassID]]
         Mapping from semantic predicate to class IDs.
+    _classes_by_role_set : dict[frozenset[ThematicRoleType], set[VerbClassID]]
+        Mapping from a class's exact set of thematic roles to class IDs.
+        Built lazily.
+    _classes_by_restriction : dict[RestrictionKey, set[VerbClassID]]
+        Mapping from (role, restriction type, value) to class IDs. Built
+        lazily.
+    _classes_by_syntax : dict[SyntaxKey, set[VerbClassID]]
+        Mapping from frame constituent sequence to class IDs. Built lazily.
+    _total_members : int
+        Number of members across all indexed classes.
+    _total_frames : int
+        Number of frames across all indexed classes.
 
     Methods
     -------
@@ -83,6 +95,8 @@ class VerbNetSearch:
         self._classes_by_member: dict[str, set[VerbClassID]] = defaultdict(set)
         self._classes_by_role: dict[ThematicRoleType, set[VerbClassID]] = defaultdict(set)
         self._classes_by_predicate: dict[PredicateType, set[VerbClassID]] = defaultdict(set)
+        self._total_members = 0
+        self._total_frames = 0
 
         if classes:
             for verb_class in classes:
@@ -106,6 +120,9 @@ class VerbNetSearch:
             raise ValueError(msg)
 
         self._classes[verb_class.id] = verb_class
+        self._invalidate_lazy_indexes()
+        self._total_members += len(verb_class.members)
+        self._total_frames += len(verb_class.frames)
 
         # Index members
         for member in verb_class.members:
@@ -124,6 +141,62 @@ class VerbNetSearch:
         for subclass in verb_class.subclasses:
             self.add_class(subclass)
 
+    def _invalidate_lazy_indexes(self) -> None:
+        """Discard lazily built indexes so they are rebuilt on next use."""
+        for name in ("_classes_by_role_set", "_classes_by_restriction", "_classes_by_syntax"):
+            self.__dict__.pop(name, None)
+
+    @cached_property
+    def _classes_by_role_set(self) -> dict[frozenset[ThematicRoleType], set[VerbClassID]]:
+        """Build the index from each class's exact set of thematic roles.
+
+        Returns
+        -------
+        dict[frozenset[ThematicRoleType], set[VerbClassID]]
+            Mapping from role set to class IDs.
+        """
+        classes_by_role_set: dict[frozenset[ThematicRoleType], set[VerbClassID]] = defaultdict(set)
+        for verb_class in self._classes.values():
+            role_set = frozenset(role.type for role in verb_class.themroles)
+            classes_by_role_set[role_set].add(verb_class.id)
+        return classes_by_role_set
+
+    @cached_property
+    def _classes_by_restriction(self) -> dict[RestrictionKey, set[VerbClassID]]:
+        """Build the index of selectional restrictions on thematic roles.
+
+        Returns
+        -------
+        dict[RestrictionKey, set[VerbClassID]]
+            Mapping from (role, restriction type, value) to class IDs.
+        """
+        classes_by_restriction: dict[RestrictionKey, set[VerbClassID]] = defaultdict(set)
+        for verb_class in self._classes.values():
+            for role in verb_class.themroles:
+                if role.sel_restrictions:
+                    for restriction in role.sel_restrictions.flatten_restrictions():
+                        key = (role.type, restriction.type, restriction.value)
+                        classes_by_restriction[key].add(verb_class.id)
+        return classes_by_restriction
+
+    @cached_property
+    def _classes_by_syntax(self) -> dict[SyntaxKey, set[VerbClassID]]:
+        """Build the syntax index from the frames of all classes.
+
+        Returns
+        -------
+        dict[SyntaxKey, set[VerbClassID]]
+            Mapping from frame constituent sequence to class IDs.
+        """
+        parser = SyntaxParser()
+        classes_by_syntax: dict[SyntaxKey, set[VerbClassID]] = defaultdict(set)
+        for verb_class in self._classes.values():
+            for frame in verb_class.frames:
+                frame_pattern = parser.parse_verbnet_elements(frame.syntax.elements)
+                key = tuple(e.constituent for e in frame_pattern.elements)
+                classes_by_syntax[key].add(verb_class.id)
+        return classes_by_syntax
+
     def by_themroles(self, roles: list[ThematicRoleType], only: bool = False) -> list[VerbClass]:
         """Find classes with specified thematic roles.
 
@@ -143,31 +216,16 @@ class VerbNetSearch:
         if not roles:
             return []
 
-        # Find classes with all specified roles
-        matching_ids = None
-        for role in roles:
-            role_classes = self._classes_by_role.get(role, set())
-            if matching_ids is None:
-                matching_ids = role_classes.copy()
-            else:
-                matching_ids &= role_classes
-
-        if matching_ids is None:
-            return []
-
-        # Get classes
-        classes = [self._classes[cid] for cid in matching_ids]
-
-        # If only exact matches requested, filter further
         if only:
-            filtered = []
-            role_set = set(roles)
-            for verb_class in classes:
-                class_roles = {r.type for r in verb_class.themroles}
-                if class_roles == role_set:
-                    filtered.append(verb_class)
-            classes = filtered
+            # Exact role set match
+            matching_ids = self._classes_by_role_set.get(frozenset(roles), set())
+        else:
+            # Find classes with all specified roles
+            matching_ids = self._intersect(
+                [self._classes_by_role.get(role, set()) for role in roles]
+            )
 
+        classes = [self._classes[cid] for cid in matching_ids]
         return sorted(classes, key=lambda c: c.id)
 
     def by_syntax(self, pattern: str) -> list[VerbClass]:
@@ -187,23 +245,38 @@ class VerbNetSearch:
         list[VerbClass]
             Verb classes with frames matching the pattern.
         """
-        parser = SyntaxParser()
-        query_pattern = parser.parse(pattern)
-        matching_class_ids = set()
-
-        for verb_class in self._classes.values():
-            for frame in verb_class.frames:
-                # Extract pattern from VerbNet frame syntax elements
-                frame_pattern = parser.parse_verbnet_elements(frame.syntax.elements)
+        query_pattern = SyntaxParser().parse(pattern)
 
-                # Check for pattern match
-                if self._patterns_match(query_pattern, frame_pattern):
-                    matching_class_ids.add(verb_class.id)
-                    break  # Found match in this class
+        matching_class_ids: set[VerbClassID] = set()
+        for key in self._candidate_syntax_keys(query_pattern):
+            matching_class_ids |= self._classes_by_syntax.get(key, set())
 
         classes = [self._classes[cid] for cid in matching_class_ids]
         return sorted(classes, key=lambda c: c.id)
 
+    def _candidate_syntax_keys(self, query_pattern: UnifiedSyntaxPattern) -> list[SyntaxKey]:
+        """Get the frame constituent sequences a query pattern matches.
+
+        A query matches a frame with the same constituents, or a frame where
+        one "PREP NP" pair of the query is a single "PP".
+
+        Parameters
+        ----------
+        query_pattern : UnifiedSyntaxPattern
+            Parsed query pattern.
+
+        Returns
+        -------
+        list[SyntaxKey]
+            Constituent sequences to look up in the syntax index.
+        """
+        constituents = tuple(e.constituent for e in query_pattern.elements)
+        keys = [constituents]
+        for i in range(len(constituents) - 1):
+            if constituents[i] == "PREP" and constituents[i + 1] == "NP":
+                keys.append((*constituents[:i], "PP", *constituents[i + 2 :]))
+        return keys
+
     def _allows_pp_expansion(
         self, query_pattern: UnifiedSyntaxPattern, frame_pattern: UnifiedSyntaxPattern
     ) -> bool:
@@ -237,56 +310,6 @@ class VerbNetSearch:
 
         return False
 
-    def _patterns_match(
-        self, query_pattern: UnifiedSyntaxPattern, frame_pattern: UnifiedSyntaxPattern
-    ) -> bool:
-        """Check if query pattern matches frame pattern.
-
-        Handles both exact matches and PP expansion where "PREP NP" matches "PP".
-        """
-        query_elements = query_pattern.elements
-        frame_elements = frame_pattern.elements
-
-        # Try exact match first
-        if len(query_elements) == len(frame_elements):
-            for q_elem, f_elem in zip(query_elements, frame_elements, strict=False):
-                if q_elem.constituent != f_elem.constituent:
-                    break
-            else:
-                return True  # All elements matched exactly
-
-        # Try PP expansion: "PREP NP" in query matches "PP" in frame
-        if len(query_elements) == len(frame_elements) + 1:
-            query_idx = 0
-            frame_idx = 0
-
-            while query_idx < len(query_elements) and frame_idx < len(frame_elements):
-                q_elem = query_elements[query_idx]
-                f_elem = frame_elements[frame_idx]
-
-                # Check for PREP NP -> PP conversion
-                if (
-                    q_elem.constituent == "PREP"
-                    and query_idx + 1 < len(query_elements)
-                    and query_elements[query_idx + 1].constituent == "NP"
-                    and f_elem.constituent == "PP"
-                ):
-                    # PREP NP in query matches PP in frame
-                    query_idx += 2  # Skip both PREP and NP
-                    frame_idx += 1  # Skip PP
-                elif q_elem.constituent == f_elem.constituent:
-                    # Direct match
-                    query_idx += 1
-                    frame_idx += 1
-                else:
-                    # No match
-                    return False
-
-            # Check if we consumed all elements
-            return query_idx == len(query_elements) and frame_idx == len(frame_elements)
-
-        return False
-
     def by_predicate(self, predicate: PredicateType) -> list[VerbClass]:
         """Find classes using a specific semantic predicate.
 
@@ -326,16 +349,9 @@ class VerbNetSearch:
 
         if require_all:
             # Intersection of classes for all predicates
-            matching_ids = None
-            for predicate in predicates:
-                pred_classes = self._classes_by_predicate.get(predicate, set())
-                if matching_ids is None:
-                    matching_ids = pred_classes.copy()
-                else:
-                    matching_ids &= pred_classes
-
-            if matching_ids is None:
-                return []
+            matching_ids = self._intersect(
+                [self._classes_by_predicate.get(predicate, set()) for predicate in predicates]
+            )
         else:
             # Union of classes for any predicate
             matching_ids = set()
@@ -367,52 +383,9 @@ class VerbNetSearch:
         list[VerbClass]
             Verb classes with matching restrictions.
         """
-        matching_classes = []
-
-        for verb_class in self._classes.values():
-            for themrole in verb_class.themroles:
-                if (
-                    themrole.type == role
-                    and themrole.sel_restrictions
-                    and self._has_restriction(themrole.sel_restrictions, restriction_type, value)
-                ):
-                    matching_classes.append(verb_class)
-                    break
-
-        return sorted(matching_classes, key=lambda c: c.id)
-
-    def _has_restriction(
-        self,
-        restrictions: SelectionalRestrictions,
-        restriction_type: SelectionalRestrictionType,
-        value: RestrictionValue,
-    ) -> bool:
-        """Check if restrictions contain a specific type and value.
-
-        Parameters
-        ----------
-        restrictions : SelectionalRestrictions
-            Restrictions to check.
-        restriction_type : SelectionalRestrictionType
-            Type to look for.
-        value : RestrictionValue
-            Value to match.
-
-        Returns
-        -------
-        bool
-            True if restriction found with matching type and value.
-        """
-        if isinstance(restrictions, SelectionalRestrictions):
-            for restriction in restrictions.restrictions:
-                if isinstance(restriction, SelectionalRestriction):
-                    if restriction.type == restriction_type and restriction.value == value:
-                        return True
-                elif isinstance(restriction, SelectionalRestrictions) and self._has_restriction(
-                    restriction, restriction_type, value
-                ):
-                    return True
-        return False
+        class_ids = self._classes_by_restriction.get((role, restriction_type, value), set())
+        classes = [self._classes[cid] for cid in class_ids]
+        return sorted(classes, key=lambda c: c.id)
 
     def by_members(self, lemmas: list[str]) -> list[VerbClass]:
         """Find classes containing specific member verbs.
@@ -525,15 +498,26 @@ class VerbNetSearch:
         if not themroles:
             return class_ids
 
-        role_classes = None
-        for role in themroles:
-            role_set = self._classes_by_role.get(role, set())
-            if role_classes is None:
-                role_classes = role_set.copy()
-            else:
-                role_classes &= role_set
+        return self._intersect(
+            [class_ids, *(self._classes_by_role.get(role, set()) for role in themroles)]
+        )
+
+    @staticmethod
+    def _intersect(id_sets: list[set[VerbClassID]]) -> set[VerbClassID]:
+        """Intersect class ID sets, starting from the smallest.
 
-        return class_ids & role_classes if role_classes else set()
+        Parameters
+        ----------
+        id_sets : list[set[VerbClassID]]
+            Non-empty list of class ID sets.
+
+        Returns
+        -------
+        set[VerbClassID]
+            Class IDs present in every set.
+        """
+        smallest, *rest = sorted(id_sets, key=len)
+        return smallest.intersection(*rest)
 
     def _filter_by_restrictions(
         self,
@@ -565,7 +549,7 @@ class VerbNetSearch:
             if restriction_classes:
                 restriction_classes &= role_class_set
             else:
-                restriction_classes = role_class_set
+                restriction_classes = set(role_class_set)
 
         return class_ids & restriction_classes
 
@@ -590,11 +574,11 @@ class VerbNetSearch:
         """
         role_class_set: set[str] = set()
         for value, rest_type in role_restrictions:
-            role_rest_classes = {c.id for c in self.by_restriction(role, rest_type, value)}
+            role_rest_classes = self._classes_by_restriction.get((role, rest_type, value), set())
             if role_class_set:
                 role_class_set &= role_rest_classes
             else:
-                role_class_set = role_rest_classes
+                role_class_set = set(role_rest_classes)
         return role_class_set
 
     def _filter_by_syntax(
@@ -721,17 +705,19 @@ class VerbNetSearch:
         -------
         dict[str, int]
             Statistics about indexed data.
-        """
-        total_members = sum(len(c.members) for c in self._classes.values())
-        total_frames = sum(len(c.frames) for c in self._classes.values())
 
+        Notes
+        -----
+        All counts are read from the indexes and running totals kept by
+        ``add_class``, so this does not iterate over the indexed classes.
+        """
         return {
             "class_count": len(self._classes),
             "unique_predicates": len(self._classes_by_predicate),
             "unique_roles": len(self._classes_by_role),
             "unique_members": len(self._classes_by_member),
-            "total_members": total_members,
-            "total_frames": total_frames,
+            "total_members": self._total_members,
+            "total_frames": self._total_frames,
         }
 
     @classmethod
@@ -20,6 +20,8 @@ parse_verb_class
     Parse a VerbNet verb class ID (e.g., "give-13.1-1").
 parse_thematic_role
     Parse a VerbNet thematic role (e.g., "?Theme_I").
+parse_thematic_roles
+    Parse a sequence of VerbNet thematic roles.
 parse_frame_element
     Parse a frame description element (e.g., "PP.location").
 filter_roles_by_properties
@@ -28,6 +30,8 @@ extract_role_base
     Extract base role name without modifiers.
 normalize_role_for_matching
     Normalize role names for fuzzy matching.
+classify_role
+    Compute all role property flags in one pass.
 is_optional_role
     Check if role is optional (marked with ?).
 is_indexed_role
@@ -68,14 +72,19 @@ True
 from __future__ import annotations
 
 import re
+import sys
 from functools import lru_cache
-from typing import TYPE_CHECKING, Literal
+from itertools import product
+from typing import TYPE_CHECKING, Literal, cast
 
-from pydantic import Field, field_validator
+from pydantic import ConfigDict, Field, field_validator
 
 from glazing.symbols import BaseSymbol
+from glazing.verbnet.types import THEMATIC_ROLE_TYPES
 
 if TYPE_CHECKING:
+    from collections.abc import Iterable
+
     from glazing.verbnet.models import ThematicRole
 
 # Type aliases
@@ -88,6 +97,15 @@ VERB_CLASS_PATTERN = re.compile(r"^[a-z][a-z0-9_]*-\d+(\.\d+)*(-\d+)?$")
 THEMATIC_ROLE_PATTERN = re.compile(r"^\??[A-Z][a-zA-Z_]+(_[IJijk])?$")
 FRAME_ELEMENT_PATTERN = re.compile(r"^(PP\.|NP\.)?[A-Za-z][a-zA-Z_]*$")
 
+# Splits any role into optional marker, verb-specific prefix, base and index
+ROLE_PARTS_PATTERN = re.compile(r"(\?)?(V_)?(.*?)(?:_([IJijk]))?", re.DOTALL)
+
+# Role property flags returned by classify_role
+ROLE_OPTIONAL = 1
+ROLE_INDEXED = 2
+ROLE_VERB_SPECIFIC = 4
+ROLE_PP = 8
+
 
 class ParsedVerbClass(BaseSymbol):
     """Parsed VerbNet verb class ID.
@@ -108,8 +126,15 @@ class ParsedVerbClass(BaseSymbol):
         Full class number (e.g., "13.1-1").
     parent_class : str | None
         Parent class ID if this is a subclass.
+
+    Notes
+    -----
+    Instances are frozen because ``parse_verb_class`` caches and shares
+    them between callers.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     symbol_type: Literal["verb_class"] = "verb_class"
     dataset: Literal["verbnet"] = "verbnet"
     base_name: str = Field(..., min_length=1)
@@ -192,8 +217,15 @@ class ParsedThematicRole(BaseSymbol):
         Whether role is verb-specific.
     role_type : RoleType
         Type of role.
+
+    Notes
+    -----
+    Instances are frozen because ``parse_thematic_role`` caches and shares
+    them between callers.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     symbol_type: Literal["thematic_role"] = "thematic_role"
     dataset: Literal["verbnet"] = "verbnet"
     base_role: str = Field(..., min_length=0)  # Can be empty for edge cases
@@ -217,32 +249,19 @@ class ParsedThematicRole(BaseSymbol):
             Parsed thematic role.
         """
         original = role
-        is_optional = False
-        is_verb_specific = False
-        index: str | None = None
-        role_type: RoleType = "thematic"
 
-        # Check for optional prefix
-        if role.startswith("?"):
-            is_optional = True
-            role = role[1:]
-
-        # Check for verb-specific prefix
-        if role.startswith("V_"):
-            is_verb_specific = True
-            role_type = "verb_specific"
-            role = role[2:]
-
-        # Check for index suffix (both uppercase and lowercase)
-        if role.endswith(("_I", "_J")):
-            index = role[-1]
-            role = role[:-2]
-        elif role.endswith(("_i", "_j", "_k")):
-            index = role[-1].upper()
-            role = role[:-2]
+        # Match optional marker, verb-specific prefix and index suffix in one
+        # scan; the base group accepts anything, so every string matches
+        match = cast("re.Match[str]", ROLE_PARTS_PATTERN.fullmatch(role))
+        optional_marker, verb_prefix, role, index = match.groups()
+        is_optional = optional_marker is not None
+        is_verb_specific = verb_prefix is not None
+        role_type: RoleType = "verb_specific" if is_verb_specific else "thematic"
+        if index is not None:
+            index = index.upper()
 
         # Normalize to lowercase with underscores
-        base_role = role
+        base_role = sys.intern(role)
         if not base_role:
             msg = f"Empty base role after processing: {original}"
             raise ValueError(msg)
@@ -278,8 +297,15 @@ class ParsedFrameElement(BaseSymbol):
         PP type if PP element.
     role_type : RoleType
         Type of role.
+
+    Notes
+    -----
+    Instances are frozen because ``parse_frame_element`` caches and shares
+    them between callers.
     """
 
+    model_config = ConfigDict(frozen=True)
+
     symbol_type: Literal["frame_element"] = "frame_element"
     dataset: Literal["verbnet"] = "verbnet"
     base_role: str = Field(..., min_length=1)
@@ -304,12 +330,14 @@ class ParsedFrameElement(BaseSymbol):
         pp_type: str | None = None
         role_type: RoleType = "thematic"
 
-        if element.startswith("PP."):
-            pp_type = element[3:]
+        # Slice the "PP."/"NP." prefix once and compare it to both
+        prefix = element[:3]
+        if prefix == "PP.":
+            pp_type = sys.intern(element[3:])
             base_role = element
             role_type = "pp"
-        elif element.startswith("NP."):
-            base_role = element[3:]
+        elif prefix == "NP.":
+            base_role = sys.intern(element[3:])
 
         normalized = cls.normalize_string(base_role)
 
@@ -322,6 +350,24 @@ class ParsedFrameElement(BaseSymbol):
         )
 
 
+def _build_known_roles() -> dict[str, ParsedThematicRole]:
+    """Parse every canonical role with each optional and index modifier.
+
+    Returns
+    -------
+    dict[str, ParsedThematicRole]
+        Parsed roles keyed by raw role string.
+    """
+    bases = {extract_role_base(role) for role in THEMATIC_ROLE_TYPES}
+    return {
+        raw: ParsedThematicRole.from_string(raw)
+        for raw in (
+            f"{prefix}{base}{suffix}"
+            for prefix, base, suffix in product(("", "?"), sorted(bases), ("", "_I", "_J"))
+        )
+    }
+
+
 @lru_cache(maxsize=512)
 def parse_verb_class(class_id: str) -> ParsedVerbClass:
     """Parse a VerbNet verb class ID.
@@ -339,7 +385,7 @@ def parse_verb_class(class_id: str) -> ParsedVerbClass:
     return ParsedVerbClass.from_string(class_id)
 
 
-@lru_cache(maxsize=512)
+@lru_cache(maxsize=4096)
 def parse_thematic_role(role: str) -> ParsedThematicRole:
     """Parse a VerbNet thematic role.
 
@@ -352,11 +398,42 @@ def parse_thematic_role(role: str) -> ParsedThematicRole:
     -------
     ParsedThematicRole
         Parsed thematic role.
+
+    Notes
+    -----
+    Canonical VerbNet roles and their optional and indexed forms are parsed
+    once at import time and returned from a lookup table.
     """
+    known = _KNOWN_ROLES.get(role)
+    if known is not None:
+        return known
     return ParsedThematicRole.from_string(role)
 
 
-@lru_cache(maxsize=512)
+def parse_thematic_roles(roles: Iterable[str]) -> list[ParsedThematicRole]:
+    """Parse a sequence of VerbNet thematic roles.
+
+    Parameters
+    ----------
+    roles : Iterable[str]
+        Thematic roles to parse.
+
+    Returns
+    -------
+    list[ParsedThematicRole]
+        Parsed thematic roles in input order.
+
+    Raises
+    ------
+    ValueError
+        If any role has an empty base after removing modifiers.
+    """
+    known_roles = _KNOWN_ROLES
+    parse = parse_thematic_role
+    return [known_roles.get(role) or parse(role) for role in roles]
+
+
+@lru_cache(maxsize=4096)
 def parse_frame_element(element: str) -> ParsedFrameElement:
     """Parse a frame description element.
 
@@ -385,8 +462,20 @@ def extract_role_base(role: str) -> str:
     Returns
     -------
     str
-        Base role name.
+        Base role name, interned so equal bases share one string object.
+
+    Raises
+    ------
+    ValueError
+        If nothing is left once the modifiers are removed.
+
+    Notes
+    -----
+    This strips the modifiers with slices rather than building a full
+    ParsedThematicRole, since callers only need the base.
     """
+    original = role
+
     # Remove optional prefix
     if role.startswith("?"):
         role = role[1:]
@@ -399,7 +488,10 @@ def extract_role_base(role: str) -> str:
     if role.endswith(("_I", "_J", "_i", "_j", "_k")):
         role = role[:-2]
 
-    return role
+    if not role:
+        msg = f"Empty base role after processing: {original}"
+        raise ValueError(msg)
+    return sys.intern(role)
 
 
 @lru_cache(maxsize=1024)
@@ -415,9 +507,42 @@ def normalize_role_for_matching(role: str) -> str:
     -------
     str
         Normalized role.
+
+    Raises
+    ------
+    ValueError
+        If the role normalizes to an empty string.
     """
-    base = extract_role_base(role)
-    return BaseSymbol.normalize_string(base)
+    return BaseSymbol.normalize_string(extract_role_base(role))
+
+
+@lru_cache(maxsize=4096)
+def classify_role(role: str) -> int:
+    """Compute the property flags of a role or frame element.
+
+    Parameters
+    ----------
+    role : str
+        Thematic role or frame element string.
+
+    Returns
+    -------
+    int
+        Bitwise OR of ROLE_OPTIONAL, ROLE_INDEXED, ROLE_VERB_SPECIFIC and
+        ROLE_PP for the properties that apply.
+    """
+    flags = 0
+    if role.startswith("?"):
+        flags |= ROLE_OPTIONAL
+        if role.startswith("V_", 1):
+            flags |= ROLE_VERB_SPECIFIC
+    elif role.startswith("V_"):
+        flags |= ROLE_VERB_SPECIFIC
+    elif role.startswith("PP."):
+        flags |= ROLE_PP
+    if role.endswith(("_I", "_J", "_i", "_j", "_k")):
+        flags |= ROLE_INDEXED
+    return flags
 
 
 @lru_cache(maxsize=1024)
@@ -434,7 +559,7 @@ def is_optional_role(role: str) -> bool:
     bool
         True if optional.
     """
-    return role.startswith("?")
+    return bool(classify_role(role) & ROLE_OPTIONAL)
 
 
 @lru_cache(maxsize=1024)
@@ -451,8 +576,7 @@ def is_indexed_role(role: str) -> bool:
     bool
         True if indexed.
     """
-    # Check both uppercase and lowercase variants
-    return role.endswith(("_I", "_J", "_i", "_j", "_k"))
+    return bool(classify_role(role) & ROLE_INDEXED)
 
 
 @lru_cache(maxsize=1024)
@@ -469,10 +593,7 @@ def is_verb_specific_role(role: str) -> bool:
     bool
         True if verb-specific.
     """
-    # Remove optional prefix first
-    if role.startswith("?"):
-        role = role[1:]
-    return role.startswith("V_")
+    return bool(classify_role(role) & ROLE_VERB_SPECIFIC)
 
 
 @lru_cache(maxsize=1024)
@@ -489,7 +610,7 @@ def is_pp_element(element: str) -> bool:
     bool
         True if PP element.
     """
-    return element.startswith("PP.")
+    return bool(classify_role(element) & ROLE_PP)
 
 
 def filter_roles_by_properties(
@@ -519,28 +640,29 @@ def filter_roles_by_properties(
     list[ThematicRole]
         Filtered roles.
     """
-    filtered = roles
-
-    if optional is not None:
-        if optional:
-            filtered = [r for r in filtered if is_optional_role(r.type)]
-        else:
-            filtered = [r for r in filtered if not is_optional_role(r.type)]
-
-    if indexed is not None:
-        if indexed:
-            filtered = [r for r in filtered if is_indexed_role(r.type)]
-        else:
-            filtered = [r for r in filtered if not is_indexed_role(r.type)]
+    # Collect the flags the caller constrains and the values they must take
+    mask = 0
+    expected = 0
+    for flag, wanted in (
+        (ROLE_OPTIONAL, optional),
+        (ROLE_INDEXED, indexed),
+        (ROLE_VERB_SPECIFIC, verb_specific),
+    ):
+        if wanted is not None:
+            mask |= flag
+            if wanted:
+                expected |= flag
 
-    if verb_specific is not None:
-        if verb_specific:
-            filtered = [r for r in filtered if is_verb_specific_role(r.type)]
-        else:
-            filtered = [r for r in filtered if not is_verb_specific_role(r.type)]
+    filtered = roles
+    if mask:
+        filtered = [r for r in filtered if classify_role(r.type) & mask == expected]
 
     if base_role is not None:
         normalized_base = BaseSymbol.normalize_string(base_role)
         filtered = [r for r in filtered if extract_role_base(r.type) == normalized_base]
 
     return filtered
+
+
+# Parsed forms of the closed set of canonical roles, e.g. "Agent", "?Theme_I"
+_KNOWN_ROLES = _build_known_roles()
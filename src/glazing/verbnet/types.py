@@ -42,6 +42,20 @@ DescriptionNumber : type[str]
     Frame description number (e.g., "0.2", "2.5.1").
 PrepositionValue : type[str]
     Preposition values, space or pipe separated.
+THEMATIC_ROLE_TYPES : frozenset[str]
+    Members of ThematicRoleType, for membership checks.
+THEMATIC_ROLE_VALUES : frozenset[str]
+    Members of ThematicRoleValue, for membership checks.
+SELECTIONAL_RESTRICTION_TYPES : frozenset[str]
+    Members of SelectionalRestrictionType, for membership checks.
+SYNTACTIC_RESTRICTION_TYPES : frozenset[str]
+    Members of SyntacticRestrictionType, for membership checks.
+PREDICATE_TYPES : frozenset[str]
+    Members of PredicateType, for membership checks.
+FRAME_DESCRIPTION_ELEMENTS : frozenset[str]
+    Members of FrameDescriptionElement, for membership checks.
+SECONDARY_PATTERNS : frozenset[str]
+    Members of SecondaryPattern, for membership checks.
 VERBNET_CLASS_PATTERN : str
     Regex pattern for VerbNet class ID validation.
 VERBNET_KEY_PATTERN : str
@@ -58,7 +72,7 @@ Examples
 >>> predicate: PredicateType = "motion"
 """
 
-from typing import Literal
+from typing import Literal, get_args
 
 # Regex patterns for VerbNet identifiers
 VERBNET_CLASS_PATTERN = r"^[a-z_]+-[0-9]+(?:\.[0-9]+)*(?:-[0-9]+)*$"  # e.g., "give-13.1-1"
@@ -124,6 +138,7 @@ type ThematicRoleType = Literal[
     "Trajectory",
     "Value",
 ]
+THEMATIC_ROLE_TYPES: frozenset[str] = frozenset(get_args(ThematicRoleType.__value__))
 
 # Thematic role values as they appear in semantic predicates
 # Includes standard roles, indexed variants, question-marked, and special forms
@@ -230,6 +245,7 @@ type ThematicRoleValue = Literal[
     "e1",
     "e2",
 ]
+THEMATIC_ROLE_VALUES: frozenset[str] = frozenset(get_args(ThematicRoleValue.__value__))
 
 # Selectional restriction types (42 types)
 type SelectionalRestrictionType = Literal[
@@ -276,6 +292,9 @@ type SelectionalRestrictionType = Literal[
     "vehicle",
     "vehicle_part",
 ]
+SELECTIONAL_RESTRICTION_TYPES: frozenset[str] = frozenset(
+    get_args(SelectionalRestrictionType.__value__)
+)
 
 # Syntactic restriction types (45 types)
 type SyntacticRestrictionType = Literal[
@@ -315,6 +334,9 @@ type SyntacticRestrictionType = Literal[
     "what_inf",
     "wheth_inf",
 ]
+SYNTACTIC_RESTRICTION_TYPES: frozenset[str] = frozenset(
+    get_args(SyntacticRestrictionType.__value__)
+)
 
 # Restriction value (polarity)
 type RestrictionValue = Literal["+", "-"]
@@ -513,6 +535,7 @@ type PredicateType = Literal[
     "search",
     "yield",
 ]
+PREDICATE_TYPES: frozenset[str] = frozenset(get_args(PredicateType.__value__))
 
 # Event structure types
 type EventType = Literal["process", "state", "transition", "achievement"]
@@ -642,6 +665,7 @@ type FrameDescriptionElement = Literal[
     "There",
     "there",
 ]
+FRAME_DESCRIPTION_ELEMENTS: frozenset[str] = frozenset(get_args(FrameDescriptionElement.__value__))
 
 # Secondary pattern descriptors
 type SecondaryPattern = Literal[
@@ -706,6 +730,7 @@ type SecondaryPattern = Literal[
     "Double Object; Dative",
     "",  # Empty string is valid
 ]
+SECONDARY_PATTERNS: frozenset[str] = frozenset(get_args(SecondaryPattern.__value__))
 
 # VerbNet-GL (Generative Lexicon) specific types
 
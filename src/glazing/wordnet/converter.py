@@ -36,26 +36,80 @@ Examples
 
 from __future__ import annotations
 
+import mmap
+import multiprocessing
+import os
 import re
+import shutil
+import string
+import sys
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import ClassVar, cast
+from typing import TYPE_CHECKING, ClassVar, TextIO, cast
 
 from glazing.wordnet.models import (
     ExceptionEntry,
     IndexEntry,
-    Pointer,
     Sense,
     Synset,
-    VerbFrame,
-    Word,
 )
 from glazing.wordnet.types import (
     LexFileName,
     PointerSymbol,
-    VerbFrameNumber,
     WordNetPOS,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Iterator
+
+# Copy buffer for merging JSON Lines shards
+READ_BUFFER_SIZE = 1 << 20
+
+# Serialized synsets buffered per writelines call
+WRITE_BATCH_SIZE = 10_000
+
+# Data files converted to JSON Lines, in output order
+DATA_FILE_POS: tuple[tuple[str, WordNetPOS], ...] = (
+    ("noun", "n"),
+    ("verb", "v"),
+    ("adj", "a"),
+    ("adv", "r"),
+)
+
+# Upper bound on worker processes, one per data file
+MAX_PARSE_WORKERS = len(DATA_FILE_POS)
+
+# Workers are spawned rather than forked; forking a threaded parent can deadlock
+_SPAWN_CONTEXT = multiprocessing.get_context("spawn")
+
+# Synset type by sense key ss_type digit (1-5); index 0 is unused
+SS_TYPE_TO_POS: tuple[WordNetPOS, ...] = ("n", "n", "v", "a", "r", "s")
+
+# Characters allowed in exception file word forms, and as their first character
+WORD_FORM_CHARS = frozenset(string.ascii_letters + string.digits + "_'-")
+WORD_FORM_INITIALS = frozenset(string.ascii_letters)
+
+# Sense index line: sense key (lemma, ss_type, lex_filenum, lex_id, head_word,
+# head_id), then synset_offset, sense_number and tag_cnt
+SENSE_LINE_PATTERN = re.compile(
+    r"(([^\s%]+)%(\d+):(\d+):(\d+):([^\s:]*):(\d*))\s+(\d+)\s+(\d+)\s+(\d+)"
+)
+
+# Length of the fixed-width data line prefix "offset lex_filenum ss_type w_cnt "
+DATA_PREFIX_LEN = 17
+
+# Scanned data line: offset, lex_filenum, ss_type, words, pointers, frames, gloss
+type DataLineFields = tuple[
+    str,
+    int,
+    str,
+    list[tuple[str, int]],
+    list[tuple[str, str, str, int, int]],
+    list[tuple[int, int]] | None,
+    str,
+]
+
 
 class WordNetConverter:
     """Parse WordNet database files into structured models.
@@ -65,8 +119,12 @@ class WordNetConverter:
 
     Methods
     -------
+    iter_data_file(filepath, pos)
+        Lazily parse WordNet data file into Synset models.
     parse_data_file(filepath, pos)
         Parse WordNet data file into list of Synset models.
+    iter_index_file(filepath, pos)
+        Lazily parse WordNet index file into IndexEntry models.
     parse_index_file(filepath, pos)
         Parse WordNet index file into list of IndexEntry models.
     parse_sense_index(filepath)
@@ -77,54 +135,54 @@ class WordNetConverter:
         Convert entire WordNet database to JSON Lines.
     """
 
-    # Mapping from lexical file numbers to names
-    LEX_FILE_NAMES: ClassVar[dict[int, LexFileName]] = {
-        0: "adj.all",
-        1: "adj.pert",
-        2: "adj.ppl",
-        3: "adv.all",
-        4: "noun.Tops",
-        5: "noun.act",
-        6: "noun.animal",
-        7: "noun.artifact",
-        8: "noun.attribute",
-        9: "noun.body",
-        10: "noun.cognition",
-        11: "noun.communication",
-        12: "noun.event",
-        13: "noun.feeling",
-        14: "noun.food",
-        15: "noun.group",
-        16: "noun.location",
-        17: "noun.motive",
-        18: "noun.object",
-        19: "noun.person",
-        20: "noun.phenomenon",
-        21: "noun.plant",
-        22: "noun.possession",
-        23: "noun.process",
-        24: "noun.quantity",
-        25: "noun.relation",
-        26: "noun.shape",
-        27: "noun.state",
-        28: "noun.substance",
-        29: "noun.time",
-        30: "verb.body",
-        31: "verb.change",
-        32: "verb.cognition",
-        33: "verb.communication",
-        34: "verb.competition",
-        35: "verb.consumption",
-        36: "verb.contact",
-        37: "verb.creation",
-        38: "verb.emotion",
-        39: "verb.motion",
-        40: "verb.perception",
-        41: "verb.possession",
-        42: "verb.social",
-        43: "verb.stative",
-        44: "verb.weather",
-    }
+    # Lexical file names indexed by lexical file number
+    LEX_FILE_NAMES: ClassVar[tuple[LexFileName, ...]] = (
+        "adj.all",
+        "adj.pert",
+        "adj.ppl",
+        "adv.all",
+        "noun.Tops",
+        "noun.act",
+        "noun.animal",
+        "noun.artifact",
+        "noun.attribute",
+        "noun.body",
+        "noun.cognition",
+        "noun.communication",
+        "noun.event",
+        "noun.feeling",
+        "noun.food",
+        "noun.group",
+        "noun.location",
+        "noun.motive",
+        "noun.object",
+        "noun.person",
+        "noun.phenomenon",
+        "noun.plant",
+        "noun.possession",
+        "noun.process",
+        "noun.quantity",
+        "noun.relation",
+        "noun.shape",
+        "noun.state",
+        "noun.substance",
+        "noun.time",
+        "verb.body",
+        "verb.change",
+        "verb.cognition",
+        "verb.communication",
+        "verb.competition",
+        "verb.consumption",
+        "verb.contact",
+        "verb.creation",
+        "verb.emotion",
+        "verb.motion",
+        "verb.perception",
+        "verb.possession",
+        "verb.social",
+        "verb.stative",
+        "verb.weather",
+    )
 
     def parse_data_file(self, filepath: Path | str, pos: WordNetPOS) -> list[Synset]:
         """Parse WordNet data file into list of Synset models.
@@ -148,33 +206,63 @@ class WordNetConverter:
         ValueError
             If line format is invalid.
         """
+        return list(self.iter_data_file(filepath, pos))
+
+    def iter_data_file(self, filepath: Path | str, pos: WordNetPOS) -> Iterator[Synset]:
+        """Lazily parse WordNet data file into Synset models.
+
+        Parameters
+        ----------
+        filepath : Path | str
+            Path to WordNet data file (e.g., data.noun).
+        pos : WordNetPOS
+            Part of speech for validation.
+
+        Returns
+        -------
+        Iterator[Synset]
+            Synsets in file order, parsed one line at a time.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the data file does not exist.
+        """
         filepath = Path(filepath)
         if not filepath.exists():
             msg = f"WordNet data file not found: {filepath}"
             raise FileNotFoundError(msg)
 
-        synsets = []
-
-        with filepath.open("r", encoding="utf-8") as f:
-            for line_num, line_raw in enumerate(f, 1):
-                # Skip license header (lines starting with two spaces)
-                if line_raw.startswith("  "):
-                    continue
+        return self._iter_data_lines(filepath, pos)
 
-                line = line_raw.strip()
-                if not line:
-                    continue
+    def _iter_data_lines(self, filepath: Path, pos: WordNetPOS) -> Iterator[Synset]:
+        """Yield synsets from an existing data file.
 
-                try:
-                    synset = self._parse_data_line(line)
-                    if synset and synset.ss_type == pos:
-                        synsets.append(synset)
-                except ValueError as e:
-                    # Log parsing error but continue
-                    print(f"Error parsing line {line_num} in {filepath}: {e}")
-                    continue
+        Parameters
+        ----------
+        filepath : Path
+            Path to WordNet data file.
+        pos : WordNetPOS
+            Part of speech for validation.
 
-        return synsets
+        Yields
+        ------
+        Synset
+            Parsed synsets matching ``pos``.
+        """
+        for line_num, line_raw in _iter_mapped_lines(filepath):
+            line = line_raw.strip()
+            if not line:
+                continue
+
+            try:
+                synset = self._parse_data_line(line)
+                if synset and synset.ss_type == pos:
+                    yield synset
+            except ValueError as e:
+                # Log parsing error but continue
+                print(f"Error parsing line {line_num} in {filepath}: {e}")
+                continue
 
     def parse_index_file(self, filepath: Path | str, pos: WordNetPOS) -> list[IndexEntry]:
         """Parse WordNet index file into list of IndexEntry models.
@@ -198,32 +286,62 @@ class WordNetConverter:
         ValueError
             If line format is invalid.
         """
+        return list(self.iter_index_file(filepath, pos))
+
+    def iter_index_file(self, filepath: Path | str, pos: WordNetPOS) -> Iterator[IndexEntry]:
+        """Lazily parse WordNet index file into IndexEntry models.
+
+        Parameters
+        ----------
+        filepath : Path | str
+            Path to WordNet index file (e.g., index.noun).
+        pos : WordNetPOS
+            Part of speech for validation.
+
+        Returns
+        -------
+        Iterator[IndexEntry]
+            Index entries in file order, parsed one line at a time.
+
+        Raises
+        ------
+        FileNotFoundError
+            If the index file does not exist.
+        """
         filepath = Path(filepath)
         if not filepath.exists():
             msg = f"WordNet index file not found: {filepath}"
             raise FileNotFoundError(msg)
 
-        entries = []
+        return self._iter_index_lines(filepath, pos)
 
-        with filepath.open("r", encoding="utf-8") as f:
-            for line_num, line_raw in enumerate(f, 1):
-                # Skip license header (lines starting with two spaces)
-                if line_raw.startswith("  "):
-                    continue
+    def _iter_index_lines(self, filepath: Path, pos: WordNetPOS) -> Iterator[IndexEntry]:
+        """Yield index entries from an existing index file.
 
-                line = line_raw.strip()
-                if not line:
-                    continue
-
-                try:
-                    entry = self._parse_index_line(line, pos)
-                    if entry:
-                        entries.append(entry)
-                except ValueError as e:
-                    print(f"Error parsing line {line_num} in {filepath}: {e}")
-                    continue
+        Parameters
+        ----------
+        filepath : Path
+            Path to WordNet index file.
+        pos : WordNetPOS
+            Part of speech for validation.
 
-        return entries
+        Yields
+        ------
+        IndexEntry
+            Parsed index entries matching ``pos``.
+        """
+        for line_num, line_raw in _iter_mapped_lines(filepath):
+            line = line_raw.strip()
+            if not line:
+                continue
+
+            try:
+                entry = self._parse_index_line(line, pos)
+                if entry:
+                    yield entry
+            except ValueError as e:
+                print(f"Error parsing line {line_num} in {filepath}: {e}")
+                continue
 
     def parse_sense_index(self, filepath: Path | str) -> list[Sense]:
         """Parse WordNet sense index file.
@@ -250,23 +368,18 @@ class WordNetConverter:
 
         senses = []
 
-        with filepath.open("r", encoding="utf-8") as f:
-            for line_num, line_raw in enumerate(f, 1):
-                # Skip license header
-                if line_raw.startswith("  "):
-                    continue
+        for line_num, line_raw in _iter_mapped_lines(filepath):
+            line = line_raw.strip()
+            if not line:
+                continue
 
-                line = line_raw.strip()
-                if not line:
-                    continue
-
-                try:
-                    sense = self._parse_sense_line(line)
-                    if sense:
-                        senses.append(sense)
-                except ValueError as e:
-                    print(f"Error parsing line {line_num} in {filepath}: {e}")
-                    continue
+            try:
+                sense = self._parse_sense_line(line)
+                if sense:
+                    senses.append(sense)
+            except ValueError as e:
+                print(f"Error parsing line {line_num} in {filepath}: {e}")
+                continue
 
         return senses
 
@@ -295,28 +408,23 @@ class WordNetConverter:
 
         entries = []
 
-        with filepath.open("r", encoding="utf-8") as f:
-            for line_num, line_raw in enumerate(f, 1):
-                # Skip license header
-                if line_raw.startswith("  "):
-                    continue
-
-                line = line_raw.strip()
-                if not line:
-                    continue
-
-                try:
-                    entry = self._parse_exception_line(line)
-                    if entry:
-                        entries.append(entry)
-                except ValueError as e:
-                    print(f"Error parsing line {line_num} in {filepath}: {e}")
-                    continue
+        # Blank lines split to nothing and are dropped by _parse_exception_line
+        for line_num, line in _iter_mapped_lines(filepath):
+            try:
+                entry = self._parse_exception_line(line)
+                if entry:
+                    entries.append(entry)
+            except ValueError as e:
+                print(f"Error parsing line {line_num} in {filepath}: {e}")
+                continue
 
         return entries
 
     def convert_wordnet_database(
-        self, wordnet_dir: Path | str, output_file: Path | str
+        self,
+        wordnet_dir: Path | str,
+        output_file: Path | str,
+        max_workers: int | None = 1,
     ) -> dict[str, int]:
         """Convert entire WordNet database to JSON Lines.
 
@@ -326,6 +434,12 @@ class WordNetConverter:
             Directory containing WordNet database files.
         output_file : Path | str
             Output JSON Lines file path.
+        max_workers : int | None, default=1
+            Number of worker processes parsing data files. The default parses
+            serially in the current process; ``None`` uses one process per
+            data file, up to ``MAX_PARSE_WORKERS``. Worker processes are
+            spawned, so scripts that opt in need an
+            ``if __name__ == "__main__":`` guard.
 
         Returns
         -------
@@ -336,6 +450,12 @@ class WordNetConverter:
         ------
         FileNotFoundError
             If WordNet directory does not exist.
+
+        Notes
+        -----
+        Each data file is parsed into its own shard file; shards are then
+        concatenated in noun, verb, adj, adv order, so the output does not
+        depend on the number of workers.
         """
         wordnet_dir = Path(wordnet_dir)
         output_file = Path(output_file)
@@ -347,31 +467,86 @@ class WordNetConverter:
         output_file.parent.mkdir(parents=True, exist_ok=True)
 
         counts = {}
-        all_synsets = []
-
-        # Process data files
-        pos_mappings: list[tuple[str, WordNetPOS]] = [
-            ("noun", "n"),
-            ("verb", "v"),
-            ("adj", "a"),
-            ("adv", "r"),
+        total = 0
+
+        # Process data files, streaming synsets straight to the output file
+        jobs = [
+            (pos_name, wordnet_dir / f"data.{pos_name}", pos_code)
+            for pos_name, pos_code in DATA_FILE_POS
+            if (wordnet_dir / f"data.{pos_name}").exists()
         ]
-        for pos_name, pos_code in pos_mappings:
-            data_file = wordnet_dir / f"data.{pos_name}"
-            if data_file.exists():
-                synsets = self.parse_data_file(data_file, pos_code)
-                all_synsets.extend(synsets)
-                counts[f"synsets_{pos_name}"] = len(synsets)
-
-        # Write all synsets to single output file
-        with output_file.open("w", encoding="utf-8") as f:
-            for synset in all_synsets:
-                f.write(f"{synset.model_dump_json()}\n")
+        if max_workers is None:
+            max_workers = min(len(jobs), MAX_PARSE_WORKERS)
 
-        counts["total_synsets"] = len(all_synsets)
+        # Start reading every data file before parsing the first one
+        _prefetch_files([data_file for _, data_file, _ in jobs])
+
+        with output_file.open("w", encoding="utf-8") as f:
+            if max_workers <= 1 or len(jobs) <= 1:
+                for pos_name, data_file, pos_code in jobs:
+                    count = self._write_synsets(data_file, pos_code, f)
+                    counts[f"synsets_{pos_name}"] = count
+                    total += count
+            else:
+                with (
+                    tempfile.TemporaryDirectory(dir=output_file.parent) as shard_dir,
+                    ProcessPoolExecutor(
+                        max_workers=max_workers, mp_context=_SPAWN_CONTEXT
+                    ) as executor,
+                ):
+                    futures = []
+                    for pos_name, data_file, pos_code in jobs:
+                        shard_file = Path(shard_dir) / f"{pos_name}.jsonl"
+                        future = executor.submit(
+                            _convert_data_shard, data_file, pos_code, shard_file
+                        )
+                        futures.append((pos_name, shard_file, future))
+
+                    # Merge shards in order as soon as each one is ready
+                    for pos_name, shard_file, future in futures:
+                        count = future.result()
+                        with shard_file.open("r", encoding="utf-8") as shard:
+                            shutil.copyfileobj(shard, f, READ_BUFFER_SIZE)
+                        counts[f"synsets_{pos_name}"] = count
+                        total += count
+
+        counts["total_synsets"] = total
 
         return counts
 
+    def _write_synsets(self, data_file: Path, pos: WordNetPOS, output: TextIO) -> int:
+        """Write synsets from a data file to an open JSON Lines stream.
+
+        Parameters
+        ----------
+        data_file : Path
+            Path to WordNet data file.
+        pos : WordNetPOS
+            Part of speech of the data file.
+        output : TextIO
+            Text stream receiving one JSON object per line.
+
+        Returns
+        -------
+        int
+            Number of synsets written.
+
+        Notes
+        -----
+        Lines are serialized by pydantic-core and written in batches of
+        ``WRITE_BATCH_SIZE`` with a single ``writelines`` call.
+        """
+        count = 0
+        batch: list[str] = []
+        for synset in self.iter_data_file(data_file, pos):
+            batch.append(f"{synset.model_dump_json()}\n")
+            if len(batch) >= WRITE_BATCH_SIZE:
+                output.writelines(batch)
+                count += len(batch)
+                batch.clear()
+        output.writelines(batch)
+        return count + len(batch)
+
     def _parse_data_line(self, line: str) -> Synset | None:
         """Parse a line from WordNet data file.
 
@@ -387,115 +562,57 @@ class WordNetConverter:
         -------
         Synset | None
             Parsed synset or None if invalid.
+
+        Notes
+        -----
+        Tokenization is delegated to ``_scan_data_line``, which returns
+        plain tuples. The synset is then validated from a single nested
+        dict, so pydantic-core builds the words, pointers and frames in one
+        call rather than one Python-level constructor call per model.
         """
-        # Find gloss separator
-        gloss_idx = line.find(" | ")
-        if gloss_idx == -1:
+        fields = _scan_data_line(line)
+        if fields is None:
             return None
 
-        data_part = line[:gloss_idx]
-        gloss = line[gloss_idx + 3 :].strip()
+        offset, lex_filenum, ss_type, word_fields, pointer_fields, frame_fields, gloss = fields
 
-        parts = data_part.split()
-        if len(parts) < 6:
-            return None
+        # Get lexical file name
+        lex_filename = (
+            self.LEX_FILE_NAMES[lex_filenum]
+            if 0 <= lex_filenum < len(self.LEX_FILE_NAMES)
+            else "noun.Tops"
+        )
 
         try:
-            # Parse basic fields
-            offset = parts[0].zfill(8)  # Ensure 8 digits
-            lex_filenum = int(parts[1])
-            ss_type = parts[2]
-            w_cnt = int(parts[3], 16)  # Hex count
-
-            # Parse words
-            words = []
-            idx = 4
-            for _ in range(w_cnt):
-                if idx + 1 >= len(parts):
-                    break
-                lemma = parts[idx]
-                lex_id = int(parts[idx + 1], 16)
-                words.append(Word(lemma=lemma, lex_id=lex_id))
-                idx += 2
-
-            # Parse pointers
-            if idx >= len(parts):
-                return None
-
-            p_cnt = int(parts[idx])
-            idx += 1
-
-            pointers = []
-            for _ in range(p_cnt):
-                if idx + 3 >= len(parts):
-                    break
-
-                symbol = parts[idx]
-                target_offset = parts[idx + 1].zfill(8)
-                target_pos = parts[idx + 2]
-                source_target = parts[idx + 3]
-
-                # Parse source/target word numbers
-                if len(source_target) == 4:
-                    source = int(source_target[:2], 16)
-                    target = int(source_target[2:], 16)
-                else:
-                    source = 0
-                    target = 0
-
-                pointer = Pointer(
-                    symbol=cast(PointerSymbol, symbol),
-                    offset=target_offset,
-                    pos=cast(WordNetPOS, target_pos),
-                    source=source,
-                    target=target,
-                )
-                pointers.append(pointer)
-                idx += 4
-
-            # Parse verb frames if present (for verbs only)
-            frames = None
-            if ss_type == "v" and idx < len(parts):
-                frames = []
-
-                # Parse frames until no more "+" markers
-                while idx + 2 < len(parts) and parts[idx] == "+":
-                    frame_marker = parts[idx]  # "+"
-                    frame_info = parts[idx + 1]  # Frame number
-                    word_info = parts[idx + 2]  # Word index
-
-                    if frame_marker == "+":
-                        # Parse frame number
-                        frame_num = int(frame_info)
-
-                        # Parse word index
-                        word_idx = int(word_info, 16)
-                        word_indices = [word_idx]
-
-                        if 1 <= frame_num <= 35:
-                            frame = VerbFrame(
-                                frame_number=cast(VerbFrameNumber, frame_num),
-                                word_indices=word_indices,
-                            )
-                            frames.append(frame)
-
-                    idx += 3
-
-            # Get lexical file name
-            lex_filename = self.LEX_FILE_NAMES.get(lex_filenum, "noun.Tops")
-
-            return Synset(
-                offset=offset,
-                lex_filenum=lex_filenum,
-                lex_filename=lex_filename,
-                ss_type=cast(WordNetPOS, ss_type),
-                words=words,
-                pointers=pointers,
-                frames=frames,
-                gloss=gloss,
+            # One validator call builds the synset and its nested models
+            return Synset.model_validate(
+                {
+                    "offset": offset,
+                    "lex_filenum": lex_filenum,
+                    "lex_filename": lex_filename,
+                    "ss_type": ss_type,
+                    "words": [{"lemma": lemma, "lex_id": lex_id} for lemma, lex_id in word_fields],
+                    "pointers": [
+                        {
+                            "symbol": symbol,
+                            "offset": target_offset,
+                            "pos": target_pos,
+                            "source": source,
+                            "target": target,
+                        }
+                        for symbol, target_offset, target_pos, source, target in pointer_fields
+                    ],
+                    "frames": None
+                    if frame_fields is None
+                    else [
+                        {"frame_number": frame_num, "word_indices": [word_idx]}
+                        for frame_num, word_idx in frame_fields
+                    ],
+                    "gloss": gloss,
+                }
             )
 
-        except (ValueError, IndexError):
+        except ValueError:
             return None
 
     def _parse_index_line(self, line: str, pos: WordNetPOS) -> IndexEntry | None:
@@ -521,7 +638,7 @@ class WordNetConverter:
             return None
 
         try:
-            lemma = parts[0]
+            lemma = sys.intern(parts[0])
             file_pos = parts[1]
 
             if file_pos != pos:
@@ -530,13 +647,7 @@ class WordNetConverter:
             synset_cnt = int(parts[2])
             p_cnt = int(parts[3])
 
-            # Extract pointer symbols
-            ptr_symbols = []
-            for i in range(4, 4 + p_cnt):
-                if i < len(parts):
-                    ptr_symbols.append(parts[i])
-
-            # Get sense and tagsense counts
+            # Get sense and tagsense counts after the pointer symbols
             idx = 4 + p_cnt
             if idx + 1 >= len(parts):
                 return None
@@ -544,21 +655,17 @@ class WordNetConverter:
             sense_cnt = int(parts[idx])
             tagsense_cnt = int(parts[idx + 1])
 
-            # Extract synset offsets
-            synset_offsets = []
-            for i in range(idx + 2, len(parts)):
-                offset = parts[i].zfill(8)
-                synset_offsets.append(offset)
-
             return IndexEntry(
                 lemma=lemma,
                 pos=pos,
                 synset_cnt=synset_cnt,
                 p_cnt=p_cnt,
-                ptr_symbols=[cast(PointerSymbol, s) for s in ptr_symbols],
+                ptr_symbols=cast(
+                    frozenset[PointerSymbol], frozenset(map(sys.intern, parts[4:idx]))
+                ),
                 sense_cnt=sense_cnt,
                 tagsense_cnt=tagsense_cnt,
-                synset_offsets=synset_offsets,
+                synset_offsets=[sys.intern(offset.zfill(8)) for offset in parts[idx + 2 :]],
             )
 
         except (ValueError, IndexError):
@@ -567,7 +674,8 @@ class WordNetConverter:
     def _parse_sense_line(self, line: str) -> Sense | None:
         """Parse a line from sense index file.
 
-        Format: sense_key synset_offset sense_number tag_cnt
+        Format: lemma%ss_type:lex_filenum:lex_id:head_word:head_id synset_offset
+        sense_number tag_cnt
 
         Parameters
         ----------
@@ -579,52 +687,49 @@ class WordNetConverter:
         Sense | None
             Parsed sense or None if invalid.
         """
-        parts = line.split()
-        if len(parts) != 4:
+        match = SENSE_LINE_PATTERN.fullmatch(line)
+        if match is None:
             return None
 
-        try:
-            sense_key = parts[0]
-            synset_offset = parts[1].zfill(8)
-            sense_number = int(parts[2])
-            tag_count = int(parts[3])
-
-            # Parse sense key components
-            key_parts = sense_key.split("%")
-            if len(key_parts) != 2:
-                return None
+        (
+            sense_key,
+            lemma,
+            ss_type_digits,
+            lex_filenum_digits,
+            lex_id_digits,
+            head_word_field,
+            head_id_digits,
+            offset_digits,
+            sense_number_digits,
+            tag_count_digits,
+        ) = match.groups()
 
-            lemma = key_parts[0]
-            rest = key_parts[1].split(":")
-            if len(rest) < 3:
-                return None
-
-            ss_type_num = int(rest[0])
-            lex_filenum = int(rest[1])
-            lex_id = int(rest[2])
+        try:
+            ss_type_num = int(ss_type_digits)
+            lex_filenum = int(lex_filenum_digits)
+            lex_id = int(lex_id_digits)
 
-            # Extract head word info for satellites
-            head_word = rest[3] if len(rest) > 3 and rest[3] else None
-            head_id = int(rest[4]) if len(rest) > 4 and rest[4] else None
+            # Head word info is only present for satellites
+            head_word = head_word_field or None
+            head_id = int(head_id_digits) if head_id_digits else None
 
-            # Map ss_type number to POS
-            pos_map = {1: "n", 2: "v", 3: "a", 4: "r", 5: "s"}
-            ss_type = pos_map.get(ss_type_num, "n")
+            # Map ss_type number to POS, defaulting to noun
+            ss_type = SS_TYPE_TO_POS[ss_type_num] if 0 < ss_type_num < len(SS_TYPE_TO_POS) else "n"
 
             return Sense(
                 sense_key=sense_key,
-                lemma=lemma,
-                ss_type=cast(WordNetPOS, ss_type),
+                lemma=sys.intern(lemma),
+                ss_type=ss_type,
                 lex_filenum=lex_filenum,
                 lex_id=lex_id,
                 head_word=head_word,
                 head_id=head_id,
-                synset_offset=synset_offset,
-                sense_number=sense_number,
-                tag_count=tag_count,
+                synset_offset=sys.intern(offset_digits.zfill(8)),
+                sense_number=int(sense_number_digits),
+                tag_count=int(tag_count_digits),
             )
 
-        except (ValueError, IndexError):
+        except ValueError:
             return None
 
     def _parse_exception_line(self, line: str) -> ExceptionEntry | None:
@@ -646,18 +751,14 @@ class WordNetConverter:
         if len(parts) < 2:
             return None
 
-        inflected_form = parts[0]
-        base_forms = parts[1:]
+        inflected_form, *base_forms = parts
 
         # Validate word forms
-        if not self._is_valid_word_form(inflected_form):
+        is_valid = self._is_valid_word_form
+        if not is_valid(inflected_form):
             return None
 
-        valid_base_forms = []
-        for form in base_forms:
-            if self._is_valid_word_form(form):
-                valid_base_forms.append(form)
-
+        valid_base_forms = [form for form in base_forms if is_valid(form)]
         if not valid_base_forms:
             return None
 
@@ -679,11 +780,187 @@ class WordNetConverter:
         bool
             True if valid word form.
         """
-        if not word:
-            return False
+        # Start with a letter; allow letters, digits, underscores, hyphens, apostrophes
+        return bool(word) and word[0] in WORD_FORM_INITIALS and WORD_FORM_CHARS.issuperset(word)
+
+
+def _prefetch_files(paths: list[Path]) -> None:
+    """Ask the kernel to start reading files into the page cache.
+
+    Parameters
+    ----------
+    paths : list[Path]
+        Files that are about to be read.
+
+    Notes
+    -----
+    Issues ``posix_fadvise(POSIX_FADV_WILLNEED)`` for each file so their
+    reads overlap instead of each one waiting on the previous file. This
+    is a no-op on platforms without ``posix_fadvise``.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    for path in paths:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+def _iter_mapped_lines(filepath: Path) -> Iterator[tuple[int, str]]:
+    """Yield numbered lines following a file's license header.
+
+    Parameters
+    ----------
+    filepath : Path
+        Path to an existing WordNet database file.
+
+    Yields
+    ------
+    tuple[int, str]
+        One-based line number and decoded line, including its newline.
+
+    Notes
+    -----
+    The file is read through a memory map, so pages come straight from the
+    page cache and only the current line is decoded. The license header
+    (leading lines starting with two spaces) is consumed once up front,
+    leaving callers' loops free of a per-line header check.
+    """
+    with filepath.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Skip license header (lines starting with two spaces)
+            header_lines = 0
+            position = 0
+            while mm[position : position + 2] == b"  ":
+                position = mm.find(b"\n", position) + 1
+                if position == 0:
+                    return
+                header_lines += 1
+
+            mm.seek(position)
+            for line_num, raw in enumerate(iter(mm.readline, b""), header_lines + 1):
+                yield line_num, raw.decode("utf-8")
+
+
+def _scan_data_line(line: str) -> DataLineFields | None:
+    """Tokenize a data file line into plain Python values.
+
+    Parameters
+    ----------
+    line : str
+        Data file line to scan, stripped of surrounding whitespace.
+
+    Returns
+    -------
+    DataLineFields | None
+        Offset, lexical file number, synset type, ``(lemma, lex_id)`` word
+        pairs, ``(symbol, offset, pos, source, target)`` pointer tuples,
+        ``(frame_number, word_index)`` frame pairs (``None`` for non-verbs)
+        and gloss; ``None`` if the line is malformed.
+
+    Notes
+    -----
+    The fixed-width prefix (offset, lex_filenum, ss_type, w_cnt) is read by
+    slicing; word and pointer fields are gathered with strided slices of a
+    single ``split`` rather than a per-token loop. Offsets are interned
+    alongside lemmas and pointer symbols, so a synset's offset and every
+    pointer referring to it share one string object.
+    """
+    # Find gloss separator
+    gloss_idx = line.find(" | ")
+    if gloss_idx < DATA_PREFIX_LEN - 1 or line[8] != " " or line[11] != " " or line[13] != " ":
+        return None
+
+    # Callers pass stripped lines and WordNet always writes " | " before the
+    # gloss, so a single slice yields it without a further strip copy
+    gloss = line[gloss_idx + 3 :]
+
+    parts = line[DATA_PREFIX_LEN:gloss_idx].split()
+    n_parts = len(parts)
+    if n_parts < 2:
+        return None
+
+    try:
+        # Parse fixed-width fields
+        offset = sys.intern(line[0:8])
+        lex_filenum = int(line[9:11])
+        ss_type = line[12]
+        w_cnt = int(line[14:16], 16)  # Hex count
+
+        # Parse words as (lemma, hex lex_id) pairs
+        words_end = 2 * w_cnt
+        if words_end >= n_parts:
+            return None
+        words = [(sys.intern(parts[i]), int(parts[i + 1], 16)) for i in range(0, words_end, 2)]
+
+        # Parse pointers as (symbol, offset, pos, source/target) quadruples
+        p_cnt = int(parts[words_end])
+        idx = words_end + 1
+        ptr_end = min(idx + 4 * p_cnt, idx + 4 * ((n_parts - idx) // 4))
+        pointers: list[tuple[str, str, str, int, int]] = []
+        for i in range(idx, ptr_end, 4):
+            # Source/target word numbers are two hex digits each, so one
+            # int() call over all four digits yields both as high/low bytes
+            source_target = parts[i + 3]
+            if len(source_target) == 4:
+                source, target = divmod(int(source_target, 16), 256)
+            else:
+                source = target = 0
+            pointers.append(
+                (
+                    sys.intern(parts[i]),
+                    sys.intern(parts[i + 1].zfill(8)),
+                    parts[i + 2],
+                    source,
+                    target,
+                )
+            )
+        idx = ptr_end
+
+        # Parse verb frames if present (for verbs only)
+        frames: list[tuple[int, int]] | None = None
+        if ss_type == "v" and idx < n_parts:
+            frames = []
+
+            # Parse frames until no more "+" markers
+            while idx + 2 < n_parts and parts[idx] == "+":
+                frame_num = int(parts[idx + 1])
+                word_idx = int(parts[idx + 2], 16)
+                if 1 <= frame_num <= 35:
+                    frames.append((frame_num, word_idx))
+                idx += 3
+
+    except ValueError:
+        return None
+
+    return offset, lex_filenum, ss_type, words, pointers, frames, gloss
+
+
+def _convert_data_shard(data_file: Path, pos: WordNetPOS, shard_file: Path) -> int:
+    """Convert one data file to a JSON Lines shard in a worker process.
 
-        # Allow letters, underscores, hyphens, and apostrophes
-        return bool(re.match(r"^[a-z][a-z0-9_'-]*$", word, re.IGNORECASE))
+    Parameters
+    ----------
+    data_file : Path
+        Path to WordNet data file.
+    pos : WordNetPOS
+        Part of speech of the data file.
+    shard_file : Path
+        Output shard path.
+
+    Returns
+    -------
+    int
+        Number of synsets written.
+    """
+    with shard_file.open("w", encoding="utf-8") as f:
+        return WordNetConverter()._write_synsets(data_file, pos, f)
 
 
 def parse_data_file(filepath: Path | str, pos: WordNetPOS) -> list[Synset]:
@@ -758,7 +1035,9 @@ def parse_exception_file(filepath: Path | str) -> list[ExceptionEntry]:
     return converter.parse_exception_file(filepath)
 
 
-def convert_wordnet_database(wordnet_dir: Path | str, output_file: Path | str) -> dict[str, int]:
+def convert_wordnet_database(
+    wordnet_dir: Path | str, output_file: Path | str, max_workers: int | None = 1
+) -> dict[str, int]:
     """Convert entire WordNet database to JSON Lines.
 
     Parameters
@@ -767,6 +1046,9 @@ def convert_wordnet_database(wordnet_dir: Path | str, output_file: Path | str) -
         WordNet database directory.
     output_file : Path | str
         Output JSON Lines file path.
+    max_workers : int | None, default=1
+        Number of worker processes parsing data files; ``None`` uses one
+        per data file.
 
     Returns
     -------
@@ -774,4 +1056,4 @@ def convert_wordnet_database(wordnet_dir: Path | str, output_file: Path | str) -
         Processing counts by file type.
     """
     converter = WordNetConverter()
-    return converter.convert_wordnet_database(wordnet_dir, output_file)
+    return converter.convert_wordnet_database(wordnet_dir, output_file, max_workers)
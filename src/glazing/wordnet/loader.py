@@ -29,15 +29,20 @@ Examples
 
 from __future__ import annotations
 
-import json
+import mmap
+import os
+import sys
 from collections import defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import cast
+from typing import TYPE_CHECKING, Self, TypedDict
 
-from pydantic import ValidationError
+from pydantic import TypeAdapter, ValidationError
 
+from glazing.base import GlazingBaseModel
 from glazing.initialize import get_default_data_path
-from glazing.utils.cache import LRUCache
+from glazing.utils.cache import FIFOCache
 from glazing.wordnet.models import (
     ExceptionEntry,
     IndexEntry,
@@ -50,6 +55,37 @@ from glazing.wordnet.types import (
     WordNetPOS,
 )
 
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from types import TracebackType
+
+# JSON Lines file name part and POS tag for each part of speech
+POS_FILE_NAMES: tuple[tuple[str, WordNetPOS], ...] = (
+    ("noun", "n"),
+    ("verb", "v"),
+    ("adj", "a"),
+    ("adv", "r"),
+)
+
+# Pointer symbols linking a synset to its parts and to its wholes
+MERONYM_SYMBOLS = frozenset({"%m", "%s", "%p"})
+HOLONYM_SYMBOLS = frozenset({"#m", "#s", "#p"})
+
+# Files read concurrently by load()
+LOAD_WORKERS = 4
+
+# Synsets whose resolved hypernyms and hyponyms are cached
+RELATION_CACHE_SIZE = 4096
+
+
+class _SynsetOffsetRecord(TypedDict):
+    """Offset field of a synset record, read when indexing lazily."""
+
+    offset: SynsetOffset
+
+
+_SYNSET_OFFSET_ADAPTER = TypeAdapter(_SynsetOffsetRecord)
+
 
 class WordNetLoader:
     """Load and index WordNet database from JSON Lines format with automatic loading.
@@ -87,6 +123,8 @@ class WordNetLoader:
     -------
     load()
         Load all WordNet data from JSON Lines files.
+    close()
+        Release the files mapped for lazy loading.
     get_synset(offset)
         Get a synset by its offset.
     get_senses_by_lemma(lemma, pos)
@@ -128,7 +166,7 @@ class WordNetLoader:
             Whether to automatically load data on initialization.
             Only applies when lazy=False.
         cache_size : int, default=1000
-            Size of LRU cache for lazy loading.
+            Size of synset cache for lazy loading.
         """
         if data_path is None:
             data_path = get_default_data_path("wordnet.jsonl")
@@ -148,15 +186,29 @@ class WordNetLoader:
         self.meronym_index: dict[SynsetOffset, list[SynsetOffset]] = defaultdict(list)
         self.holonym_index: dict[SynsetOffset, list[SynsetOffset]] = defaultdict(list)
 
-        # File paths for lazy loading
-        self._synset_file_index: dict[SynsetOffset, tuple[Path, int]] = {}
+        # Flat views of lemma_index sharing its entry lists, so lookups by
+        # (lemma, pos) or by lemma alone take a single hash probe
+        self._lemma_pos_entries: dict[tuple[str, WordNetPOS], list[IndexEntry]] = {}
+        self._lemma_entries: dict[str, list[IndexEntry]] = {}
+
+        # Senses keyed by lemma and the synset they belong to
+        self._lemma_synset_senses: dict[tuple[str, SynsetOffset], Sense] = {}
+
+        # Byte ranges of synset records, and the mapped files they point
+        # into, for lazy loading
+        self._synset_file_index: dict[int, tuple[int, int, int]] = {}
+        self._mmaps: list[mmap.mmap] = []
 
         # Cache for lazy loading
         if lazy:
-            self._cache: LRUCache[Synset] | None = LRUCache(cache_size)
+            self._cache: FIFOCache[Synset] | None = FIFOCache(cache_size)
         else:
             self._cache = None
 
+        # Resolved hypernyms and hyponyms, which tree walks revisit often
+        self._hypernym_cache: FIFOCache[list[Synset]] = FIFOCache(RELATION_CACHE_SIZE)
+        self._hyponym_cache: FIFOCache[list[Synset]] = FIFOCache(RELATION_CACHE_SIZE)
+
         # Track loaded state
         self._loaded = False
 
@@ -181,20 +233,48 @@ class WordNetLoader:
         if self._loaded:
             return
 
-        # Load synsets
-        if self.lazy:
-            self._build_file_index()
-        else:
-            self._load_all_synsets()
-
-        # Load index files
-        self._load_index_files()
-
-        # Load sense index
-        self._load_sense_index()
-
-        # Load exceptions
-        self._load_exceptions()
+        self._hypernym_cache.clear()
+        self._hyponym_cache.clear()
+
+        # Read every file on a thread pool so parsing overlaps with reads
+        # of the others; results are merged below in a fixed order so the
+        # indices do not depend on scheduling
+        with ThreadPoolExecutor(max_workers=LOAD_WORKERS) as executor:
+            synset_reads = (
+                []
+                if self.lazy
+                else self._submit_reads(executor, "data.{pos_name}.jsonl", _read_synset_file)
+            )
+            index_reads = self._submit_reads(
+                executor,
+                "index.{pos_name}.jsonl",
+                partial(_read_jsonl_models, model=IndexEntry, kind="index entry"),
+            )
+            sense_file = self.data_path / "index.sense.jsonl"
+            sense_read = (
+                executor.submit(_read_jsonl_models, sense_file, Sense, "sense")
+                if sense_file.exists()
+                else None
+            )
+            exception_reads = self._submit_reads(
+                executor, "{pos_name}.exc.jsonl", _read_exception_file
+            )
+
+            # Load synsets
+            if self.lazy:
+                self._build_file_index()
+            else:
+                self._load_all_synsets(synset_reads)
+
+            # Load index files
+            self._load_index_files(index_reads)
+
+            # Load sense index
+            if sense_read is not None:
+                self._load_sense_index(sense_read.result())
+
+            # Load exceptions
+            self._load_exceptions(exception_reads)
 
         # Build relation indices
         if not self.lazy:
@@ -202,46 +282,108 @@ class WordNetLoader:
 
         self._loaded = True
 
-    def _load_all_synsets(self) -> None:
-        """Load all synsets from JSON Lines files."""
-        for pos in ["noun", "verb", "adj", "adv"]:
-            synset_file = self.data_path / f"data.{pos}.jsonl"
-            if not synset_file.exists():
-                continue
+    def close(self) -> None:
+        """Release the files mapped for lazy loading.
+
+        Lazy lookups return None once the loader is closed. Synsets that
+        are already loaded, and the indices built from the other files,
+        stay available. Loaders can also be used as context managers,
+        which close them on exit.
+        """
+        for mm in self._mmaps:
+            mm.close()
+        self._mmaps.clear()
+        self._synset_file_index.clear()
+        if self._cache is not None:
+            self._cache.clear()
 
-            with synset_file.open(encoding="utf-8") as f:
-                for line in f:
-                    if not line.strip():
-                        continue
+    def __enter__(self) -> Self:
+        """Return the loader for use in a ``with`` block."""
+        return self
 
-                    try:
-                        data = json.loads(line)
-                        synset = Synset.model_validate(data)
-                        self.synsets[synset.offset] = synset
-                    except (json.JSONDecodeError, ValidationError) as e:
-                        # Log error but continue loading
-                        print(f"Error loading synset: {e}")
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_value: BaseException | None,
+        traceback: TracebackType | None,
+    ) -> None:
+        """Close the loader when leaving a ``with`` block."""
+        self.close()
+
+    def _submit_reads[R](
+        self,
+        executor: ThreadPoolExecutor,
+        file_pattern: str,
+        read_file: Callable[[Path], R],
+    ) -> list[tuple[WordNetPOS, Future[R]]]:
+        """Schedule reads of the per-POS files that exist.
+
+        Parameters
+        ----------
+        executor : ThreadPoolExecutor
+            Pool running the reads.
+        file_pattern : str
+            File name with a ``{pos_name}`` placeholder.
+        read_file : Callable[[Path], R]
+            Reader applied to each file.
+
+        Returns
+        -------
+        list[tuple[WordNetPOS, Future[R]]]
+            POS tag and pending read for each existing file, in POS order.
+        """
+        reads = []
+        for pos_name, pos_tag in POS_FILE_NAMES:
+            filepath = self.data_path / file_pattern.format(pos_name=pos_name)
+            if filepath.exists():
+                reads.append((pos_tag, executor.submit(read_file, filepath)))
+        return reads
+
+    def _load_all_synsets(
+        self, reads: list[tuple[WordNetPOS, Future[dict[SynsetOffset, Synset]]]]
+    ) -> None:
+        """Add synsets read from JSON Lines files.
+
+        Each file arrives as a ready-made dict, so merging it is a single
+        ``dict.update`` that resizes the table once for all its synsets.
+        """
+        for _, read in reads:
+            self.synsets.update(read.result())
 
     def _build_file_index(self) -> None:
-        """Build index of synset locations for lazy loading."""
-        for pos in ["noun", "verb", "adj", "adv"]:
-            synset_file = self.data_path / f"data.{pos}.jsonl"
+        """Build index of synset locations for lazy loading.
+
+        Each synset file is memory-mapped once and kept open; the index
+        records the byte range of every record, so a lazy lookup slices
+        the record out of the map instead of re-reading the file. Entries
+        are keyed by the integer value of the offset and point at maps by
+        position in ``_mmaps``, which keeps the index small for the full
+        database. Maps from an earlier build are closed first.
+        """
+        self.close()
+        for pos_name, _ in POS_FILE_NAMES:
+            synset_file = self.data_path / f"data.{pos_name}.jsonl"
             if not synset_file.exists():
                 continue
 
-            with synset_file.open(encoding="utf-8") as f:
-                for line_num, line in enumerate(f):
-                    if not line.strip():
-                        continue
-
+            with synset_file.open("rb") as f:
+                if os.fstat(f.fileno()).st_size == 0:
+                    continue
+                mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            file_id = len(self._mmaps)
+            self._mmaps.append(mm)
+
+            start = 0
+            for line in iter(mm.readline, b""):
+                end = start + len(line)
+                if not line.isspace():
                     try:
                         # Just extract offset without full validation
-                        data = json.loads(line)
-                        offset = data.get("offset")
-                        if offset:
-                            self._synset_file_index[offset] = (synset_file, line_num)
-                    except json.JSONDecodeError:
+                        offset = _SYNSET_OFFSET_ADAPTER.validate_json(line)["offset"]
+                        self._synset_file_index[int(offset)] = (file_id, start, end)
+                    except ValidationError:
                         pass
+                start = end
 
     def _load_synset_lazy(self, offset: SynsetOffset) -> Synset | None:
         """Load a single synset on demand.
@@ -266,121 +408,115 @@ class WordNetLoader:
             if cached is not None:
                 return cached
 
-        # Load from file
-        file_info = self._synset_file_index.get(offset)
+        # Load from the mapped file; only 8-digit offsets are indexed
+        file_info = (
+            self._synset_file_index.get(int(offset))
+            if len(offset) == 8 and offset.isascii() and offset.isdigit()
+            else None
+        )
         if not file_info:
             return None
 
-        synset_file, line_num = file_info
+        file_id, start, end = file_info
 
-        try:
-            with synset_file.open(encoding="utf-8") as f:
-                for i, line in enumerate(f):
-                    if i == line_num:
-                        data = json.loads(line)
-                        synset = Synset.model_validate(data)
-
-                        # Cache it
-                        if self._cache is not None:
-                            self._cache.put(offset, synset)
-
-                        return synset
-        except (json.JSONDecodeError, ValidationError):
+        # Reading a mapped page past the end of a file truncated since it
+        # was indexed kills the process, so check the current size first
+        mm = self._mmaps[file_id]
+        if end > mm.size():
             return None
 
-        return None
-
-    def _load_index_files(self) -> None:
-        """Load lemma index files."""
-        for pos_name, pos_tag in [("noun", "n"), ("verb", "v"), ("adj", "a"), ("adv", "r")]:
-            index_file = self.data_path / f"index.{pos_name}.jsonl"
-            if not index_file.exists():
-                continue
+        try:
+            synset = Synset.model_validate_json(mm[start:end])
+        except ValidationError:
+            return None
 
-            with index_file.open(encoding="utf-8") as f:
-                for line in f:
-                    if not line.strip():
-                        continue
+        # Cache it
+        if self._cache is not None:
+            self._cache.put(offset, synset)
+
+        return synset
+
+    def _load_index_files(self, reads: list[tuple[WordNetPOS, Future[list[IndexEntry]]]]) -> None:
+        """Add lemma index entries read from JSON Lines files."""
+        lemma_pos_entries = self._lemma_pos_entries
+        lemma_entries = self._lemma_entries
+        for pos_tag, read in reads:
+            for entry in read.result():
+                # Add to lemma index
+                lemma = entry.lemma
+                pos_entries = lemma_pos_entries.get((lemma, pos_tag))
+                if pos_entries is None:
+                    pos_entries = lemma_pos_entries[lemma, pos_tag] = []
+                    self.lemma_index[lemma][pos_tag] = pos_entries
+                pos_entries.append(entry)
+                lemma_entries.setdefault(lemma, []).append(entry)
+
+    def _load_sense_index(self, senses: list[Sense]) -> None:
+        """Add senses read from the sense index file."""
+        for sense in senses:
+            self.sense_index[sense.sense_key] = sense
+
+        # Key each sense by lemma and synset so lemma lookups need no scan;
+        # the first sense in sense key order wins, as a scan would find it
+        lemma_synset_senses = self._lemma_synset_senses
+        for sense in self.sense_index.values():
+            lemma_synset_senses.setdefault((sense.lemma, sense.synset_offset), sense)
+
+    def _load_exceptions(
+        self, reads: list[tuple[WordNetPOS, Future[dict[str, list[str]]]]]
+    ) -> None:
+        """Add morphological exceptions read from exception files."""
+        for pos_tag, read in reads:
+            self.exceptions.setdefault(pos_tag, {}).update(read.result())
 
-                    try:
-                        data = json.loads(line)
-                        entry = IndexEntry.model_validate(data)
-
-                        # Add to lemma index
-                        if pos_tag not in self.lemma_index[entry.lemma]:
-                            self.lemma_index[entry.lemma][cast(WordNetPOS, pos_tag)] = []
-                        self.lemma_index[entry.lemma][cast(WordNetPOS, pos_tag)].append(entry)
-                    except (json.JSONDecodeError, ValidationError) as e:
-                        print(f"Error loading index entry: {e}")
-
-    def _load_sense_index(self) -> None:
-        """Load sense index file."""
-        sense_file = self.data_path / "index.sense.jsonl"
-        if not sense_file.exists():
-            return
+    def _build_relation_indices(self) -> None:
+        """Build relation indices for efficient traversal.
+
+        Each pointer is visited once and recorded in both directions, with
+        interned offsets as keys and values. Targets are collected in
+        insertion-ordered dicts, so the hypernym and hyponym pointers
+        WordNet stores for the same pair are deduplicated without scanning
+        the lists built so far.
+
+        Notes
+        -----
+        ``dict.setdefault`` keeps this a single linear pass; it measured
+        faster than both ``defaultdict`` and sorting pointer pairs to build
+        each index with ``itertools.groupby``, which also loses the pointer
+        order of the targets.
+        """
+        hypernyms: dict[SynsetOffset, dict[SynsetOffset, None]] = {}
+        hyponyms: dict[SynsetOffset, dict[SynsetOffset, None]] = {}
+        meronyms: dict[SynsetOffset, dict[SynsetOffset, None]] = {}
+        holonyms: dict[SynsetOffset, dict[SynsetOffset, None]] = {}
 
-        with sense_file.open(encoding="utf-8") as f:
-            for line in f:
-                if not line.strip():
+        for synset in self.synsets.values():
+            offset = sys.intern(synset.offset)
+            for pointer in synset.pointers:
+                symbol = pointer.symbol
+                if symbol == "@":
+                    forward, backward = hypernyms, hyponyms
+                elif symbol == "~":
+                    forward, backward = hyponyms, hypernyms
+                elif symbol in MERONYM_SYMBOLS:
+                    forward, backward = meronyms, holonyms
+                elif symbol in HOLONYM_SYMBOLS:
+                    forward, backward = holonyms, meronyms
+                else:
                     continue
 
-                try:
-                    data = json.loads(line)
-                    sense = Sense.model_validate(data)
-                    self.sense_index[sense.sense_key] = sense
-                except (json.JSONDecodeError, ValidationError) as e:
-                    print(f"Error loading sense: {e}")
-
-    def _load_exceptions(self) -> None:
-        """Load morphological exception files."""
-        for pos_name, pos_tag in [("noun", "n"), ("verb", "v"), ("adj", "a"), ("adv", "r")]:
-            exc_file = self.data_path / f"{pos_name}.exc.jsonl"
-            if not exc_file.exists():
-                continue
-
-            if pos_tag not in self.exceptions:
-                self.exceptions[cast(WordNetPOS, pos_tag)] = {}
+                target = sys.intern(pointer.offset)
+                forward.setdefault(offset, {})[target] = None
+                backward.setdefault(target, {})[offset] = None
 
-            with exc_file.open(encoding="utf-8") as f:
-                for line in f:
-                    if not line.strip():
-                        continue
-
-                    try:
-                        data = json.loads(line)
-                        entry = ExceptionEntry.model_validate(data)
-                        pos_exceptions = self.exceptions[cast(WordNetPOS, pos_tag)]
-                        pos_exceptions[entry.inflected_form] = entry.base_forms
-                    except (json.JSONDecodeError, ValidationError) as e:
-                        print(f"Error loading exception: {e}")
-
-    def _build_relation_indices(self) -> None:
-        """Build relation indices for efficient traversal."""
-        for synset in self.synsets.values():
-            for pointer in synset.pointers:
-                # Hypernym/hyponym relations
-                if pointer.symbol == "@":
-                    if pointer.offset not in self.hypernym_index[synset.offset]:
-                        self.hypernym_index[synset.offset].append(pointer.offset)
-                    if synset.offset not in self.hyponym_index[pointer.offset]:
-                        self.hyponym_index[pointer.offset].append(synset.offset)
-                elif pointer.symbol == "~":
-                    if pointer.offset not in self.hyponym_index[synset.offset]:
-                        self.hyponym_index[synset.offset].append(pointer.offset)
-                    if synset.offset not in self.hypernym_index[pointer.offset]:
-                        self.hypernym_index[pointer.offset].append(synset.offset)
-
-                # Meronym/holonym relations
-                elif pointer.symbol in ["%m", "%s", "%p"]:
-                    if pointer.offset not in self.meronym_index[synset.offset]:
-                        self.meronym_index[synset.offset].append(pointer.offset)
-                    if synset.offset not in self.holonym_index[pointer.offset]:
-                        self.holonym_index[pointer.offset].append(synset.offset)
-                elif pointer.symbol in ["#m", "#s", "#p"]:
-                    if pointer.offset not in self.holonym_index[synset.offset]:
-                        self.holonym_index[synset.offset].append(pointer.offset)
-                    if synset.offset not in self.meronym_index[pointer.offset]:
-                        self.meronym_index[pointer.offset].append(synset.offset)
+        for index, relations in (
+            (self.hypernym_index, hypernyms),
+            (self.hyponym_index, hyponyms),
+            (self.meronym_index, meronyms),
+            (self.holonym_index, holonyms),
+        ):
+            for source, targets in relations.items():
+                index[source] = list(targets)
 
     def get_synset(self, offset: SynsetOffset) -> Synset | None:
         """Get a synset by its offset.
@@ -427,22 +563,18 @@ class WordNetLoader:
         """
         synsets: list[Synset] = []
 
-        if lemma not in self.lemma_index:
-            return synsets
-
-        # Get POS tags to search
+        # Get index entries to search
         if pos:
-            pos_tags = [pos] if pos in self.lemma_index[lemma] else []
+            entries = self._lemma_pos_entries.get((lemma, pos), [])
         else:
-            pos_tags = list(self.lemma_index[lemma].keys())
+            entries = self._lemma_entries.get(lemma, [])
 
         # Collect synsets
-        for pos_tag in pos_tags:
-            for entry in self.lemma_index[lemma][pos_tag]:
-                for offset in entry.synset_offsets:
-                    synset = self.get_synset(offset)
-                    if synset:
-                        synsets.append(synset)
+        for entry in entries:
+            for offset in entry.synset_offsets:
+                synset = self.get_synset(offset)
+                if synset:
+                    synsets.append(synset)
 
         return synsets
 
@@ -493,14 +625,14 @@ class WordNetLoader:
         synsets = self.get_synsets_by_lemma(lemma, pos)
 
         # Extract senses from synsets
+        lemma_synset_senses = self._lemma_synset_senses
         for synset in synsets:
             for word in synset.words:
                 if word.lemma == lemma:
-                    # Try to find corresponding sense
-                    for _key, sense in self.sense_index.items():
-                        if sense.lemma == lemma and sense.synset_offset == synset.offset:
-                            senses.append(sense)
-                            break
+                    # Find corresponding sense
+                    sense = lemma_synset_senses.get((lemma, synset.offset))
+                    if sense is not None:
+                        senses.append(sense)
 
         # Sort by sense number (frequency order)
         senses.sort(key=lambda s: s.sense_number)
@@ -520,12 +652,7 @@ class WordNetLoader:
         list[Synset]
             List of hypernym synsets.
         """
-        hypernyms = []
-        for offset in self.hypernym_index.get(synset.offset, []):
-            hypernym = self.get_synset(offset)
-            if hypernym:
-                hypernyms.append(hypernym)
-        return hypernyms
+        return self._resolve_relation(self.hypernym_index, self._hypernym_cache, synset.offset)
 
     def get_hyponyms(self, synset: Synset) -> list[Synset]:
         """Get direct hyponyms of a synset.
@@ -540,12 +667,39 @@ class WordNetLoader:
         list[Synset]
             List of hyponym synsets.
         """
-        hyponyms = []
-        for offset in self.hyponym_index.get(synset.offset, []):
-            hyponym = self.get_synset(offset)
-            if hyponym:
-                hyponyms.append(hyponym)
-        return hyponyms
+        return self._resolve_relation(self.hyponym_index, self._hyponym_cache, synset.offset)
+
+    def _resolve_relation(
+        self,
+        index: dict[SynsetOffset, list[SynsetOffset]],
+        cache: FIFOCache[list[Synset]],
+        offset: SynsetOffset,
+    ) -> list[Synset]:
+        """Resolve the related synsets of an offset through a cache.
+
+        Parameters
+        ----------
+        index : dict[SynsetOffset, list[SynsetOffset]]
+            Relation index to follow.
+        cache : FIFOCache[list[Synset]]
+            Resolved synsets for this relation keyed by offset.
+        offset : SynsetOffset
+            Offset of the source synset.
+
+        Returns
+        -------
+        list[Synset]
+            Fresh list of the related synsets that could be found.
+        """
+        resolved = cache.get(offset)
+        if resolved is None:
+            resolved = []
+            for related_offset in index.get(offset, []):
+                related = self.get_synset(related_offset)
+                if related:
+                    resolved.append(related)
+            cache.put(offset, resolved)
+        return list(resolved)
 
     def get_meronyms(self, synset: Synset) -> list[Synset]:
         """Get all meronyms (parts) of a synset.
@@ -603,6 +757,127 @@ class WordNetLoader:
         return self.exceptions.get(pos, {})
 
 
+def _read_jsonl_models[M: GlazingBaseModel](filepath: Path, model: type[M], kind: str) -> list[M]:
+    """Validate every record of a JSON Lines file.
+
+    Parameters
+    ----------
+    filepath : Path
+        Path to an existing JSON Lines file.
+    model : type[M]
+        Model validating each record.
+    kind : str
+        Record description used in error messages.
+
+    Returns
+    -------
+    list[M]
+        Valid records in file order; invalid ones are reported and skipped.
+
+    Notes
+    -----
+    The model's compiled schema validator is bound once and called per
+    line, skipping the Python-level wrapper of ``model_validate_json``.
+    """
+    validate_json = model.__pydantic_validator__.validate_json
+    records: list[M] = []
+    for line in _iter_jsonl_lines(filepath):
+        try:
+            records.append(validate_json(line))
+        except ValidationError as e:
+            # Log error but continue loading
+            print(f"Error loading {kind}: {e}")
+    return records
+
+
+def _read_synset_file(filepath: Path) -> dict[SynsetOffset, Synset]:
+    """Read a synset file into a dict keyed by offset.
+
+    Parameters
+    ----------
+    filepath : Path
+        Path to an existing synset JSON Lines file.
+
+    Returns
+    -------
+    dict[SynsetOffset, Synset]
+        Synsets keyed by interned offset, in file order.
+
+    Notes
+    -----
+    Offsets are interned so the synset keys and the relation indices
+    built from pointers share one string per offset.
+    """
+    return {
+        sys.intern(synset.offset): synset
+        for synset in _read_jsonl_models(filepath, Synset, "synset")
+    }
+
+
+def _read_exception_file(filepath: Path) -> dict[str, list[str]]:
+    """Read a morphological exception file.
+
+    Parameters
+    ----------
+    filepath : Path
+        Path to an existing exception file, either JSON Lines or the
+        native WordNet format of space-separated word forms.
+
+    Returns
+    -------
+    dict[str, list[str]]
+        Base forms keyed by inflected form.
+
+    Notes
+    -----
+    The format is detected from the first record. Native lines such as
+    ``geese goose`` are split directly, with no JSON parsing or model
+    validation.
+    """
+    first_line = next(_iter_jsonl_lines(filepath), None)
+    if first_line is None:
+        return {}
+
+    if first_line.lstrip().startswith(b"{"):
+        entries = _read_jsonl_models(filepath, ExceptionEntry, "exception")
+        return {entry.inflected_form: entry.base_forms for entry in entries}
+
+    exceptions = {}
+    for line in _iter_jsonl_lines(filepath):
+        inflected_form, *base_forms = line.decode("utf-8").split()
+        if base_forms:
+            exceptions[inflected_form] = base_forms
+    return exceptions
+
+
+def _iter_jsonl_lines(filepath: Path) -> Iterator[bytes]:
+    """Yield the non-blank lines of a JSON Lines file as raw bytes.
+
+    Parameters
+    ----------
+    filepath : Path
+        Path to an existing JSON Lines file.
+
+    Yields
+    ------
+    bytes
+        One encoded JSON record per line, including its newline.
+
+    Notes
+    -----
+    The file is read through a memory map and lines are passed on
+    undecoded; pydantic parses JSON from bytes directly, so no per-line
+    text decoding or newline translation is done.
+    """
+    with filepath.open("rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            for line in iter(mm.readline, b""):
+                if not line.isspace():
+                    yield line
+
+
 def load_wordnet(
     data_path: Path | str, lazy: bool = False, cache_size: int = 1000
 ) -> WordNetLoader:
@@ -615,7 +890,7 @@ def load_wordnet(
     lazy : bool, default=False
         If True, load synsets on demand.
     cache_size : int, default=1000
-        Size of LRU cache for lazy loading.
+        Size of synset cache for lazy loading.
 
     Returns
     -------
@@ -39,8 +39,9 @@ Examples
 from __future__ import annotations
 
 import re
+from typing import Annotated
 
-from pydantic import Field, field_validator
+from pydantic import ConfigDict, Field, field_serializer, field_validator
 
 from glazing.base import GlazingBaseModel
 from glazing.types import LEMMA_PATTERN
@@ -76,33 +77,14 @@ class Word(GlazingBaseModel):
     0
     """
 
-    lemma: str = Field(description="Word form (lowercase, underscores for spaces)")
-    lex_id: LexID = Field(description="Lexical ID distinguishing same word in synset")
-
-    @field_validator("lemma")
-    @classmethod
-    def validate_lemma(cls, v: str) -> str:
-        """Validate lemma format.
-
-        Parameters
-        ----------
-        v : str
-            The lemma to validate.
+    model_config = ConfigDict(frozen=True)
 
-        Returns
-        -------
-        str
-            The validated lemma.
-
-        Raises
-        ------
-        ValueError
-            If lemma format is invalid.
-        """
-        if not re.match(LEMMA_PATTERN, v):
-            msg = f"Invalid lemma format: {v}"
-            raise ValueError(msg)
-        return v
+    # Constraints are declarative so pydantic-core checks them without a
+    # Python-level validator call per word
+    lemma: str = Field(
+        pattern=LEMMA_PATTERN, description="Word form (lowercase, underscores for spaces)"
+    )
+    lex_id: LexID = Field(description="Lexical ID distinguishing same word in synset")
 
 
 class Pointer(GlazingBaseModel):
@@ -141,6 +123,8 @@ class Pointer(GlazingBaseModel):
     True
     """
 
+    model_config = ConfigDict(frozen=True)
+
     symbol: PointerSymbol = Field(description="Relation type symbol")
     offset: SynsetOffset = Field(description="Target synset offset")
     pos: WordNetPOS = Field(description="Target part of speech")
@@ -185,37 +169,13 @@ class VerbFrame(GlazingBaseModel):
     8
     """
 
+    model_config = ConfigDict(frozen=True)
+
     frame_number: VerbFrameNumber = Field(description="Frame number (1-35)")
-    word_indices: list[int] = Field(
+    word_indices: list[Annotated[int, Field(ge=0)]] = Field(
         default_factory=list, description="Word indices (0 = all words)"
     )
 
-    @field_validator("word_indices")
-    @classmethod
-    def validate_word_indices(cls, v: list[int]) -> list[int]:
-        """Validate word indices.
-
-        Parameters
-        ----------
-        v : list[int]
-            The word indices to validate.
-
-        Returns
-        -------
-        list[int]
-            The validated indices.
-
-        Raises
-        ------
-        ValueError
-            If any index is negative.
-        """
-        for idx in v:
-            if idx < 0:
-                msg = f"Word index cannot be negative: {idx}"
-                raise ValueError(msg)
-        return v
-
 
 class Synset(GlazingBaseModel):
     """A WordNet synset (set of cognitive synonyms).
@@ -263,6 +223,8 @@ class Synset(GlazingBaseModel):
     ['dog']
     """
 
+    model_config = ConfigDict(frozen=True)
+
     offset: SynsetOffset = Field(description="8-digit synset identifier")
     lex_filenum: int = Field(ge=0, le=44, description="Lexical file number (0-44)")
     lex_filename: LexFileName = Field(description="Lexical file name")
@@ -464,8 +426,8 @@ class IndexEntry(GlazingBaseModel):
         Number of synsets.
     p_cnt : int
         Number of pointer types.
-    ptr_symbols : list[PointerSymbol]
-        Pointer symbols for this word.
+    ptr_symbols : frozenset[PointerSymbol]
+        Pointer symbols for this word; serialized as a sorted list.
     sense_cnt : int
         Same as synset_cnt.
     tagsense_cnt : int
@@ -491,11 +453,27 @@ class IndexEntry(GlazingBaseModel):
     pos: WordNetPOS = Field(description="Part of speech")
     synset_cnt: int = Field(ge=0, description="Number of synsets")
     p_cnt: int = Field(ge=0, description="Number of pointer types")
-    ptr_symbols: list[PointerSymbol] = Field(description="Pointer symbols for this word")
+    ptr_symbols: frozenset[PointerSymbol] = Field(description="Pointer symbols for this word")
     sense_cnt: int = Field(ge=0, description="Same as synset_cnt")
     tagsense_cnt: int = Field(ge=0, description="Semantic concordance senses")
     synset_offsets: list[SynsetOffset] = Field(description="Synsets with this word")
 
+    @field_serializer("ptr_symbols")
+    def serialize_ptr_symbols(self, ptr_symbols: frozenset[PointerSymbol]) -> list[PointerSymbol]:
+        """Serialize pointer symbols in a stable order.
+
+        Parameters
+        ----------
+        ptr_symbols : frozenset[PointerSymbol]
+            The pointer symbols to serialize.
+
+        Returns
+        -------
+        list[PointerSymbol]
+            Sorted pointer symbols.
+        """
+        return sorted(ptr_symbols)
+
 
 class ExceptionEntry(GlazingBaseModel):
     """Morphological exception mapping.
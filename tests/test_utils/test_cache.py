@@ -8,6 +8,7 @@ import time
 import pytest
 
 from glazing.utils.cache import (
+    FIFOCache,
     LRUCache,
     PersistentCache,
     QueryCache,
@@ -130,6 +131,94 @@ class TestLRUCache:
         assert len(errors) == 0
 
 
+class TestFIFOCache:
+    """Test the FIFO cache implementation."""
+
+    def test_basic_operations(self):
+        """Test basic get and put operations."""
+        cache: FIFOCache[str] = FIFOCache(max_size=3)
+
+        cache.put("key1", "value1")
+        assert cache.get("key1") == "value1"
+        assert "key1" in cache
+
+        # Test missing key
+        assert cache.get("missing") is None
+        assert cache.get("missing", "default") == "default"
+
+    def test_fifo_eviction(self):
+        """Test the oldest insertion is evicted regardless of access."""
+        cache: FIFOCache[int] = FIFOCache(max_size=3)
+
+        cache.put("a", 1)
+        cache.put("b", 2)
+        cache.put("c", 3)
+
+        # Access does not protect 'a' from eviction
+        assert cache.get("a") == 1
+        cache.put("d", 4)
+
+        assert cache.get("a") is None
+        assert cache.get("b") == 2
+        assert cache.get("d") == 4
+        assert cache.size() == 3
+
+    def test_update_existing(self):
+        """Test updating an entry does not evict another."""
+        cache: FIFOCache[str] = FIFOCache(max_size=2)
+
+        cache.put("a", "old")
+        cache.put("b", "value")
+        cache.put("a", "new")
+
+        assert cache.get("a") == "new"
+        assert cache.get("b") == "value"
+
+    def test_zero_size(self):
+        """Test a zero-size cache stores nothing."""
+        cache: FIFOCache[str] = FIFOCache(max_size=0)
+
+        cache.put("key", "value")
+        assert cache.get("key") is None
+
+    def test_clear_and_global_toggle(self):
+        """Test clearing and the global caching switch."""
+        cache: FIFOCache[str] = FIFOCache(max_size=10)
+        cache.put("key", "value")
+        cache.clear()
+        assert cache.size() == 0
+
+        set_caching_enabled(False)
+        try:
+            cache.put("key", "value")
+            assert cache.get("key") is None
+        finally:
+            set_caching_enabled(True)
+        assert cache.size() == 0
+
+    def test_concurrent_eviction(self):
+        """Test concurrent puts evict consistently and keep the size bound."""
+        cache: FIFOCache[int] = FIFOCache(max_size=4)
+        errors = []
+
+        def worker(thread_id: int):
+            try:
+                for i in range(5000):
+                    cache.put((thread_id, i % 50), i)
+            except (KeyError, RuntimeError) as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(8)]
+
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len(errors) == 0
+        assert cache.size() == 4
+
+
 class TestTTLCache:
     """Test the TTL cache implementation."""
 
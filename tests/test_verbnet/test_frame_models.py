@@ -243,6 +243,12 @@ class TestPredicateArgument:
                 PredicateArgument(type="Event", value=event)
             assert "Invalid event variable format" in str(exc_info.value)
 
+    def test_frozen(self) -> None:
+        """Test that arguments cannot be reassigned after validation."""
+        arg = PredicateArgument(type="Event", value="e1")
+        with pytest.raises(ValidationError):
+            arg.value = "not-an-event"
+
     def test_optional_themrole(self) -> None:
         """Test optional thematic role (with ?)."""
         arg = PredicateArgument(type="ThemRole", value="?Theme")
@@ -25,6 +25,39 @@ from glazing.verbnet.models import (
     WordNetCrossRef,
 )
 
+# Shared confidence scores for FrameNet mapping tests
+CONFIDENCE_MANUAL_09 = MappingConfidence(score=0.9, method="manual")
+CONFIDENCE_MANUAL_08 = MappingConfidence(score=0.8, method="manual")
+CONFIDENCE_AUTO_07 = MappingConfidence(score=0.7, method="auto")
+CONFIDENCE_AUTO_05 = MappingConfidence(score=0.5, method="auto")
+
+
+@pytest.fixture(scope="module")
+def give_class_tree() -> tuple[VerbClass, Member, Member, Member]:
+    """Build a give-13.1 class with one subclass, shared across the module.
+
+    Returns
+    -------
+    tuple[VerbClass, Member, Member, Member]
+        The parent class and its three members; the third member belongs
+        to the subclass.
+    """
+    member1 = Member(name="give", verbnet_key="give#1")
+    member2 = Member(name="donate", verbnet_key="donate#1")
+    member3 = Member(name="grant", verbnet_key="grant#1")
+
+    subclass = VerbClass(
+        id="give-13.1-1", members=[member3], themroles=[], frames=[], subclasses=[]
+    )
+    parent = VerbClass(
+        id="give-13.1",
+        members=[member1, member2],
+        themroles=[],
+        frames=[],
+        subclasses=[subclass],
+    )
+    return parent, member1, member2, member3
+
 
 class TestSelectionalRestriction:
     """Test SelectionalRestriction model."""
@@ -41,6 +74,13 @@ class TestSelectionalRestriction:
         assert restriction.value == "-"
         assert restriction.type == "abstract"
 
+    def test_frozen(self) -> None:
+        """Test that restrictions are immutable and hashable."""
+        restriction = SelectionalRestriction(value="+", type="animate")
+        with pytest.raises(ValidationError):
+            restriction.value = "-"
+        assert hash(restriction) == hash(SelectionalRestriction(value="+", type="animate"))
+
     def test_invalid_value(self) -> None:
         """Test that invalid restriction values are rejected."""
         with pytest.raises(ValidationError):
@@ -232,6 +272,13 @@ class TestThematicRole:
         role = ThematicRole(type="Co-Agent")
         assert role.type == "Co-Agent"
 
+    def test_frozen(self) -> None:
+        """Test that roles are immutable and share interned types."""
+        role = ThematicRole(type="Agent")
+        with pytest.raises(ValidationError):
+            role.type = "Theme"
+        assert role.type is ThematicRole(type="".join(["Age", "nt"])).type
+
     def test_class_id_method(self) -> None:
         """Test class_id method."""
         role = ThematicRole(type="Agent")
@@ -300,38 +347,46 @@ class TestVerbNetFrameNetMapping:
 class TestMember:
     """Test Member model."""
 
-    def test_valid_member(self) -> None:
-        """Test creating a valid member."""
-        member = Member(name="give", verbnet_key="give#2")
-        assert member.name == "give"
-        assert member.verbnet_key == "give#2"
-
-    def test_invalid_member_name(self) -> None:
-        """Test that invalid member names are rejected."""
-        with pytest.raises(ValidationError, match="Invalid member name format"):
-            Member(
-                name="@Give",
-                verbnet_key="give#2",
-            )
-
-    def test_invalid_verbnet_key(self) -> None:
-        """Test that invalid VerbNet keys are rejected."""
-        with pytest.raises(ValidationError, match="Invalid verbnet_key format"):
-            Member(
-                name="give",
-                verbnet_key="give-2",  # Should be # not -
-            )
+    @pytest.mark.parametrize(
+        ("name", "verbnet_key", "error"),
+        [
+            ("give", "give#2", None),
+            ("@Give", "give#2", "Invalid member name format"),
+            ("give", "give-2", "Invalid verbnet_key format"),  # Should be # not -
+            ("give", "give#2\n", "Invalid verbnet_key format"),  # Trailing newline
+        ],
+        ids=["valid", "invalid_name", "invalid_verbnet_key", "trailing_newline_key"],
+    )
+    def test_member_validation(self, name: str, verbnet_key: str, error: str | None) -> None:
+        """Test member name and VerbNet key validation."""
+        if error is None:
+            member = Member(name=name, verbnet_key=verbnet_key)
+            assert member.name == name
+            assert member.verbnet_key == verbnet_key
+        else:
+            with pytest.raises(ValidationError, match=error):
+                Member(name=name, verbnet_key=verbnet_key)
+
+    def test_member_name_interned(self) -> None:
+        """Test that equal member names share one string object."""
+        first = Member(name="".join(["gi", "ve"]), verbnet_key="give#1")
+        second = Member(name="".join(["giv", "e"]), verbnet_key="give#2")
+        assert first.name is second.name
 
     def test_member_with_mappings(self) -> None:
-        """Test member with cross-references."""
-        member = Member(
+        """Test member with cross-references.
+
+        The nested mappings are validated when they are built, so this and
+        the other mapping tests build Members with model_construct.
+        """
+        member = Member.model_construct(
             name="give",
             verbnet_key="give#2",
             framenet_mappings=[
                 VerbNetFrameNetMapping(
                     frame_name="Giving",
                     mapping_source="manual",
-                    confidence=MappingConfidence(score=0.9, method="manual"),
+                    confidence=CONFIDENCE_MANUAL_09,
                 )
             ],
             propbank_mappings=[
@@ -365,17 +420,42 @@ class TestMember:
                 VerbNetFrameNetMapping(
                     frame_name="Giving",
                     mapping_source="manual",
-                    confidence=MappingConfidence(score=0.9, method="manual"),
+                    confidence=CONFIDENCE_MANUAL_09,
                 ),
                 VerbNetFrameNetMapping(
                     frame_name="Transfer",
                     mapping_source="automatic",
-                    confidence=MappingConfidence(score=0.7, method="auto"),
+                    confidence=CONFIDENCE_AUTO_07,
+                ),
+            ],
+        )
+        assert member.get_primary_framenet_frame() == "Giving"
+
+    def test_framenet_frames_follow_in_place_changes(self) -> None:
+        """Test FrameNet frame lookups see mappings appended after a query."""
+        member = Member(
+            name="give",
+            verbnet_key="give#2",
+            framenet_mappings=[
+                VerbNetFrameNetMapping(
+                    frame_name="Giving",
+                    mapping_source="manual",
+                    confidence=CONFIDENCE_MANUAL_09,
                 ),
             ],
         )
         assert member.get_primary_framenet_frame() == "Giving"
 
+        member.framenet_mappings.append(
+            VerbNetFrameNetMapping(
+                frame_name="Transfer",
+                mapping_source="manual",
+                confidence=MappingConfidence(score=0.99, method="manual"),
+            )
+        )
+        assert member.get_primary_framenet_frame() == "Transfer"
+        assert member.get_all_framenet_frames() == [("Giving", 0.9), ("Transfer", 0.99)]
+
     def test_get_all_framenet_frames(self) -> None:
         """Test getting all FrameNet frames with scores."""
         member = Member(
@@ -385,7 +465,7 @@ class TestMember:
                 VerbNetFrameNetMapping(
                     frame_name="Giving",
                     mapping_source="manual",
-                    confidence=MappingConfidence(score=0.9, method="manual"),
+                    confidence=CONFIDENCE_MANUAL_09,
                 ),
                 VerbNetFrameNetMapping(frame_name="Transfer", mapping_source="automatic"),
             ],
@@ -412,7 +492,8 @@ class TestMember:
 
     def test_get_propbank_rolesets(self) -> None:
         """Test getting PropBank roleset IDs."""
-        member = Member(
+        now = datetime.now(UTC)
+        member = Member.model_construct(
             name="give",
             verbnet_key="give#2",
             propbank_mappings=[
@@ -424,7 +505,7 @@ class TestMember:
                     target_id="give.01",
                     mapping_type="direct",
                     metadata=MappingMetadata(
-                        created_date=datetime.now(UTC),
+                        created_date=now,
                         created_by="test",
                         version="3.4",
                         validation_status="validated",
@@ -438,7 +519,7 @@ class TestMember:
                     target_id="give.02",
                     mapping_type="direct",
                     metadata=MappingMetadata(
-                        created_date=datetime.now(UTC),
+                        created_date=now,
                         created_by="test",
                         version="3.4",
                         validation_status="validated",
@@ -461,12 +542,12 @@ class TestMember:
                 VerbNetFrameNetMapping(
                     frame_name="Giving",
                     mapping_source="manual",
-                    confidence=MappingConfidence(score=0.9, method="manual"),
+                    confidence=CONFIDENCE_MANUAL_09,
                 ),
                 VerbNetFrameNetMapping(
                     frame_name="Transfer",
                     mapping_source="automatic",
-                    confidence=MappingConfidence(score=0.5, method="auto"),
+                    confidence=CONFIDENCE_AUTO_05,
                 ),
             ],
         )
@@ -480,12 +561,12 @@ class TestMember:
                 VerbNetFrameNetMapping(
                     frame_name="Giving",
                     mapping_source="manual",
-                    confidence=MappingConfidence(score=0.9, method="manual"),
+                    confidence=CONFIDENCE_MANUAL_09,
                 ),
                 VerbNetFrameNetMapping(
                     frame_name="Transfer",
                     mapping_source="manual",
-                    confidence=MappingConfidence(score=0.8, method="manual"),
+                    confidence=CONFIDENCE_MANUAL_08,
                 ),
             ],
         )
@@ -511,6 +592,11 @@ class TestVerbClass:
                 subclasses=[],
             )
 
+    def test_class_id_trailing_newline_rejected(self) -> None:
+        """Test that a class ID must match in full, without a trailing newline."""
+        with pytest.raises(ValidationError, match="Invalid VerbNet class ID format"):
+            VerbClass(id="give-13.1\n", members=[], themroles=[], frames=[], subclasses=[])
+
     def test_verb_class_with_subclasses(self) -> None:
         """Test verb class with subclasses."""
         subclass = VerbClass(
@@ -596,53 +682,27 @@ class TestVerbClass:
         assert any(r.type == "Theme" for r in effective)
         assert any(r.type == "Recipient" for r in effective)
 
-    def test_get_all_members(self) -> None:
+    def test_get_all_members(
+        self, give_class_tree: tuple[VerbClass, Member, Member, Member]
+    ) -> None:
         """Test getting all members including subclasses."""
-        member1 = Member(name="give", verbnet_key="give#1")
-        member2 = Member(name="donate", verbnet_key="donate#1")
-        member3 = Member(name="grant", verbnet_key="grant#1")
-
-        subclass = VerbClass(
-            id="give-13.1-1", members=[member3], themroles=[], frames=[], subclasses=[]
-        )
-        parent = VerbClass(
-            id="give-13.1",
-            members=[member1, member2],
-            themroles=[],
-            frames=[],
-            subclasses=[subclass],
-        )
+        parent, member1, member2, member3 = give_class_tree
 
-        # With subclasses
+        # With subclasses; compare by identity since the exact members are returned
         all_members = parent.get_all_members(include_subclasses=True)
         assert len(all_members) == 3
-        assert member1 in all_members
-        assert member2 in all_members
-        assert member3 in all_members
+        assert {id(m) for m in all_members} == {id(member1), id(member2), id(member3)}
 
         # Without subclasses
         parent_only = parent.get_all_members(include_subclasses=False)
         assert len(parent_only) == 2
-        assert member1 in parent_only
-        assert member2 in parent_only
-        assert member3 not in parent_only
+        assert {id(m) for m in parent_only} == {id(member1), id(member2)}
 
-    def test_get_member_by_key(self) -> None:
+    def test_get_member_by_key(
+        self, give_class_tree: tuple[VerbClass, Member, Member, Member]
+    ) -> None:
         """Test finding member by VerbNet key."""
-        member1 = Member(name="give", verbnet_key="give#1")
-        member2 = Member(name="donate", verbnet_key="donate#1")
-        member3 = Member(name="grant", verbnet_key="grant#1")
-
-        subclass = VerbClass(
-            id="give-13.1-1", members=[member3], themroles=[], frames=[], subclasses=[]
-        )
-        parent = VerbClass(
-            id="give-13.1",
-            members=[member1, member2],
-            themroles=[],
-            frames=[],
-            subclasses=[subclass],
-        )
+        parent, member1, _, member3 = give_class_tree
 
         # Find in parent
         found = parent.get_member_by_key("give#1")
@@ -19,209 +19,283 @@ from glazing.verbnet.models import (
 )
 from glazing.verbnet.search import VerbNetSearch
 
-
-class TestVerbNetSearch:
-    """Tests for VerbNetSearch class."""
-
-    @pytest.fixture
-    def sample_classes(self):
-        """Create sample verb classes for testing."""
-        # Create give-13.1 class
-        give_class = VerbClass(
-            id="give-13.1",
-            members=[
-                Member(name="give", verbnet_key="give#2"),
-                Member(name="hand", verbnet_key="hand#1"),
-                Member(name="pass", verbnet_key="pass#4"),
-            ],
-            themroles=[
-                ThematicRole(
-                    type="Agent",
-                    sel_restrictions=SelectionalRestrictions(
-                        logic=None, restrictions=[SelectionalRestriction(value="+", type="animate")]
-                    ),
-                ),
-                ThematicRole(
-                    type="Theme",
-                    sel_restrictions=SelectionalRestrictions(
-                        logic=None,
-                        restrictions=[SelectionalRestriction(value="+", type="concrete")],
-                    ),
-                ),
-                ThematicRole(
-                    type="Recipient",
-                    sel_restrictions=SelectionalRestrictions(
-                        logic=None, restrictions=[SelectionalRestriction(value="+", type="animate")]
+# Sample verb classes, built once at import and shared read-only by the tests.
+# The literals are known to be valid, so validation is skipped here and
+# exercised once in test_init_with_classes.
+
+# Transfer class
+GIVE_CLASS = VerbClass.model_construct(
+    id="give-13.1",
+    members=[
+        Member.model_construct(name="give", verbnet_key="give#2"),
+        Member.model_construct(name="hand", verbnet_key="hand#1"),
+        Member.model_construct(name="pass", verbnet_key="pass#4"),
+    ],
+    themroles=[
+        ThematicRole.model_construct(
+            type="Agent",
+            sel_restrictions=SelectionalRestrictions.model_construct(
+                logic=None,
+                restrictions=[SelectionalRestriction.model_construct(value="+", type="animate")],
+            ),
+        ),
+        ThematicRole.model_construct(
+            type="Theme",
+            sel_restrictions=SelectionalRestrictions.model_construct(
+                logic=None,
+                restrictions=[SelectionalRestriction.model_construct(value="+", type="concrete")],
+            ),
+        ),
+        ThematicRole.model_construct(
+            type="Recipient",
+            sel_restrictions=SelectionalRestrictions.model_construct(
+                logic=None,
+                restrictions=[SelectionalRestriction.model_construct(value="+", type="animate")],
+            ),
+        ),
+    ],
+    frames=[
+        VNFrame.model_construct(
+            description=FrameDescription.model_construct(
+                description_number="0.1", primary="NP V NP NP", secondary="Dative"
+            ),
+            examples=[Example.model_construct(text="John gave Mary the book")],
+            syntax=Syntax.model_construct(
+                elements=[
+                    SyntaxElement.model_construct(pos="NP", value="Agent"),
+                    SyntaxElement.model_construct(pos="VERB"),
+                    SyntaxElement.model_construct(pos="NP", value="Recipient"),
+                    SyntaxElement.model_construct(pos="NP", value="Theme"),
+                ]
+            ),
+            semantics=Semantics.model_construct(
+                predicates=[
+                    Predicate.model_construct(
+                        value="transfer",
+                        args=[
+                            PredicateArgument.model_construct(type="Event", value="e1"),
+                            PredicateArgument.model_construct(type="ThemRole", value="Agent"),
+                            PredicateArgument.model_construct(type="ThemRole", value="Theme"),
+                            PredicateArgument.model_construct(type="ThemRole", value="Recipient"),
+                        ],
                     ),
-                ),
-            ],
-            frames=[
-                VNFrame(
-                    description=FrameDescription(
-                        description_number="0.1", primary="NP V NP NP", secondary="Dative"
+                    Predicate.model_construct(
+                        value="has_possession",
+                        args=[
+                            PredicateArgument.model_construct(type="Event", value="e2"),
+                            PredicateArgument.model_construct(type="ThemRole", value="Recipient"),
+                            PredicateArgument.model_construct(type="ThemRole", value="Theme"),
+                        ],
                     ),
-                    examples=[Example(text="John gave Mary the book")],
-                    syntax=Syntax(
-                        elements=[
-                            SyntaxElement(pos="NP", value="Agent"),
-                            SyntaxElement(pos="VERB"),
-                            SyntaxElement(pos="NP", value="Recipient"),
-                            SyntaxElement(pos="NP", value="Theme"),
-                        ]
-                    ),
-                    semantics=Semantics(
-                        predicates=[
-                            Predicate(
-                                value="transfer",
-                                args=[
-                                    PredicateArgument(type="Event", value="e1"),
-                                    PredicateArgument(type="ThemRole", value="Agent"),
-                                    PredicateArgument(type="ThemRole", value="Theme"),
-                                    PredicateArgument(type="ThemRole", value="Recipient"),
-                                ],
-                            ),
-                            Predicate(
-                                value="has_possession",
-                                args=[
-                                    PredicateArgument(type="Event", value="e2"),
-                                    PredicateArgument(type="ThemRole", value="Recipient"),
-                                    PredicateArgument(type="ThemRole", value="Theme"),
-                                ],
-                            ),
-                        ]
-                    ),
-                )
-            ],
-            subclasses=[],
+                ]
+            ),
         )
+    ],
+    subclasses=[],
+)
 
-        # Create run-51.3.2 class (motion)
-        run_class = VerbClass(
-            id="run-51.3.2",
-            members=[
-                Member(name="run", verbnet_key="run#1"),
-                Member(name="walk", verbnet_key="walk#1"),
-                Member(name="jog", verbnet_key="jog#1"),
-            ],
-            themroles=[
-                ThematicRole(
-                    type="Agent",
-                    sel_restrictions=SelectionalRestrictions(
-                        logic=None, restrictions=[SelectionalRestriction(value="+", type="animate")]
-                    ),
-                ),
-                ThematicRole(type="Path", sel_restrictions=None),
-                ThematicRole(
-                    type="Location",
-                    sel_restrictions=SelectionalRestrictions(
-                        logic=None,
-                        restrictions=[SelectionalRestriction(value="+", type="location")],
+# Motion class
+RUN_CLASS = VerbClass.model_construct(
+    id="run-51.3.2",
+    members=[
+        Member.model_construct(name="run", verbnet_key="run#1"),
+        Member.model_construct(name="walk", verbnet_key="walk#1"),
+        Member.model_construct(name="jog", verbnet_key="jog#1"),
+    ],
+    themroles=[
+        ThematicRole.model_construct(
+            type="Agent",
+            sel_restrictions=SelectionalRestrictions.model_construct(
+                logic=None,
+                restrictions=[SelectionalRestriction.model_construct(value="+", type="animate")],
+            ),
+        ),
+        ThematicRole.model_construct(type="Path", sel_restrictions=None),
+        ThematicRole.model_construct(
+            type="Location",
+            sel_restrictions=SelectionalRestrictions.model_construct(
+                logic=None,
+                restrictions=[SelectionalRestriction.model_construct(value="+", type="location")],
+            ),
+        ),
+    ],
+    frames=[
+        VNFrame.model_construct(
+            description=FrameDescription.model_construct(
+                description_number="0.1", primary="NP V PP", secondary="Basic Intransitive"
+            ),
+            examples=[Example.model_construct(text="John ran to the store")],
+            syntax=Syntax.model_construct(
+                elements=[
+                    SyntaxElement.model_construct(pos="NP", value="Agent"),
+                    SyntaxElement.model_construct(pos="VERB"),
+                    SyntaxElement.model_construct(pos="PREP", value="to"),
+                    SyntaxElement.model_construct(pos="NP", value="Location"),
+                ]
+            ),
+            semantics=Semantics.model_construct(
+                predicates=[
+                    Predicate.model_construct(
+                        value="motion",
+                        args=[
+                            PredicateArgument.model_construct(type="Event", value="e1"),
+                            PredicateArgument.model_construct(type="ThemRole", value="Agent"),
+                        ],
                     ),
-                ),
-            ],
-            frames=[
-                VNFrame(
-                    description=FrameDescription(
-                        description_number="0.1", primary="NP V PP", secondary="Basic Intransitive"
+                    Predicate.model_construct(
+                        value="path",
+                        args=[
+                            PredicateArgument.model_construct(type="Event", value="e2"),
+                            PredicateArgument.model_construct(type="ThemRole", value="Agent"),
+                            PredicateArgument.model_construct(type="ThemRole", value="Path"),
+                        ],
                     ),
-                    examples=[Example(text="John ran to the store")],
-                    syntax=Syntax(
-                        elements=[
-                            SyntaxElement(pos="NP", value="Agent"),
-                            SyntaxElement(pos="VERB"),
-                            SyntaxElement(pos="PREP", value="to"),
-                            SyntaxElement(pos="NP", value="Location"),
-                        ]
-                    ),
-                    semantics=Semantics(
-                        predicates=[
-                            Predicate(
-                                value="motion",
-                                args=[
-                                    PredicateArgument(type="Event", value="e1"),
-                                    PredicateArgument(type="ThemRole", value="Agent"),
-                                ],
-                            ),
-                            Predicate(
-                                value="path",
-                                args=[
-                                    PredicateArgument(type="Event", value="e2"),
-                                    PredicateArgument(type="ThemRole", value="Agent"),
-                                    PredicateArgument(type="ThemRole", value="Path"),
-                                ],
-                            ),
-                        ]
-                    ),
-                )
-            ],
-            subclasses=[],
+                ]
+            ),
         )
+    ],
+    subclasses=[],
+)
 
-        # Create break-45.1 class (change of state)
-        break_class = VerbClass(
-            id="break-45.1",
-            members=[
-                Member(name="break", verbnet_key="break#1"),
-                Member(name="shatter", verbnet_key="shatter#1"),
-            ],
-            themroles=[
-                ThematicRole(
-                    type="Agent",
-                    sel_restrictions=SelectionalRestrictions(
-                        logic=None, restrictions=[SelectionalRestriction(value="+", type="animate")]
+# Change of state class
+BREAK_CLASS = VerbClass.model_construct(
+    id="break-45.1",
+    members=[
+        Member.model_construct(name="break", verbnet_key="break#1"),
+        Member.model_construct(name="shatter", verbnet_key="shatter#1"),
+    ],
+    themroles=[
+        ThematicRole.model_construct(
+            type="Agent",
+            sel_restrictions=SelectionalRestrictions.model_construct(
+                logic=None,
+                restrictions=[SelectionalRestriction.model_construct(value="+", type="animate")],
+            ),
+        ),
+        ThematicRole.model_construct(
+            type="Patient",
+            sel_restrictions=SelectionalRestrictions.model_construct(
+                logic=None,
+                restrictions=[SelectionalRestriction.model_construct(value="+", type="solid")],
+            ),
+        ),
+        ThematicRole.model_construct(
+            type="Instrument",
+            sel_restrictions=SelectionalRestrictions.model_construct(
+                logic=None,
+                restrictions=[SelectionalRestriction.model_construct(value="+", type="concrete")],
+            ),
+        ),
+    ],
+    frames=[
+        VNFrame.model_construct(
+            description=FrameDescription.model_construct(
+                description_number="0.1", primary="NP V NP", secondary="Transitive"
+            ),
+            examples=[Example.model_construct(text="John broke the window")],
+            syntax=Syntax.model_construct(
+                elements=[
+                    SyntaxElement.model_construct(pos="NP", value="Agent"),
+                    SyntaxElement.model_construct(pos="VERB"),
+                    SyntaxElement.model_construct(pos="NP", value="Patient"),
+                ]
+            ),
+            semantics=Semantics.model_construct(
+                predicates=[
+                    Predicate.model_construct(
+                        value="cause",
+                        args=[
+                            PredicateArgument.model_construct(type="Event", value="e1"),
+                            PredicateArgument.model_construct(type="ThemRole", value="Agent"),
+                        ],
                     ),
-                ),
-                ThematicRole(
-                    type="Patient",
-                    sel_restrictions=SelectionalRestrictions(
-                        logic=None, restrictions=[SelectionalRestriction(value="+", type="solid")]
+                    Predicate.model_construct(
+                        value="change",
+                        args=[
+                            PredicateArgument.model_construct(type="Event", value="e2"),
+                            PredicateArgument.model_construct(type="ThemRole", value="Patient"),
+                        ],
                     ),
-                ),
-                ThematicRole(
-                    type="Instrument",
-                    sel_restrictions=SelectionalRestrictions(
-                        logic=None,
-                        restrictions=[SelectionalRestriction(value="+", type="concrete")],
-                    ),
-                ),
-            ],
-            frames=[
-                VNFrame(
-                    description=FrameDescription(
-                        description_number="0.1", primary="NP V NP", secondary="Transitive"
-                    ),
-                    examples=[Example(text="John broke the window")],
-                    syntax=Syntax(
-                        elements=[
-                            SyntaxElement(pos="NP", value="Agent"),
-                            SyntaxElement(pos="VERB"),
-                            SyntaxElement(pos="NP", value="Patient"),
-                        ]
-                    ),
-                    semantics=Semantics(
-                        predicates=[
-                            Predicate(
-                                value="cause",
-                                args=[
-                                    PredicateArgument(type="Event", value="e1"),
-                                    PredicateArgument(type="ThemRole", value="Agent"),
-                                ],
-                            ),
-                            Predicate(
-                                value="change",
-                                args=[
-                                    PredicateArgument(type="Event", value="e2"),
-                                    PredicateArgument(type="ThemRole", value="Patient"),
-                                ],
-                            ),
-                        ]
-                    ),
-                )
-            ],
-            subclasses=[],
+                ]
+            ),
         )
+    ],
+    subclasses=[],
+)
+
+# Expected class IDs for queries matching every sample class
+ALL_CLASS_IDS = ["break-45.1", "give-13.1", "run-51.3.2"]
+
+# Unique predicates, roles and member lemmas across the sample classes
+ALL_PREDICATES = {"cause", "change", "has_possession", "motion", "path", "transfer"}
+ALL_ROLES = {"Agent", "Instrument", "Location", "Path", "Patient", "Recipient", "Theme"}
+ALL_MEMBERS = {"break", "give", "hand", "jog", "pass", "run", "shatter", "walk"}
+
+# (method, args, kwargs, expected class IDs) for single-criterion queries
+BY_QUERY_CASES = [
+    # Thematic roles
+    ("by_themroles", (["Agent", "Theme"],), {}, ["give-13.1"]),
+    ("by_themroles", (["Agent"],), {}, ALL_CLASS_IDS),
+    ("by_themroles", (["Agent", "Path", "Location"],), {"only": True}, ["run-51.3.2"]),
+    ("by_themroles", (["NonExistent"],), {}, []),
+    ("by_themroles", (["Agent", "NonExistent"],), {}, []),
+    # Syntactic patterns
+    ("by_syntax", ("NP VERB NP NP",), {}, ["give-13.1"]),
+    ("by_syntax", ("NP VERB NP",), {}, ["break-45.1"]),
+    ("by_syntax", ("NP VERB PREP NP",), {}, ["run-51.3.2"]),
+    ("by_syntax", ("NP V PP",), {}, ["run-51.3.2"]),
+    ("by_syntax", ("NP NP NP",), {}, []),
+    # Semantic predicates
+    ("by_predicate", ("transfer",), {}, ["give-13.1"]),
+    ("by_predicate", ("motion",), {}, ["run-51.3.2"]),
+    ("by_predicate", ("cause",), {}, ["break-45.1"]),
+    ("by_predicate", ("nonexistent",), {}, []),
+    ("by_predicates", (["transfer", "has_possession"],), {"require_all": True}, ["give-13.1"]),
+    ("by_predicates", (["transfer", "nonexistent"],), {"require_all": True}, []),
+    ("by_predicates", (["motion", "path"],), {"require_all": False}, ["run-51.3.2"]),
+    (
+        "by_predicates",
+        (["cause", "transfer"],),
+        {"require_all": False},
+        ["break-45.1", "give-13.1"],
+    ),
+    # Selectional restrictions
+    ("by_restriction", ("Agent", "animate", "+"), {}, ALL_CLASS_IDS),
+    ("by_restriction", ("Theme", "concrete", "+"), {}, ["give-13.1"]),
+    ("by_restriction", ("Patient", "solid", "+"), {}, ["break-45.1"]),
+    ("by_restriction", ("Location", "location", "+"), {}, ["run-51.3.2"]),
+    # Members
+    ("by_members", (["give"],), {}, ["give-13.1"]),
+    ("by_members", (["run", "walk"],), {}, ["run-51.3.2"]),
+    ("by_members", (["break"],), {}, ["break-45.1"]),
+    ("by_members", (["give", "break"],), {}, ["break-45.1", "give-13.1"]),
+    ("by_members", (["nonexistent"],), {}, []),
+]
+
+
+def _case_id(case: tuple) -> str:
+    """Build a readable test ID from the method name and its arguments."""
+    method, args, kwargs, _ = case
+    parts = ["+".join(arg) if isinstance(arg, list) else arg for arg in args]
+    parts += [f"{key}={value}" for key, value in kwargs.items()]
+    return "-".join([method, *parts])
+
+
+BY_QUERY_IDS = [_case_id(case) for case in BY_QUERY_CASES]
 
-        return [give_class, run_class, break_class]
+
+class TestVerbNetSearch:
+    """Tests for VerbNetSearch class."""
+
+    @pytest.fixture(scope="module")
+    def sample_classes(self):
+        """Provide the sample verb classes for testing."""
+        return [GIVE_CLASS, RUN_CLASS, BREAK_CLASS]
+
+    @pytest.fixture(scope="module")
+    def built_search(self, sample_classes):
+        """Create a search index over the sample classes, shared by read-only tests."""
+        return VerbNetSearch(sample_classes)
 
     def test_init_empty(self):
         """Test initialization with empty search."""
@@ -233,7 +307,8 @@ class TestVerbNetSearch:
 
     def test_init_with_classes(self, sample_classes):
         """Test initialization with classes."""
-        search = VerbNetSearch(sample_classes)
+        validated = [VerbClass.model_validate(c.model_dump()) for c in sample_classes]
+        search = VerbNetSearch(validated)
         stats = search.get_statistics()
         assert stats["class_count"] == 3
         assert (
@@ -252,6 +327,26 @@ class TestVerbNetSearch:
         assert search.get_statistics()["class_count"] == 1
         assert "give" in search.get_all_members()
 
+    def test_statistics_track_added_classes(self, sample_classes):
+        """Test that totals are updated as classes are added."""
+        search = VerbNetSearch()
+        for count, verb_class in enumerate(sample_classes, start=1):
+            search.add_class(verb_class)
+            stats = search.get_statistics()
+            assert stats["class_count"] == count
+            assert stats["total_members"] == sum(len(c.members) for c in sample_classes[:count])
+            assert stats["total_frames"] == sum(len(c.frames) for c in sample_classes[:count])
+
+    def test_lazy_indexes_rebuilt_after_add(self, sample_classes):
+        """Test that lazily built indexes see classes added after a query."""
+        search = VerbNetSearch([sample_classes[0]])
+        assert [c.id for c in search.by_restriction("Patient", "solid", "+")] == []
+        assert [c.id for c in search.by_syntax("NP V NP")] == []
+
+        search.add_class(sample_classes[2])
+        assert [c.id for c in search.by_restriction("Patient", "solid", "+")] == ["break-45.1"]
+        assert [c.id for c in search.by_syntax("NP V NP")] == ["break-45.1"]
+
     def test_add_duplicate_class(self, sample_classes):
         """Test adding duplicate class raises error."""
         search = VerbNetSearch()
@@ -260,148 +355,17 @@ class TestVerbNetSearch:
         with pytest.raises(ValueError, match="already exists"):
             search.add_class(sample_classes[0])
 
-    def test_by_themroles(self, sample_classes):
-        """Test finding classes by thematic roles."""
-        search = VerbNetSearch(sample_classes)
-
-        # Find classes with Agent and Theme
-        results = search.by_themroles(["Agent", "Theme"])
-        assert len(results) == 1
-        assert results[0].id == "give-13.1"
-
-        # Find classes with Agent only
-        results = search.by_themroles(["Agent"])
-        assert len(results) == 3  # All have Agent
+    @pytest.mark.parametrize(
+        ("method", "args", "kwargs", "expected_ids"), BY_QUERY_CASES, ids=BY_QUERY_IDS
+    )
+    def test_by_queries(self, built_search, method, args, kwargs, expected_ids):
+        """Test single-criterion by_* queries return the expected classes in ID order."""
+        results = getattr(built_search, method)(*args, **kwargs)
+        assert [c.id for c in results] == expected_ids
 
-        # Find classes with exactly Agent, Path, Location
-        results = search.by_themroles(["Agent", "Path", "Location"], only=True)
-        assert len(results) == 1
-        assert results[0].id == "run-51.3.2"
-
-        # Find classes with non-existent role
-        results = search.by_themroles(["NonExistent"])
-        assert len(results) == 0
-
-    def test_by_syntax(self, sample_classes):
-        """Test finding classes by syntactic patterns."""
-        search = VerbNetSearch(sample_classes)
-
-        # Find ditransitive pattern
-        results = search.by_syntax("NP VERB NP NP")
-        assert len(results) == 1
-        assert results[0].id == "give-13.1"
-
-        # Find transitive pattern
-        results = search.by_syntax("NP VERB NP")
-        assert len(results) == 1
-        assert results[0].id == "break-45.1"
-
-        # Find PP pattern
-        results = search.by_syntax("NP VERB PREP NP")
-        assert len(results) == 1
-        assert results[0].id == "run-51.3.2"
-
-        # Non-existent pattern
-        results = search.by_syntax("NP NP NP")
-        assert len(results) == 0
-
-    def test_by_predicate(self, sample_classes):
-        """Test finding classes by semantic predicate."""
-        search = VerbNetSearch(sample_classes)
-
-        # Find classes with "transfer" predicate
-        results = search.by_predicate("transfer")
-        assert len(results) == 1
-        assert results[0].id == "give-13.1"
-
-        # Find classes with "motion" predicate
-        results = search.by_predicate("motion")
-        assert len(results) == 1
-        assert results[0].id == "run-51.3.2"
-
-        # Find classes with "cause" predicate
-        results = search.by_predicate("cause")
-        assert len(results) == 1
-        assert results[0].id == "break-45.1"
-
-        # Non-existent predicate
-        results = search.by_predicate("nonexistent")
-        assert len(results) == 0
-
-    def test_by_predicates(self, sample_classes):
-        """Test finding classes by multiple predicates."""
-        search = VerbNetSearch(sample_classes)
-
-        # Find classes with both "transfer" and "has_possession"
-        results = search.by_predicates(["transfer", "has_possession"], require_all=True)
-        assert len(results) == 1
-        assert results[0].id == "give-13.1"
-
-        # Find classes with either "motion" or "path"
-        results = search.by_predicates(["motion", "path"], require_all=False)
-        assert len(results) == 1
-        assert results[0].id == "run-51.3.2"
-
-        # Find classes with either "cause" or "transfer"
-        results = search.by_predicates(["cause", "transfer"], require_all=False)
-        assert len(results) == 2
-        class_ids = [c.id for c in results]
-        assert "break-45.1" in class_ids
-        assert "give-13.1" in class_ids
-
-    def test_by_restriction(self, sample_classes):
-        """Test finding classes by selectional restrictions."""
-        search = VerbNetSearch(sample_classes)
-
-        # Find classes with animate Agent
-        results = search.by_restriction("Agent", "animate", "+")
-        assert len(results) == 3  # All have animate Agent
-
-        # Find classes with concrete Theme
-        results = search.by_restriction("Theme", "concrete", "+")
-        assert len(results) == 1
-        assert results[0].id == "give-13.1"
-
-        # Find classes with solid Patient
-        results = search.by_restriction("Patient", "solid", "+")
-        assert len(results) == 1
-        assert results[0].id == "break-45.1"
-
-        # Find classes with location Location
-        results = search.by_restriction("Location", "location", "+")
-        assert len(results) == 1
-        assert results[0].id == "run-51.3.2"
-
-    def test_by_members(self, sample_classes):
-        """Test finding classes by member verbs."""
-        search = VerbNetSearch(sample_classes)
-
-        # Find classes with "give"
-        results = search.by_members(["give"])
-        assert len(results) == 1
-        assert results[0].id == "give-13.1"
-
-        # Find classes with "run" or "walk"
-        results = search.by_members(["run", "walk"])
-        assert len(results) == 1
-        assert results[0].id == "run-51.3.2"
-
-        # Find classes with "break"
-        results = search.by_members(["break"])
-        assert len(results) == 1
-        assert results[0].id == "break-45.1"
-
-        # Find classes with multiple members
-        results = search.by_members(["give", "break"])
-        assert len(results) == 2
-
-        # Non-existent member
-        results = search.by_members(["nonexistent"])
-        assert len(results) == 0
-
-    def test_complex_search(self, sample_classes):
+    def test_complex_search(self, built_search):
         """Test multi-criteria search."""
-        search = VerbNetSearch(sample_classes)
+        search = built_search
 
         # Search for transfer classes with Agent, Theme, Recipient
         results = search.complex_search(
@@ -433,60 +397,55 @@ class TestVerbNetSearch:
         assert len(results) == 1
         assert results[0].id == "break-45.1"
 
-    def test_get_all_predicates(self, sample_classes):
-        """Test getting all predicates."""
+    def test_complex_search_leaves_restriction_index_intact(self, sample_classes):
+        """Test multi-restriction queries do not narrow later restriction lookups."""
         search = VerbNetSearch(sample_classes)
+        before = [c.id for c in search.by_restriction("Agent", "animate", "+")]
+        assert len(before) == 3
+
+        search.complex_search(
+            restrictions={"Agent": [("+", "animate")], "Theme": [("+", "concrete")]}
+        )
+        search.complex_search(restrictions={"Agent": [("+", "animate"), ("+", "concrete")]})
+
+        assert [c.id for c in search.by_restriction("Agent", "animate", "+")] == before
+
+    def test_get_all_predicates(self, built_search):
+        """Test getting all predicates."""
+        search = built_search
 
         predicates = search.get_all_predicates()
         assert len(predicates) == 6
-        assert "cause" in predicates
-        assert "change" in predicates
-        assert "has_possession" in predicates
-        assert "motion" in predicates
-        assert "path" in predicates
-        assert "transfer" in predicates
+        assert set(predicates) == ALL_PREDICATES
 
         # Check sorted
         assert predicates == sorted(predicates)
 
-    def test_get_all_roles(self, sample_classes):
+    def test_get_all_roles(self, built_search):
         """Test getting all thematic roles."""
-        search = VerbNetSearch(sample_classes)
+        search = built_search
 
         roles = search.get_all_roles()
         assert len(roles) == 7
-        assert "Agent" in roles
-        assert "Instrument" in roles
-        assert "Location" in roles
-        assert "Path" in roles
-        assert "Patient" in roles
-        assert "Recipient" in roles
-        assert "Theme" in roles
+        assert set(roles) == ALL_ROLES
 
         # Check sorted
         assert roles == sorted(roles)
 
-    def test_get_all_members(self, sample_classes):
+    def test_get_all_members(self, built_search):
         """Test getting all member lemmas."""
-        search = VerbNetSearch(sample_classes)
+        search = built_search
 
         members = search.get_all_members()
         assert len(members) == 8
-        assert "break" in members
-        assert "give" in members
-        assert "hand" in members
-        assert "jog" in members
-        assert "pass" in members
-        assert "run" in members
-        assert "shatter" in members
-        assert "walk" in members
+        assert set(members) == ALL_MEMBERS
 
         # Check sorted
         assert members == sorted(members)
 
-    def test_get_statistics(self, sample_classes):
+    def test_get_statistics(self, built_search):
         """Test getting search statistics."""
-        search = VerbNetSearch(sample_classes)
+        search = built_search
 
         stats = search.get_statistics()
         assert stats["class_count"] == 3
@@ -6,10 +6,19 @@ including optional roles, indexed roles, PP roles, and verb-specific roles.
 
 from __future__ import annotations
 
+from collections.abc import Iterator
+
 import pytest
+from pydantic import ValidationError
 
+from glazing.symbols import BaseSymbol
 from glazing.verbnet.models import ThematicRole
 from glazing.verbnet.symbol_parser import (
+    ROLE_INDEXED,
+    ROLE_OPTIONAL,
+    ROLE_PP,
+    ROLE_VERB_SPECIFIC,
+    classify_role,
     extract_role_base,
     filter_roles_by_properties,
     is_indexed_role,
@@ -19,12 +28,73 @@ from glazing.verbnet.symbol_parser import (
     normalize_role_for_matching,
     parse_frame_element,
     parse_thematic_role,
+    parse_thematic_roles,
+    parse_verb_class,
 )
 
+# (raw, base, optional, index, verb_specific) for each combination of role modifiers
+ROLE_COMBINATIONS: list[tuple[str, str, bool, str | None, bool]] = [
+    ("Agent", "Agent", False, None, False),
+    ("?Agent", "Agent", True, None, False),
+    ("Agent_I", "Agent", False, "I", False),
+    ("?Agent_I", "Agent", True, "I", False),
+    ("Theme_J", "Theme", False, "J", False),
+    ("?Theme_J", "Theme", True, "J", False),
+    ("V_State", "State", False, None, True),
+    ("?V_State", "State", True, None, True),
+]
+
+
+class TestParseVerbClass:
+    """Test parsing of verb class IDs."""
+
+    def test_subclass_id(self) -> None:
+        """Test parsing a subclass ID into its parts."""
+        result = parse_verb_class("give-13.1-1")
+        assert result.base_name == "give"
+        assert result.class_number == "13.1-1"
+        assert result.parent_class == "give-13.1"
+
+    def test_frozen(self) -> None:
+        """Test that cached results cannot be modified."""
+        result = parse_verb_class("give-13.1")
+        with pytest.raises(ValidationError):
+            result.base_name = "take"
+
 
 class TestParseThematicRole:
     """Test parsing of thematic role values."""
 
+    @pytest.fixture(autouse=True)
+    def clear_cache(self) -> Iterator[None]:
+        """Start each test with an empty parse cache."""
+        parse_thematic_role.cache_clear()
+        yield
+        parse_thematic_role.cache_clear()
+
+    def test_cached_result_shared(self) -> None:
+        """Test that repeated parses return the same frozen result."""
+        result = parse_thematic_role("?Theme_I")
+        assert parse_thematic_role("?Theme_I") is result
+        assert parse_thematic_role.cache_info().hits == 1
+        with pytest.raises(ValidationError):
+            result.base_role = "Agent"
+
+    def test_canonical_roles_precomputed(self) -> None:
+        """Test that canonical roles are served from the import-time table."""
+        result = parse_thematic_role("?Co-Agent_J")
+        parse_thematic_role.cache_clear()
+        assert parse_thematic_role("?Co-Agent_J") is result
+        assert result.base_role == "Co-Agent"
+        assert result.is_optional is True
+        assert result.index == "J"
+
+    def test_results_hashable(self) -> None:
+        """Test that parsed roles can be used as set members and dict keys."""
+        roles = {parse_thematic_role("Theme_I"), parse_thematic_role("V_State")}
+        assert parse_thematic_role("Theme_I") in roles
+        assert len(roles) == 2
+
     def test_simple_role(self) -> None:
         """Test parsing simple thematic role."""
         result = parse_thematic_role("Agent")
@@ -90,25 +160,43 @@ class TestParseThematicRole:
         result = parse_thematic_role("Initial_Location")
         assert result.base_role == "Initial_Location"
 
-    def test_all_role_combinations(self) -> None:
+    @pytest.mark.parametrize(
+        ("raw", "base", "optional", "index", "verb_specific"),
+        ROLE_COMBINATIONS,
+        ids=[case[0] for case in ROLE_COMBINATIONS],
+    )
+    def test_all_role_combinations(
+        self, raw: str, base: str, optional: bool, index: str | None, verb_specific: bool
+    ) -> None:
         """Test various combinations of role modifiers."""
-        test_cases = [
-            ("Agent", "Agent", False, None, False),
-            ("?Agent", "Agent", True, None, False),
-            ("Agent_I", "Agent", False, "I", False),
-            ("?Agent_I", "Agent", True, "I", False),
-            ("Theme_J", "Theme", False, "J", False),
-            ("?Theme_J", "Theme", True, "J", False),
-            ("V_State", "State", False, None, True),
-            ("?V_State", "State", True, None, True),
+        result = parse_thematic_role(raw)
+        assert result.base_role == base
+        assert result.is_optional == optional
+        assert result.index == index
+        assert result.is_verb_specific == verb_specific
+
+
+class TestParseThematicRoles:
+    """Test batch parsing of thematic role values."""
+
+    def test_batch_matches_single(self) -> None:
+        """Test that the batch API parses every combination in one call."""
+        raws = [case[0] for case in ROLE_COMBINATIONS]
+        results = parse_thematic_roles(raws)
+        assert [r.raw_string for r in results] == raws
+        assert [(r.base_role, r.is_optional, r.index, r.is_verb_specific) for r in results] == [
+            case[1:] for case in ROLE_COMBINATIONS
         ]
 
-        for raw, base, optional, index, verb_specific in test_cases:
-            result = parse_thematic_role(raw)
-            assert result.base_role == base
-            assert result.is_optional == optional
-            assert result.index == index
-            assert result.is_verb_specific == verb_specific
+    def test_batch_accepts_generator(self) -> None:
+        """Test that any iterable of roles is accepted."""
+        results = parse_thematic_roles(r for r in ("Theme_J", "V_Final_State"))
+        assert [r.base_role for r in results] == ["Theme", "Final_State"]
+
+    def test_batch_empty_base(self) -> None:
+        """Test that an invalid role in the batch raises."""
+        with pytest.raises(ValueError, match="Empty base role after processing"):
+            parse_thematic_roles(["Agent", "?"])
 
 
 class TestParseFrameElement:
@@ -154,10 +242,24 @@ class TestParseFrameElement:
         result = parse_frame_element("ADV")
         assert result.base_role == "ADV"
 
+        # Prefix must include the dot
+        result = parse_frame_element("PPlocation")
+        assert result.base_role == "PPlocation"
+        assert result.pp_type is None
+        assert result.role_type == "thematic"
+
 
 class TestBooleanCheckers:
     """Test boolean checking functions."""
 
+    def test_classify_role(self) -> None:
+        """Test that all role flags are computed together."""
+        assert classify_role("Agent") == 0
+        assert classify_role("?Theme_I") == ROLE_OPTIONAL | ROLE_INDEXED
+        assert classify_role("?V_State") == ROLE_OPTIONAL | ROLE_VERB_SPECIFIC
+        assert classify_role("V_Final_State_J") == ROLE_VERB_SPECIFIC | ROLE_INDEXED
+        assert classify_role("PP.location") == ROLE_PP
+
     def test_is_optional_role(self) -> None:
         """Test checking if role is optional."""
         assert is_optional_role("?Agent") is True
@@ -173,6 +275,9 @@ class TestBooleanCheckers:
         assert is_indexed_role("Theme") is False
         assert is_indexed_role("?Theme_I") is True
         assert is_indexed_role("?Agent") is False
+        # Index must be a suffix, not an "_i" inside the name
+        assert is_indexed_role("Patient_item") is False
+        assert is_indexed_role("Patient_i") is True
 
     def test_is_pp_element(self) -> None:
         """Test checking if element is a PP element."""
@@ -214,6 +319,19 @@ class TestExtractRoleBase:
         assert extract_role_base("V_State") == "State"
         assert extract_role_base("?V_Final_State") == "Final_State"
 
+    @pytest.mark.parametrize("role", ["?", "V_", "?V__I"])
+    def test_extract_base_empty(self, role: str) -> None:
+        """Test that roles with only modifiers are rejected like in the parser."""
+        with pytest.raises(ValueError, match="Empty base role after processing"):
+            extract_role_base(role)
+
+    def test_extract_base_interned(self) -> None:
+        """Test that equal bases from different roles share one object."""
+        assert extract_role_base("?Recipient_J") is extract_role_base("Recipient_I")
+        assert parse_thematic_role("?V_Final_State").base_role is extract_role_base(
+            "V_Final_State_I"
+        )
+
 
 class TestNormalizeRoleForMatching:
     """Test role normalization for fuzzy matching."""
@@ -244,32 +362,46 @@ class TestNormalizeRoleForMatching:
         """Test normalizing complex role names."""
         assert normalize_role_for_matching("Initial_Location") == "initial_location"
         assert normalize_role_for_matching("Co_Agent") == "co_agent"
+        assert normalize_role_for_matching("?Co-Agent_J") == "co_agent"
+        assert normalize_role_for_matching("Theme ") == "theme"
+
+    @pytest.mark.parametrize("separator", ["\t", "\n", "\r", "\f", "\v", " - "])
+    def test_normalize_matches_base_symbol(self, separator: str) -> None:
+        """Test every whitespace separator normalizes like BaseSymbol."""
+        role = f"Co{separator}Agent"
+        assert normalize_role_for_matching(role) == BaseSymbol.normalize_string(role)
+        assert normalize_role_for_matching(role) == "co_agent"
+
+    def test_normalize_empty_base(self) -> None:
+        """Test that roles normalizing to nothing are rejected."""
+        with pytest.raises(ValueError, match="normalizes to empty"):
+            normalize_role_for_matching("_")
+
+
+@pytest.fixture(scope="module")
+def roles() -> list[ThematicRole]:
+    """Create test thematic roles from real VerbNet data."""
+    # Using actual ThematicRole structure from VerbNet converted data
+    # From attend-107.4, build-26.1, give-13.1 classes
+    return [
+        ThematicRole(type="Agent"),
+        ThematicRole(type="Theme"),
+        ThematicRole(type="Patient_i"),
+        ThematicRole(type="Goal"),
+        ThematicRole(type="Recipient"),
+        ThematicRole(type="Theme_j"),
+    ]
 
 
 class TestFilterRolesByProperties:
     """Test filtering roles by their properties."""
 
-    def create_test_roles(self) -> list[ThematicRole]:
-        """Create test thematic roles from real VerbNet data."""
-        # Using actual ThematicRole structure from VerbNet converted data
-        # From attend-107.4, build-26.1, give-13.1 classes
-        return [
-            ThematicRole(type="Agent"),
-            ThematicRole(type="Theme"),
-            ThematicRole(type="Patient_i"),
-            ThematicRole(type="Goal"),
-            ThematicRole(type="Recipient"),
-            ThematicRole(type="Theme_j"),
-        ]
-
-    def test_filter_by_optional(self) -> None:
+    def test_filter_by_optional(self, roles: list[ThematicRole]) -> None:
         """Test filtering by optional property.
 
         Note: ThematicRole objects from converted data don't store optional status
         since ThematicRoleType literals don't include '?' prefixes.
         """
-        roles = self.create_test_roles()
-
         # Filter for optional roles - none will match since ThematicRole.type
         # can't contain '?'
         optional = filter_roles_by_properties(roles, optional=True)
@@ -279,23 +411,19 @@ class TestFilterRolesByProperties:
         required = filter_roles_by_properties(roles, optional=False)
         assert len(required) == 6
 
-    def test_filter_by_indexed(self) -> None:
+    def test_filter_by_indexed(self, roles: list[ThematicRole]) -> None:
         """Test filtering by indexed property."""
-        roles = self.create_test_roles()
-
         # Filter for indexed roles - Patient_i and Theme_j
         indexed = filter_roles_by_properties(roles, indexed=True)
         assert len(indexed) == 2
-        assert all("_i" in r.type or "_j" in r.type for r in indexed)
+        assert all(r.type.endswith(("_i", "_j")) for r in indexed)
 
         # Filter for non-indexed roles
         not_indexed = filter_roles_by_properties(roles, indexed=False)
         assert len(not_indexed) == 4
 
-    def test_filter_by_verb_specific(self) -> None:
+    def test_filter_by_verb_specific(self, roles: list[ThematicRole]) -> None:
         """Test filtering by verb-specific property."""
-        roles = self.create_test_roles()
-
         # Filter for verb-specific roles - none in our test set
         verb_specific = filter_roles_by_properties(roles, verb_specific=True)
         assert len(verb_specific) == 0
@@ -304,14 +432,12 @@ class TestFilterRolesByProperties:
         not_verb_specific = filter_roles_by_properties(roles, verb_specific=False)
         assert len(not_verb_specific) == 6
 
-    def test_filter_combined_properties(self) -> None:
+    def test_filter_combined_properties(self, roles: list[ThematicRole]) -> None:
         """Test filtering with multiple properties."""
-        roles = self.create_test_roles()
-
         # Non-optional AND indexed
         result = filter_roles_by_properties(roles, optional=False, indexed=True)
         assert len(result) == 2
-        assert all("_i" in r.type or "_j" in r.type for r in result)
+        assert all(r.type.endswith(("_i", "_j")) for r in result)
 
         # Non-optional AND non-verb-specific
         result = filter_roles_by_properties(roles, optional=False, verb_specific=False)
@@ -322,9 +448,8 @@ class TestFilterRolesByProperties:
         assert len(result) == 4
         assert {r.type for r in result} == {"Agent", "Theme", "Goal", "Recipient"}
 
-    def test_filter_no_criteria(self) -> None:
+    def test_filter_no_criteria(self, roles: list[ThematicRole]) -> None:
         """Test filtering with no criteria returns all roles."""
-        roles = self.create_test_roles()
         result = filter_roles_by_properties(roles)
         assert len(result) == len(roles)
 
@@ -334,30 +459,32 @@ class TestFilterRolesByProperties:
         assert result == []
 
 
+# (typo, correct) pairs of misspelled VerbNet roles
+ROLE_TYPOS: tuple[tuple[str, str], ...] = (
+    ("Agnet", "Agent"),  # Typo
+    ("Themme", "Theme"),  # Double letter
+    ("Pateint", "Patient"),  # Transposition
+    ("Destionation", "Destination"),  # Missing letter
+    ("Benificiary", "Beneficiary"),  # Common misspelling
+    ("Expereincer", "Experiencer"),  # Transposition
+    ("Insturment", "Instrument"),  # Missing letter
+    ("Soruce", "Source"),  # Transposition
+)
+
+
 class TestKnownTypos:
     """Test handling of known typos in VerbNet roles."""
 
-    def test_common_role_typos(self) -> None:
+    @pytest.mark.parametrize(("typo", "correct"), ROLE_TYPOS, ids=[t for t, _ in ROLE_TYPOS])
+    def test_common_role_typos(self, typo: str, correct: str) -> None:
         """Test that common typos can be handled."""
         # These would be used with fuzzy matching in practice
-        typos_to_correct = [
-            ("Agnet", "Agent"),  # Typo
-            ("Themme", "Theme"),  # Double letter
-            ("Pateint", "Patient"),  # Transposition
-            ("Destionation", "Destination"),  # Missing letter
-            ("Benificiary", "Beneficiary"),  # Common misspelling
-            ("Expereincer", "Experiencer"),  # Transposition
-            ("Insturment", "Instrument"),  # Missing letter
-            ("Soruce", "Source"),  # Transposition
-        ]
-
-        for typo, correct in typos_to_correct:
-            # Normalize both for matching
-            normalized_typo = normalize_role_for_matching(typo)
-            normalized_correct = normalize_role_for_matching(correct)
-            # In practice, fuzzy matching would find these similar
-            assert len(normalized_typo) > 0
-            assert len(normalized_correct) > 0
+        # Normalize both for matching
+        normalized_typo = normalize_role_for_matching(typo)
+        normalized_correct = normalize_role_for_matching(correct)
+        # In practice, fuzzy matching would find these similar
+        assert len(normalized_typo) > 0
+        assert len(normalized_correct) > 0
 
 
 class TestEdgeCases:
@@ -383,10 +510,9 @@ class TestEdgeCases:
         with pytest.raises(ValueError, match="Empty base role after processing"):
             parse_thematic_role("?")
 
-    def test_unusual_pp_types(self) -> None:
+    @pytest.mark.parametrize("pp_type", ["about", "with", "from", "to", "on", "in", "at", "for"])
+    def test_unusual_pp_types(self, pp_type: str) -> None:
         """Test PP elements with various type names."""
-        for pp_type in ["about", "with", "from", "to", "on", "in", "at", "for"]:
-            element = f"PP.{pp_type}"
-            result = parse_frame_element(element)
-            assert result.pp_type == pp_type
-            assert result.role_type == "pp"
+        result = parse_frame_element(f"PP.{pp_type}")
+        assert result.pp_type == pp_type
+        assert result.role_type == "pp"
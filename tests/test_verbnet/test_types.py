@@ -5,11 +5,21 @@ are correctly defined and can be used for validation.
 """
 
 import re
+from functools import cache
 from typing import get_args
 
+import pytest
+
 from glazing.verbnet.types import (
     DESCRIPTION_NUMBER_PATTERN,
+    FRAME_DESCRIPTION_ELEMENTS,
     PERCENTAGE_NOTATION_PATTERN,
+    PREDICATE_TYPES,
+    SECONDARY_PATTERNS,
+    SELECTIONAL_RESTRICTION_TYPES,
+    SYNTACTIC_RESTRICTION_TYPES,
+    THEMATIC_ROLE_TYPES,
+    THEMATIC_ROLE_VALUES,
     VERBNET_CLASS_PATTERN,
     VERBNET_KEY_PATTERN,
     ArgumentType,
@@ -32,14 +42,32 @@ from glazing.verbnet.types import (
     WordNetSense,
 )
 
+# Keep these sub-millisecond tests on one worker under --dist loadgroup
+pytestmark = pytest.mark.xdist_group("verbnet_types")
+
 
+@cache
 def get_type_args(type_alias):
     """Get arguments from a type alias created with Python 3.13+ type statement."""
-    if hasattr(type_alias, "__value__"):
-        # Python 3.13+ type statement
-        return get_args(type_alias.__value__)
-    # Regular type alias
-    return get_args(type_alias)
+    # Every VerbNet literal is declared with a type statement, which wraps the
+    # literal in __value__; the package requires Python 3.13, so no fallback
+    return get_args(type_alias.__value__)
+
+
+# Large VerbNet literals paired with the frozensets exported alongside them
+LITERAL_SET_CASES = [
+    pytest.param(ThematicRoleType, THEMATIC_ROLE_TYPES, id="ThematicRoleType"),
+    pytest.param(ThematicRoleValue, THEMATIC_ROLE_VALUES, id="ThematicRoleValue"),
+    pytest.param(
+        SelectionalRestrictionType, SELECTIONAL_RESTRICTION_TYPES, id="SelectionalRestrictionType"
+    ),
+    pytest.param(
+        SyntacticRestrictionType, SYNTACTIC_RESTRICTION_TYPES, id="SyntacticRestrictionType"
+    ),
+    pytest.param(PredicateType, PREDICATE_TYPES, id="PredicateType"),
+    pytest.param(FrameDescriptionElement, FRAME_DESCRIPTION_ELEMENTS, id="FrameDescriptionElement"),
+    pytest.param(SecondaryPattern, SECONDARY_PATTERNS, id="SecondaryPattern"),
+]
 
 
 class TestThematicRoleType:
@@ -52,30 +80,26 @@ class TestThematicRoleType:
 
     def test_core_roles_present(self) -> None:
         """Test that core thematic roles are present."""
-        roles = get_type_args(ThematicRoleType)
         core_roles = ["Agent", "Theme", "Patient", "Experiencer", "Beneficiary"]
-        for role in core_roles:
-            assert role in roles
+        missing = set(core_roles) - THEMATIC_ROLE_TYPES
+        assert not missing, f"missing: {missing}"
 
     def test_indexed_roles_present(self) -> None:
         """Test that indexed role variants are present."""
-        roles = get_type_args(ThematicRoleType)
         indexed_roles = ["Agent_i", "Agent_j", "Patient_i", "Patient_j", "Theme_i", "Theme_j"]
-        for role in indexed_roles:
-            assert role in roles
+        missing = set(indexed_roles) - THEMATIC_ROLE_TYPES
+        assert not missing, f"missing: {missing}"
 
     def test_co_roles_present(self) -> None:
         """Test that co-roles are present."""
-        roles = get_type_args(ThematicRoleType)
         co_roles = ["Co-Agent", "Co-Patient", "Co-Theme"]
-        for role in co_roles:
-            assert role in roles
+        missing = set(co_roles) - THEMATIC_ROLE_TYPES
+        assert not missing, f"missing: {missing}"
 
     def test_no_question_marked_roles(self) -> None:
         """Test that ThematicRoleType doesn't include question-marked roles."""
-        roles = get_type_args(ThematicRoleType)
-        for role in roles:
-            assert not role.startswith("?")
+        question_marked = [r for r in get_type_args(ThematicRoleType) if r.startswith("?")]
+        assert not question_marked, question_marked
 
 
 class TestThematicRoleValue:
@@ -83,44 +107,38 @@ class TestThematicRoleValue:
 
     def test_includes_standard_roles(self) -> None:
         """Test that standard roles are included."""
-        values = get_type_args(ThematicRoleValue)
         standard = ["Agent", "Theme", "Patient", "Source", "Goal"]
-        for role in standard:
-            assert role in values
+        missing = set(standard) - THEMATIC_ROLE_VALUES
+        assert not missing, f"missing: {missing}"
 
     def test_includes_indexed_variants(self) -> None:
         """Test that indexed variants are included."""
-        values = get_type_args(ThematicRoleValue)
         indexed = ["Agent_I", "Agent_J", "Theme_I", "Theme_J"]
-        for role in indexed:
-            assert role in values
+        missing = set(indexed) - THEMATIC_ROLE_VALUES
+        assert not missing, f"missing: {missing}"
 
     def test_includes_question_marked_roles(self) -> None:
         """Test that question-marked roles are included."""
-        values = get_type_args(ThematicRoleValue)
         question_marked = ["?Agent", "?Theme", "?Patient", "?Location"]
-        for role in question_marked:
-            assert role in values
+        missing = set(question_marked) - THEMATIC_ROLE_VALUES
+        assert not missing, f"missing: {missing}"
 
     def test_includes_verb_specific_roles(self) -> None:
         """Test that verb-specific roles are included."""
-        values = get_type_args(ThematicRoleValue)
         verb_specific = ["V_Final_State", "V_Manner", "V_State", "V_Vehicle"]
-        for role in verb_specific:
-            assert role in values
+        missing = set(verb_specific) - THEMATIC_ROLE_VALUES
+        assert not missing, f"missing: {missing}"
 
     def test_includes_event_variables(self) -> None:
         """Test that event variables are included."""
-        values = get_type_args(ThematicRoleValue)
-        assert "e1" in values
-        assert "e2" in values
+        assert "e1" in THEMATIC_ROLE_VALUES
+        assert "e2" in THEMATIC_ROLE_VALUES
 
     def test_includes_special_variants(self) -> None:
         """Test that special variants are included."""
-        values = get_type_args(ThematicRoleValue)
         # Test for known quirks in the data
-        assert "Theme " in values  # With trailing space
-        assert "Initial_location" in values  # Lowercase variant
+        assert "Theme " in THEMATIC_ROLE_VALUES  # With trailing space
+        assert "Initial_location" in THEMATIC_ROLE_VALUES  # Lowercase variant
 
 
 class TestSelectionalRestrictionType:
@@ -133,24 +151,21 @@ class TestSelectionalRestrictionType:
 
     def test_animacy_restrictions_present(self) -> None:
         """Test that animacy restrictions are present."""
-        restrictions = get_type_args(SelectionalRestrictionType)
         animacy = ["animate", "human", "animal", "biotic"]
-        for restriction in animacy:
-            assert restriction in restrictions
+        missing = set(animacy) - SELECTIONAL_RESTRICTION_TYPES
+        assert not missing, f"missing: {missing}"
 
     def test_spatial_restrictions_present(self) -> None:
         """Test that spatial restrictions are present."""
-        restrictions = get_type_args(SelectionalRestrictionType)
         spatial = ["location", "path", "dest", "src", "region", "spatial"]
-        for restriction in spatial:
-            assert restriction in restrictions
+        missing = set(spatial) - SELECTIONAL_RESTRICTION_TYPES
+        assert not missing, f"missing: {missing}"
 
     def test_physical_restrictions_present(self) -> None:
         """Test that physical property restrictions are present."""
-        restrictions = get_type_args(SelectionalRestrictionType)
         physical = ["solid", "nonrigid", "elongated", "pointy", "substance"]
-        for restriction in physical:
-            assert restriction in restrictions
+        missing = set(physical) - SELECTIONAL_RESTRICTION_TYPES
+        assert not missing, f"missing: {missing}"
 
 
 class TestSyntacticRestrictionType:
@@ -163,24 +178,21 @@ class TestSyntacticRestrictionType:
 
     def test_infinitive_restrictions_present(self) -> None:
         """Test that infinitive restrictions are present."""
-        restrictions = get_type_args(SyntacticRestrictionType)
         infinitives = ["ac_to_inf", "np_to_inf", "oc_to_inf", "rs_to_inf", "sc_to_inf"]
-        for restriction in infinitives:
-            assert restriction in restrictions
+        missing = set(infinitives) - SYNTACTIC_RESTRICTION_TYPES
+        assert not missing, f"missing: {missing}"
 
     def test_ing_restrictions_present(self) -> None:
         """Test that -ing restrictions are present."""
-        restrictions = get_type_args(SyntacticRestrictionType)
         ing_forms = ["ac_ing", "be_sc_ing", "np_ing", "np_omit_ing", "oc_ing", "sc_ing"]
-        for restriction in ing_forms:
-            assert restriction in restrictions
+        missing = set(ing_forms) - SYNTACTIC_RESTRICTION_TYPES
+        assert not missing, f"missing: {missing}"
 
     def test_wh_restrictions_present(self) -> None:
         """Test that wh- restrictions are present."""
-        restrictions = get_type_args(SyntacticRestrictionType)
         wh_forms = ["wh_comp", "wh_extract", "wh_inf", "wh_ing", "what_extract", "what_inf"]
-        for restriction in wh_forms:
-            assert restriction in restrictions
+        missing = set(wh_forms) - SYNTACTIC_RESTRICTION_TYPES
+        assert not missing, f"missing: {missing}"
 
 
 class TestRestrictionValue:
@@ -199,11 +211,8 @@ class TestSyntacticPOS:
 
     def test_syntactic_pos_values(self) -> None:
         """Test that all syntactic POS values are present."""
-        pos_values = get_type_args(SyntacticPOS)
         expected = ["NP", "VERB", "PREP", "ADV", "ADJ", "LEX", "ADVP", "S", "SBAR"]
-        assert len(pos_values) == len(expected)
-        for pos in expected:
-            assert pos in pos_values
+        assert set(get_type_args(SyntacticPOS)) == set(expected)
 
 
 class TestArgumentType:
@@ -211,11 +220,8 @@ class TestArgumentType:
 
     def test_argument_types(self) -> None:
         """Test that all argument types are present."""
-        arg_types = get_type_args(ArgumentType)
         expected = ["Event", "ThemRole", "VerbSpecific", "PredSpecific", "Constant"]
-        assert len(arg_types) == len(expected)
-        for arg_type in expected:
-            assert arg_type in arg_types
+        assert set(get_type_args(ArgumentType)) == set(expected)
 
 
 class TestPredicateType:
@@ -228,7 +234,6 @@ class TestPredicateType:
 
     def test_motion_predicates_present(self) -> None:
         """Test that motion predicates are present."""
-        predicates = get_type_args(PredicateType)
         motion = [
             "motion",
             "body_motion",
@@ -238,12 +243,11 @@ class TestPredicateType:
             "rotational_motion",
             "temporal_motion",
         ]
-        for pred in motion:
-            assert pred in predicates
+        missing = set(motion) - PREDICATE_TYPES
+        assert not missing, f"missing: {missing}"
 
     def test_state_predicates_present(self) -> None:
         """Test that state predicates are present."""
-        predicates = get_type_args(PredicateType)
         states = [
             "state",
             "has_state",
@@ -252,15 +256,14 @@ class TestPredicateType:
             "has_location",
             "has_possession",
         ]
-        for pred in states:
-            assert pred in predicates
+        missing = set(states) - PREDICATE_TYPES
+        assert not missing, f"missing: {missing}"
 
     def test_change_predicates_present(self) -> None:
         """Test that change predicates are present."""
-        predicates = get_type_args(PredicateType)
         changes = ["change", "change_value", "become", "develop", "disappear"]
-        for pred in changes:
-            assert pred in predicates
+        missing = set(changes) - PREDICATE_TYPES
+        assert not missing, f"missing: {missing}"
 
     def test_special_case_predicates(self) -> None:
         """Test special case predicates."""
@@ -274,11 +277,8 @@ class TestEventType:
 
     def test_event_types(self) -> None:
         """Test that all event types are present."""
-        event_types = get_type_args(EventType)
         expected = ["process", "state", "transition", "achievement"]
-        assert len(event_types) == len(expected)
-        for event_type in expected:
-            assert event_type in event_types
+        assert set(get_type_args(EventType)) == set(expected)
 
 
 class TestFrameDescriptionElement:
@@ -286,14 +286,12 @@ class TestFrameDescriptionElement:
 
     def test_basic_constituents_present(self) -> None:
         """Test that basic constituents are present."""
-        elements = get_type_args(FrameDescriptionElement)
         basic = ["V", "NP", "PP", "S", "VP", "ADJP", "ADVP", "ADJ", "ADV"]
-        for element in basic:
-            assert element in elements
+        missing = set(basic) - FRAME_DESCRIPTION_ELEMENTS
+        assert not missing, f"missing: {missing}"
 
     def test_np_role_elements_present(self) -> None:
         """Test that NP elements with roles are present."""
-        elements = get_type_args(FrameDescriptionElement)
         np_roles = [
             "NP.agent",
             "NP.theme",
@@ -301,12 +299,11 @@ class TestFrameDescriptionElement:
             "NP.source",
             "NP.destination",
         ]
-        for element in np_roles:
-            assert element in elements
+        missing = set(np_roles) - FRAME_DESCRIPTION_ELEMENTS
+        assert not missing, f"missing: {missing}"
 
     def test_pp_role_elements_present(self) -> None:
         """Test that PP elements with roles are present."""
-        elements = get_type_args(FrameDescriptionElement)
         pp_roles = [
             "PP.agent",
             "PP.theme",
@@ -314,22 +311,20 @@ class TestFrameDescriptionElement:
             "PP.destination",
             "PP.instrument",
         ]
-        for element in pp_roles:
-            assert element in elements
+        missing = set(pp_roles) - FRAME_DESCRIPTION_ELEMENTS
+        assert not missing, f"missing: {missing}"
 
     def test_special_elements_present(self) -> None:
         """Test that special elements are present."""
-        elements = get_type_args(FrameDescriptionElement)
         special = ["It", "it", "There", "there", "Passive", "(PP)"]
-        for element in special:
-            assert element in elements
+        missing = set(special) - FRAME_DESCRIPTION_ELEMENTS
+        assert not missing, f"missing: {missing}"
 
     def test_particles_present(self) -> None:
         """Test that particles are present."""
-        elements = get_type_args(FrameDescriptionElement)
         particles = ["apart", "down", "out", "together", "up"]
-        for particle in particles:
-            assert particle in elements
+        missing = set(particles) - FRAME_DESCRIPTION_ELEMENTS
+        assert not missing, f"missing: {missing}"
 
 
 class TestSecondaryPattern:
@@ -337,19 +332,17 @@ class TestSecondaryPattern:
 
     def test_basic_patterns_present(self) -> None:
         """Test that basic patterns are present."""
-        patterns = get_type_args(SecondaryPattern)
         basic = [
             "Basic Transitive",
             "Basic Intransitive",
             "Transitive",
             "Intransitive",
         ]
-        for pattern in basic:
-            assert pattern in patterns
+        missing = set(basic) - SECONDARY_PATTERNS
+        assert not missing, f"missing: {missing}"
 
     def test_construction_patterns_present(self) -> None:
         """Test that construction patterns are present."""
-        patterns = get_type_args(SecondaryPattern)
         constructions = [
             "Dative",
             "Double Object",
@@ -358,12 +351,11 @@ class TestSecondaryPattern:
             "Reciprocal",
             "Reflexive",
         ]
-        for pattern in constructions:
-            assert pattern in patterns
+        missing = set(constructions) - SECONDARY_PATTERNS
+        assert not missing, f"missing: {missing}"
 
     def test_pp_patterns_present(self) -> None:
         """Test that PP patterns are present."""
-        patterns = get_type_args(SecondaryPattern)
         pp_patterns = [
             "to-PP",
             "from-PP",
@@ -372,25 +364,23 @@ class TestSecondaryPattern:
             "Goal-PP",
             "Theme-PP",
         ]
-        for pattern in pp_patterns:
-            assert pattern in patterns
+        missing = set(pp_patterns) - SECONDARY_PATTERNS
+        assert not missing, f"missing: {missing}"
 
     def test_compound_patterns_present(self) -> None:
         """Test that compound patterns with semicolons are present."""
-        patterns = get_type_args(SecondaryPattern)
         compound = [
             "NP-PP; Source-PP",
             "NP-PP; to-PP",
             "Transitive; passive",
             "Double Object; Dative",
         ]
-        for pattern in compound:
-            assert pattern in patterns
+        missing = set(compound) - SECONDARY_PATTERNS
+        assert not missing, f"missing: {missing}"
 
     def test_empty_pattern_allowed(self) -> None:
         """Test that empty string is allowed."""
-        patterns = get_type_args(SecondaryPattern)
-        assert "" in patterns
+        assert "" in SECONDARY_PATTERNS
 
 
 class TestGenerativeLexiconTypes:
@@ -398,114 +388,128 @@ class TestGenerativeLexiconTypes:
 
     def test_qualia_types(self) -> None:
         """Test QualiaType values."""
-        qualia = get_type_args(QualiaType)
         expected = ["formal", "constitutive", "telic", "agentive"]
-        assert len(qualia) == len(expected)
-        for qual in expected:
-            assert qual in qualia
+        assert set(get_type_args(QualiaType)) == set(expected)
 
     def test_opposition_types(self) -> None:
         """Test OppositionType values."""
-        oppositions = get_type_args(OppositionType)
         expected = ["motion", "state_change", "possession_transfer", "info_transfer"]
-        assert len(oppositions) == len(expected)
-        for opp in expected:
-            assert opp in oppositions
+        assert set(get_type_args(OppositionType)) == set(expected)
+
+
+@pytest.fixture(scope="class")
+def identifier_patterns() -> dict[str, re.Pattern[str]]:
+    """Compile the VerbNet identifier patterns once for the class using them."""
+    return {
+        "class": re.compile(VERBNET_CLASS_PATTERN),
+        "key": re.compile(VERBNET_KEY_PATTERN),
+        "percentage": re.compile(PERCENTAGE_NOTATION_PATTERN),
+        "description_number": re.compile(DESCRIPTION_NUMBER_PATTERN),
+    }
 
 
 class TestPatternValidation:
     """Test regex pattern validation for VerbNet identifiers."""
 
-    def test_verbnet_class_pattern(self) -> None:
+    @pytest.mark.parametrize(
+        ("value", "valid"),
+        [
+            ("give-13.1", True),
+            ("give-13.1-1", True),
+            ("leave-51.2", True),
+            ("transfer-11.1-1-2", True),
+            ("be_located_at-47.3", True),
+            ("give", False),
+            ("13.1", False),
+            ("Give-13.1", False),  # Capital letter
+            ("give-", False),
+            ("give-13.1\n", False),  # Trailing newline
+        ],
+    )
+    def test_verbnet_class_pattern(
+        self, identifier_patterns: dict[str, re.Pattern[str]], value: str, valid: bool
+    ) -> None:
         """Test VerbNet class ID pattern."""
-        pattern = re.compile(VERBNET_CLASS_PATTERN)
-
-        # Valid class IDs
-        assert pattern.match("give-13.1")
-        assert pattern.match("give-13.1-1")
-        assert pattern.match("leave-51.2")
-        assert pattern.match("transfer-11.1-1-2")
-        assert pattern.match("be_located_at-47.3")
-
-        # Invalid class IDs
-        assert not pattern.match("give")
-        assert not pattern.match("13.1")
-        assert not pattern.match("Give-13.1")  # Capital letter
-        assert not pattern.match("give-")
-
-    def test_verbnet_key_pattern(self) -> None:
+        assert bool(identifier_patterns["class"].fullmatch(value)) is valid
+
+    @pytest.mark.parametrize(
+        ("value", "valid"),
+        [
+            ("give#2", True),
+            ("abandon#1", True),
+            ("run_up#3", True),
+            ("be-located-at#1", True),
+            ("give", False),
+            ("give#", False),
+            ("give@#2", False),
+            ("give#two", False),
+            ("give#2\n", False),  # Trailing newline
+        ],
+    )
+    def test_verbnet_key_pattern(
+        self, identifier_patterns: dict[str, re.Pattern[str]], value: str, valid: bool
+    ) -> None:
         """Test VerbNet member key pattern."""
-        pattern = re.compile(VERBNET_KEY_PATTERN)
-
-        # Valid keys
-        assert pattern.match("give#2")
-        assert pattern.match("abandon#1")
-        assert pattern.match("run_up#3")
-        assert pattern.match("be-located-at#1")
-
-        # Invalid keys
-        assert not pattern.match("give")
-        assert not pattern.match("give#")
-        assert not pattern.match("give@#2")
-        assert not pattern.match("give#two")
-
-    def test_percentage_notation_pattern(self) -> None:
+        assert bool(identifier_patterns["key"].fullmatch(value)) is valid
+
+    @pytest.mark.parametrize(
+        ("value", "valid"),
+        [
+            ("give%2:40:00", True),
+            ("abandon%2:40:01", True),
+            ("dog%1:05:00", True),
+            ("give%2:40", False),  # Missing lex_id
+            ("give%2:40:00::", False),  # Extra colons
+            ("Give%2:40:00", False),  # Capital letter
+            ("give%2:40:00\n", False),  # Trailing newline
+        ],
+    )
+    def test_percentage_notation_pattern(
+        self, identifier_patterns: dict[str, re.Pattern[str]], value: str, valid: bool
+    ) -> None:
         """Test VerbNet's WordNet percentage notation pattern."""
-        pattern = re.compile(PERCENTAGE_NOTATION_PATTERN)
-
-        # Valid notations
-        assert pattern.match("give%2:40:00")
-        assert pattern.match("abandon%2:40:01")
-        assert pattern.match("dog%1:05:00")
-
-        # Invalid notations
-        assert not pattern.match("give%2:40")  # Missing lex_id
-        assert not pattern.match("give%2:40:00::")  # Extra colons
-        assert not pattern.match("Give%2:40:00")  # Capital letter
-
-    def test_description_number_pattern(self) -> None:
+        assert bool(identifier_patterns["percentage"].fullmatch(value)) is valid
+
+    @pytest.mark.parametrize(
+        ("value", "valid"),
+        [
+            ("0", True),
+            ("1", True),
+            ("0.2", True),
+            ("2.5.1", True),
+            ("10.3.4.5", True),
+            ("", False),  # Empty
+            (".2", False),  # No leading number
+            ("2.", False),  # Trailing dot
+            ("2..5", False),  # Double dot
+            ("2.5\n", False),  # Trailing newline
+        ],
+    )
+    def test_description_number_pattern(
+        self, identifier_patterns: dict[str, re.Pattern[str]], value: str, valid: bool
+    ) -> None:
         """Test description number pattern."""
-        pattern = re.compile(DESCRIPTION_NUMBER_PATTERN)
-
-        # Valid numbers
-        assert pattern.match("0")
-        assert pattern.match("1")
-        assert pattern.match("0.2")
-        assert pattern.match("2.5.1")
-        assert pattern.match("10.3.4.5")
-
-        # Invalid numbers
-        assert not pattern.match("")  # Empty
-        assert not pattern.match(".2")  # No leading number
-        assert not pattern.match("2.")  # Trailing dot
-        assert not pattern.match("2..5")  # Double dot
+        assert bool(identifier_patterns["description_number"].fullmatch(value)) is valid
 
 
 class TestCompleteness:
     """Test that type definitions are complete."""
 
-    def test_no_duplicate_values(self) -> None:
+    @pytest.mark.parametrize(("type_literal", "members"), LITERAL_SET_CASES)
+    def test_no_duplicate_values(self, type_literal, members: frozenset[str]) -> None:
         """Test that there are no duplicate values in literals."""
-        type_literals = [
-            ThematicRoleType,
-            ThematicRoleValue,
-            SelectionalRestrictionType,
-            SyntacticRestrictionType,
-            PredicateType,
-            FrameDescriptionElement,
-            SecondaryPattern,
-        ]
-
-        for type_literal in type_literals:
-            values = get_type_args(type_literal)
-            unique_values = set(values)
-            assert len(values) == len(unique_values), f"Duplicates found in {type_literal}"
-
-    def test_type_aliases_are_strings(self) -> None:
+        assert len(get_type_args(type_literal)) == len(members), (
+            f"Duplicates found in {type_literal}"
+        )
+
+    @pytest.mark.parametrize(("type_literal", "members"), LITERAL_SET_CASES)
+    def test_exported_sets_match_literals(self, type_literal, members: frozenset[str]) -> None:
+        """Test that the exported frozensets hold exactly the literal members."""
+        assert members == frozenset(get_type_args(type_literal))
+
+    @pytest.mark.parametrize(
+        "alias", [VerbClassID, VerbNetKey, WordNetSense, DescriptionNumber, PrepositionValue]
+    )
+    def test_type_aliases_are_strings(self, alias) -> None:
         """Test that type aliases resolve to str."""
-        # Type aliases should resolve to str
-        assert VerbClassID.__value__ is str
-        assert VerbNetKey.__value__ is str
-        assert WordNetSense.__value__ is str
-        assert DescriptionNumber.__value__ is str
-        assert PrepositionValue.__value__ is str
+        assert alias.__value__ is str
@@ -4,16 +4,22 @@ Tests the WordNet database file parsing functionality including
 data files, index files, sense index, and exception files.
 """
 
+import json
+import os
+import tracemalloc
+
 import pytest
 
 from glazing.wordnet.converter import (
     WordNetConverter,
+    _scan_data_line,
     convert_wordnet_database,
     parse_data_file,
     parse_exception_file,
     parse_index_file,
     parse_sense_index,
 )
+from glazing.wordnet.models import Pointer, Synset, VerbFrame, Word
 
 
 class TestWordNetConverter:
@@ -138,6 +144,21 @@ women woman
         assert verb_group.source == 0
         assert verb_group.target == 0
 
+    def test_parse_data_file_interns_strings(self, converter, temp_data_file):
+        """Test repeated lemmas share one string object across synsets."""
+        synset1, synset2 = converter.parse_data_file(temp_data_file, "v")
+
+        assert synset1.words[0].lemma is synset2.words[1].lemma
+
+    def test_scan_data_line_interns_pointer_symbols(self):
+        """Test multi-character pointer symbols are interned."""
+        fields = [
+            _scan_data_line(f"{offset} 03 n 01 entity 0 001 @i 00002137 n 0000 | gloss")
+            for offset in ("00001740", "00001930")
+        ]
+
+        assert fields[0][4][0][0] is fields[1][4][0][0]
+
     def test_parse_data_file_nonexistent(self, converter):
         """Test parsing non-existent data file raises FileNotFoundError."""
         with pytest.raises(FileNotFoundError, match="WordNet data file not found"):
@@ -178,6 +199,19 @@ women woman
         # Should be empty since all entries are verbs
         assert len(entries) == 0
 
+    def test_iter_index_file_lazy(self, converter, temp_index_file):
+        """Test index file iteration yields entries one at a time."""
+        entries = converter.iter_index_file(temp_index_file, "v")
+
+        assert next(entries).lemma == "abandon"
+        assert next(entries).lemma == "breathe"
+        assert next(entries, None) is None
+
+    def test_iter_index_file_nonexistent(self, converter):
+        """Test index file iteration raises before the first entry."""
+        with pytest.raises(FileNotFoundError, match="WordNet index file not found"):
+            converter.iter_index_file("nonexistent.index", "n")
+
     def test_parse_sense_index_basic(self, converter, temp_sense_file):
         """Test basic sense index parsing."""
         senses = converter.parse_sense_index(temp_sense_file)
@@ -221,6 +255,20 @@ women woman
         assert entry2.inflected_form == "mice"
         assert entry2.base_forms == ["mouse"]
 
+    def test_parse_exception_file_filters_forms(self, converter, tmp_path):
+        """Test exception parsing drops blank lines and invalid forms."""
+        exc_file = tmp_path / "noun.exc"
+        exc_file.write_text(
+            "\n   \nbases basis base@\n@@ at\nteeth tooth\tteeth_\n", encoding="utf-8"
+        )
+
+        entries = converter.parse_exception_file(exc_file)
+
+        assert [(e.inflected_form, e.base_forms) for e in entries] == [
+            ("bases", ["basis"]),
+            ("teeth", ["tooth", "teeth_"]),
+        ]
+
     def test_convert_wordnet_database_basic(self, converter, tmp_path):
         """Test complete WordNet database conversion."""
         # Create minimal WordNet database
@@ -252,12 +300,159 @@ women woman
         counts = converter.convert_wordnet_database(wordnet_dir, output_file)
 
         # Check counts
-        assert counts["synsets_noun"] == 1
-        assert counts["synsets_verb"] == 1
-        assert counts["total_synsets"] == 2
+        assert counts == {"synsets_noun": 1, "synsets_verb": 1, "total_synsets": 2}
 
-        # Check output file exists
+        # Check output file exists and holds one JSON object per line
         assert output_file.exists()
+        lines = output_file.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["offset"] for line in lines] == ["00001740", "00001740"]
+
+    def test_iter_data_file_lazy(self, converter, temp_data_file):
+        """Test data file iteration yields synsets one at a time."""
+        synsets = converter.iter_data_file(temp_data_file, "v")
+
+        assert next(synsets).offset == "00001740"
+        assert next(synsets).offset == "00002084"
+        assert next(synsets, None) is None
+
+    def test_parse_offsets_interned(self, converter):
+        """Test synset and pointer offsets share one string object."""
+        target = converter._parse_data_line(
+            "00001930 03 n 01 physical_entity 0 000 | physical existence"
+        )
+        source = converter._parse_data_line(
+            "00001740 03 n 01 entity 0 001 ~ 00001930 n 0000 | existence"
+        )
+
+        assert source.pointers[0].offset is target.offset
+
+    def test_iter_data_file_nonexistent(self, converter):
+        """Test data file iteration raises before the first synset."""
+        with pytest.raises(FileNotFoundError, match="WordNet data file not found"):
+            converter.iter_data_file("nonexistent.data", "n")
+
+    def test_convert_wordnet_database_streams_synsets(self, converter, tmp_path):
+        """Test conversion memory stays flat in the number of synsets."""
+        wordnet_dir = tmp_path / "wordnet"
+        wordnet_dir.mkdir()
+        n_lines = 20_000
+        with (wordnet_dir / "data.verb").open("w", encoding="utf-8") as f:
+            for i in range(n_lines):
+                f.write(f"{i:08d} 29 v 01 breathe 0 000 | take in and expel air\n")
+
+        output_file = tmp_path / "output" / "synsets.jsonl"
+
+        tracemalloc.start()
+        try:
+            counts = converter.convert_wordnet_database(wordnet_dir, output_file)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        assert counts["synsets_verb"] == n_lines
+        assert peak < 10 * 1024 * 1024
+
+    @pytest.mark.parametrize(
+        "max_workers", [1, 2, None], ids=["serial", "two-workers", "worker-per-file"]
+    )
+    def test_convert_wordnet_database_workers(self, converter, tmp_path, max_workers):
+        """Test conversion output does not depend on the number of workers."""
+        wordnet_dir = tmp_path / "wordnet"
+        wordnet_dir.mkdir()
+        (wordnet_dir / "data.noun").write_text(
+            "00001740 03 n 01 entity 0 000 | something existing\n"
+            "00001930 03 n 01 physical_entity 0 000 | an entity that has physical existence\n",
+            encoding="utf-8",
+        )
+        (wordnet_dir / "data.verb").write_text(
+            "00001740 29 v 01 breathe 0 000 | take air\n", encoding="utf-8"
+        )
+        (wordnet_dir / "data.adv").write_text(
+            "00001740 02 r 01 barely 0 000 | only just\n", encoding="utf-8"
+        )
+
+        output_file = tmp_path / "output" / "synsets.jsonl"
+        counts = converter.convert_wordnet_database(wordnet_dir, output_file, max_workers)
+
+        assert counts == {
+            "synsets_noun": 2,
+            "synsets_verb": 1,
+            "synsets_adv": 1,
+            "total_synsets": 4,
+        }
+        lines = output_file.read_text(encoding="utf-8").splitlines()
+        ss_types = [Synset.model_validate_json(line).ss_type for line in lines]
+        assert ss_types == ["n", "n", "v", "r"]
+        assert list(output_file.parent.iterdir()) == [output_file]
+
+    def test_convert_wordnet_database_serial_by_default(self, converter, tmp_path, monkeypatch):
+        """Test conversion starts no worker processes unless asked to."""
+
+        def fail(*args, **kwargs):
+            pytest.fail("process pool started without max_workers")
+
+        monkeypatch.setattr("glazing.wordnet.converter.ProcessPoolExecutor", fail)
+        wordnet_dir = tmp_path / "wordnet"
+        wordnet_dir.mkdir()
+        (wordnet_dir / "data.noun").write_text(
+            "00001740 03 n 01 entity 0 000 | something existing\n", encoding="utf-8"
+        )
+        (wordnet_dir / "data.verb").write_text(
+            "00001740 29 v 01 breathe 0 000 | take air\n", encoding="utf-8"
+        )
+
+        counts = converter.convert_wordnet_database(wordnet_dir, tmp_path / "synsets.jsonl")
+
+        assert counts["total_synsets"] == 2
+
+    def test_convert_wordnet_database_batches(self, converter, tmp_path, monkeypatch):
+        """Test batched writes keep every synset, including a partial batch."""
+        monkeypatch.setattr("glazing.wordnet.converter.WRITE_BATCH_SIZE", 2)
+        wordnet_dir = tmp_path / "wordnet"
+        wordnet_dir.mkdir()
+        (wordnet_dir / "data.noun").write_text(
+            "".join(f"{i:08d} 03 n 01 entity 0 000 | gloss {i}\n" for i in range(5)),
+            encoding="utf-8",
+        )
+
+        output_file = tmp_path / "output" / "synsets.jsonl"
+        counts = converter.convert_wordnet_database(wordnet_dir, output_file, max_workers=1)
+
+        assert counts["synsets_noun"] == 5
+        lines = output_file.read_text(encoding="utf-8").splitlines()
+        assert [json.loads(line)["gloss"] for line in lines] == [f"gloss {i}" for i in range(5)]
+
+    def test_convert_wordnet_database_prefetches_data_files(self, converter, tmp_path, monkeypatch):
+        """Test data files are prefetched before parsing when supported."""
+        advised = []
+        monkeypatch.setattr(
+            os,
+            "posix_fadvise",
+            lambda fd, offset, length, advice: advised.append(advice),
+            raising=False,
+        )
+        monkeypatch.setattr(os, "POSIX_FADV_WILLNEED", 3, raising=False)
+        wordnet_dir = tmp_path / "wordnet"
+        wordnet_dir.mkdir()
+        for name in ("noun", "verb"):
+            (wordnet_dir / f"data.{name}").write_text("", encoding="utf-8")
+
+        converter.convert_wordnet_database(wordnet_dir, tmp_path / "synsets.jsonl", max_workers=1)
+
+        assert advised == [3, 3]
+
+    def test_convert_wordnet_database_without_fadvise(self, converter, tmp_path, monkeypatch):
+        """Test conversion works on platforms without posix_fadvise."""
+        monkeypatch.delattr(os, "posix_fadvise", raising=False)
+        wordnet_dir = tmp_path / "wordnet"
+        wordnet_dir.mkdir()
+        (wordnet_dir / "data.noun").write_text(
+            "00001740 03 n 01 entity 0 000 | something existing\n", encoding="utf-8"
+        )
+
+        counts = converter.convert_wordnet_database(wordnet_dir, tmp_path / "synsets.jsonl")
+
+        assert counts["synsets_noun"] == 1
 
     def test_convert_wordnet_database_nonexistent_dir(self, converter, tmp_path):
         """Test conversion of non-existent directory raises FileNotFoundError."""
@@ -272,6 +467,66 @@ women woman
         result = converter._parse_data_line(malformed_line)
         assert result is None
 
+    def test_scan_data_line_fields(self):
+        """Test data line scanning yields plain values for model assembly."""
+        line = (
+            "00002084 29 v 02 respire 0 breathe 1 001 @ 2325 v 0102 "
+            "+ 01 00 + 02 01 | undergo respiration"
+        )
+        offset, lex_filenum, ss_type, words, pointers, frames, gloss = _scan_data_line(line)
+
+        assert offset == "00002084"
+        assert lex_filenum == 29
+        assert ss_type == "v"
+        assert words == [("respire", 0), ("breathe", 1)]
+        assert pointers == [("@", "00002325", "v", 1, 2)]
+        assert frames == [(1, 0), (2, 1)]
+        assert gloss == "undergo respiration"
+
+    @pytest.mark.parametrize(
+        ("source_target", "expected"),
+        [("0000", (0, 0)), ("0102", (1, 2)), ("0a1f", (10, 31)), ("ff01", (255, 1))],
+    )
+    def test_scan_data_line_pointer_source_target(self, source_target, expected):
+        """Test pointer source/target hex digits decode to word numbers."""
+        line = f"00001740 03 n 01 entity 0 001 @ 00001930 n {source_target} | gloss"
+        pointers = _scan_data_line(line)[4]
+
+        assert pointers[0][3:] == expected
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "invalid line format",
+            "00001740 03 n 01 | too few fields",
+            "00001740 xx n 01 entity 0 000 | bad lex_filenum",
+            "00001740 03 n 01 entity 0 | missing p_cnt",
+            "1740 03 n 01 entity 0 000 | unpadded offset",
+        ],
+        ids=["no-gloss", "too-few-fields", "bad-lex-filenum", "missing-p-cnt", "unpadded-offset"],
+    )
+    def test_scan_data_line_malformed(self, converter, line):
+        """Test scanning and parsing malformed data lines returns None."""
+        assert _scan_data_line(line) is None
+        assert converter._parse_data_line(line) is None
+
+    def test_parse_data_line_invalid_model_values(self, converter):
+        """Test lines that scan but fail model validation return None."""
+        line = "0000174x 03 n 01 entity 0 000 | bad offset"
+        assert _scan_data_line(line) is not None
+        assert converter._parse_data_line(line) is None
+
+    def test_parse_data_line_nested_models(self, converter):
+        """Test synsets are built with validated nested models."""
+        synset = converter._parse_data_line(
+            "00002084 29 v 01 respire 0 001 @ 00002325 v 0000 + 01 00 | breathe"
+        )
+
+        assert isinstance(synset.words[0], Word)
+        assert isinstance(synset.pointers[0], Pointer)
+        assert isinstance(synset.frames[0], VerbFrame)
+        assert converter._parse_data_line("00002084 29 v 01 Bad@Lemma 0 000 | x") is None
+
     def test_parse_index_line_malformed(self, converter):
         """Test parsing malformed index line returns None."""
         malformed_line = "invalid line format"
@@ -284,6 +539,31 @@ women woman
         result = converter._parse_sense_line(malformed_line)
         assert result is None
 
+    def test_parse_sense_line_satellite_head(self, converter):
+        """Test satellite sense keys carry their head word and head id."""
+        sense = converter._parse_sense_line("ablaze%5:00:00:lighted:01 00001740 1 0")
+
+        assert sense is not None
+        assert sense.lemma == "ablaze"
+        assert sense.ss_type == "s"
+        assert sense.head_word == "lighted"
+        assert sense.head_id == 1
+
+    @pytest.mark.parametrize(
+        "line",
+        [
+            "entity%1:03:00 00001740 1 0",
+            "entity%1:03:00:: 00001740 1",
+            "entity%1:03:00:: 00001740 1 0 7",
+            "entity1:03:00:: 00001740 1 0",
+            "entity%n:03:00:: 00001740 1 0",
+        ],
+        ids=["short-key", "missing-tag-count", "extra-field", "no-percent", "non-digit-ss-type"],
+    )
+    def test_parse_sense_line_rejects(self, converter, line):
+        """Test sense lines not matching the sense index grammar return None."""
+        assert converter._parse_sense_line(line) is None
+
     def test_parse_exception_line_malformed(self, converter):
         """Test parsing malformed exception line returns None."""
         malformed_line = "invalid"  # Only one word
@@ -301,6 +581,37 @@ women woman
         assert not converter._is_valid_word_form("123invalid")
         assert not converter._is_valid_word_form("invalid@")
 
+    @pytest.mark.parametrize(
+        ("word", "expected"),
+        [
+            ("A", True),
+            ("Zebra", True),
+            ("a1", True),
+            ("o'clock", True),
+            ("_leading", False),
+            ("-leading", False),
+            ("'leading", False),
+            ("with space", False),
+            ("caf\u00e9", False),
+            ("trailing\n", False),
+        ],
+        ids=[
+            "single-letter",
+            "capitalized",
+            "trailing-digit",
+            "inner-apostrophe",
+            "leading-underscore",
+            "leading-hyphen",
+            "leading-apostrophe",
+            "space",
+            "non-ascii",
+            "newline",
+        ],
+    )
+    def test_is_valid_word_form_cases(self, converter, word, expected):
+        """Test word form character classes."""
+        assert converter._is_valid_word_form(word) is expected
+
     def test_lex_file_names_mapping(self, converter):
         """Test lexical file name mapping."""
         assert converter.LEX_FILE_NAMES[0] == "adj.all"
@@ -309,6 +620,22 @@ women woman
         assert converter.LEX_FILE_NAMES[30] == "verb.body"
         assert converter.LEX_FILE_NAMES[44] == "verb.weather"
 
+    def test_lex_file_names_complete(self, converter):
+        """Test every lexical file number 0-44 has a name."""
+        assert len(converter.LEX_FILE_NAMES) == 45
+        assert len(set(converter.LEX_FILE_NAMES)) == 45
+
+    @pytest.mark.parametrize(
+        ("ss_type_digit", "expected"),
+        [("1", "n"), ("2", "v"), ("3", "a"), ("4", "r"), ("5", "s")],
+        ids=["noun", "verb", "adj", "adv", "satellite"],
+    )
+    def test_parse_sense_line_ss_type(self, converter, ss_type_digit, expected):
+        """Test sense key ss_type digits map to synset types."""
+        sense = converter._parse_sense_line(f"word%{ss_type_digit}:00:00:: 00001740 1 0")
+        assert sense is not None
+        assert sense.ss_type == expected
+
     def test_parse_data_file_empty_lines(self, converter, tmp_path):
         """Test data file parsing handles empty lines and comments."""
         content = """  Copyright notice
@@ -323,6 +650,41 @@ women woman
         synsets = converter.parse_data_file(data_file, "n")
         assert len(synsets) == 1
 
+    def test_parse_data_file_zero_length(self, converter, tmp_path):
+        """Test parsing an empty data file yields no synsets."""
+        data_file = tmp_path / "data.noun"
+        data_file.touch()
+
+        assert converter.parse_data_file(data_file, "n") == []
+
+    @pytest.mark.parametrize(
+        "content",
+        ["  Copyright notice\n  More copyright text\n", "  Copyright notice without newline"],
+        ids=["header-only", "unterminated-header"],
+    )
+    def test_parse_data_file_header_only(self, converter, tmp_path, content):
+        """Test a file holding only the license header yields no synsets."""
+        data_file = tmp_path / "data.noun"
+        data_file.write_text(content, encoding="utf-8")
+
+        assert converter.parse_data_file(data_file, "n") == []
+
+    def test_parse_sense_index_error_line_numbers(self, converter, tmp_path, monkeypatch, capsys):
+        """Test reported line numbers count the skipped license header."""
+        sense_file = tmp_path / "index.sense"
+        sense_file.write_text(
+            "  Copyright notice\n  More copyright text\nentity%1:03:00:: 00001740 1 0\n",
+            encoding="utf-8",
+        )
+
+        def fail(line):
+            raise ValueError("bad line")
+
+        monkeypatch.setattr(converter, "_parse_sense_line", fail)
+
+        assert converter.parse_sense_index(sense_file) == []
+        assert "Error parsing line 3" in capsys.readouterr().out
+
     def test_parse_complex_gloss(self, converter, tmp_path):
         """Test parsing synset with complex gloss containing special characters."""
         content = "00001740 03 n 01 entity 0 000 | that which is perceived or known or inferred to have its own distinct existence (living or nonliving)"
@@ -334,6 +696,14 @@ women woman
         assert "perceived" in synsets[0].gloss
         assert "nonliving" in synsets[0].gloss
 
+    def test_parse_data_file_gloss_trailing_whitespace(self, converter, tmp_path):
+        """Test the trailing spaces WordNet writes after a gloss are dropped."""
+        data_file = tmp_path / "data.noun"
+        data_file.write_text("00001740 03 n 01 entity 0 000 | an entity  \n", encoding="utf-8")
+
+        synsets = converter.parse_data_file(data_file, "n")
+        assert synsets[0].gloss == "an entity"
+
 
 class TestWordNetConverterFunctions:
     """Test WordNet converter module functions."""
@@ -4,13 +4,44 @@ WordNet-specific tests focusing on Princeton University
 tar.gz archive download and version handling.
 """
 
+import io
+import tarfile
 from pathlib import Path
 
 import pytest
+import requests
 
 from glazing.downloader import DownloadError, ExtractionError, WordNetDownloader
 
 
+def make_wordnet_archive(tmp_path: Path, folder: str = "dict") -> bytes:
+    """Build an in-memory WordNet-style tar.gz with a single folder."""
+    source = tmp_path / "archive-source" / folder
+    source.mkdir(parents=True)
+    (source / "data.noun").write_text("sample noun data")
+    buffer = io.BytesIO()
+    with tarfile.open(fileobj=buffer, mode="w:gz") as tar:
+        tar.add(source, arcname=folder)
+    return buffer.getvalue()
+
+
+class FakeStreamResponse:
+    """Minimal streamed ``requests`` response over an in-memory body."""
+
+    def __init__(self, body: bytes) -> None:
+        self.raw = io.BytesIO(body)
+        self.headers = {"content-length": str(len(body))}
+
+    def __enter__(self) -> "FakeStreamResponse":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.raw.close()
+
+    def raise_for_status(self) -> None:
+        """Accept every response."""
+
+
 class TestWordNetDownloader:
     """Test WordNet-specific downloader functionality."""
 
@@ -56,13 +87,69 @@ class TestWordNetDownloader:
         monkeypatch.setattr(WordNetDownloader, "_download_file", mock_download_file)
 
         downloader = WordNetDownloader()
-        result = downloader.download(tmp_path)
+        result = downloader.download(tmp_path, streaming=False)
 
         # Verify the result - should be wn31-dict now
         assert result == extracted_dir
         assert result.exists()
         assert (result / "data.noun").exists()
 
+    def test_streaming_download(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test streamed download extracts without writing an archive file."""
+        body = make_wordnet_archive(tmp_path)
+        requested = []
+
+        def mock_get(url: str, **kwargs: object) -> FakeStreamResponse:
+            requested.append((url, kwargs["stream"]))
+            return FakeStreamResponse(body)
+
+        monkeypatch.setattr("glazing.downloader.requests.get", mock_get)
+
+        output_dir = tmp_path / "output"
+        result = WordNetDownloader().download(output_dir)
+
+        assert result == output_dir / "wn31-dict"
+        assert (result / "data.noun").read_text() == "sample noun data"
+        assert requested == [("https://wordnetcode.princeton.edu/wn3.1.dict.tar.gz", True)]
+        assert [path.name for path in output_dir.iterdir()] == ["wn31-dict"]
+
+    def test_streaming_download_corrupted(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test streamed download of a corrupted archive raises ExtractionError."""
+        monkeypatch.setattr(
+            "glazing.downloader.requests.get",
+            lambda url, **kwargs: FakeStreamResponse(b"corrupted tar.gz"),
+        )
+
+        with pytest.raises(ExtractionError, match="Failed to extract archive"):
+            WordNetDownloader().download(tmp_path)
+
+    def test_streaming_download_missing_dict(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test streamed archive without a 'dict' folder raises ExtractionError."""
+        body = make_wordnet_archive(tmp_path, folder="other")
+        monkeypatch.setattr(
+            "glazing.downloader.requests.get", lambda url, **kwargs: FakeStreamResponse(body)
+        )
+
+        with pytest.raises(ExtractionError, match="Expected 'dict' folder"):
+            WordNetDownloader().download(tmp_path / "output")
+
+    def test_streaming_download_network_error(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test streamed download network failures raise DownloadError."""
+
+        def mock_get(url: str, **kwargs: object) -> FakeStreamResponse:
+            raise requests.ConnectionError("Princeton server unavailable")
+
+        monkeypatch.setattr("glazing.downloader.requests.get", mock_get)
+
+        with pytest.raises(DownloadError, match="Princeton server unavailable"):
+            WordNetDownloader().download(tmp_path)
+
     def test_download_url_format(self) -> None:
         """Test that download URL points to Princeton University."""
         downloader = WordNetDownloader()
@@ -115,7 +202,7 @@ class TestWordNetDownloader:
         monkeypatch.setattr(WordNetDownloader, "_download_file", mock_download_file)
 
         downloader = WordNetDownloader()
-        result = downloader.download(tmp_path)
+        result = downloader.download(tmp_path, streaming=False)
 
         # Archive should be cleaned up
         assert not archive_path.exists()
@@ -137,7 +224,7 @@ class TestWordNetDownloader:
         downloader = WordNetDownloader()
 
         with pytest.raises(ExtractionError, match="Failed to extract WordNet archive"):
-            downloader.download(tmp_path)
+            downloader.download(tmp_path, streaming=False)
 
         # Archive should still be cleaned up
         assert not archive_path.exists()
@@ -188,7 +275,7 @@ class TestWordNetDownloader:
         downloader = WordNetDownloader()
 
         with pytest.raises(DownloadError, match="Princeton server unavailable"):
-            downloader.download(tmp_path)
+            downloader.download(tmp_path, streaming=False)
 
         # No archive should remain
         archive_path = tmp_path / "wordnet-3.1.tar.gz"
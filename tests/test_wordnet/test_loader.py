@@ -1,20 +1,21 @@
 """Tests for WordNet loader module."""
 
 import json
+import sys
 import tempfile
 from pathlib import Path
 
 import pytest
 
-from glazing.wordnet.loader import WordNetLoader, load_wordnet
+from glazing.wordnet.loader import WordNetLoader, _iter_jsonl_lines, load_wordnet
 
 
 class TestWordNetLoader:
     """Test WordNet loader functionality."""
 
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def temp_data_dir(self):
-        """Create temporary directory with test data."""
+        """Create temporary directory with test data, shared by read-only tests."""
         with tempfile.TemporaryDirectory() as tmpdir:
             data_path = Path(tmpdir)
 
@@ -186,6 +187,47 @@ class TestWordNetLoader:
         assert entity.words[0].lemma == "entity"
         assert len(entity.pointers) == 1
 
+    def test_load_merges_files_in_pos_order(self, temp_data_dir):
+        """Test concurrently read files are merged in noun, verb order."""
+        loader = WordNetLoader(temp_data_dir)
+
+        assert list(loader.synsets) == ["00001740", "00001930", "00002325"]
+        assert list(loader.lemma_index) == ["entity", "physical_entity", "run"]
+        assert list(loader.exceptions) == ["n", "v"]
+
+    def test_load_skips_malformed_lines(self, tmp_path, capsys):
+        """Test malformed JSON and invalid records are reported and skipped."""
+        synset = {
+            "offset": "00001740",
+            "lex_filenum": 3,
+            "lex_filename": "noun.Tops",
+            "ss_type": "n",
+            "words": [{"lemma": "entity", "lex_id": 0}],
+            "pointers": [],
+            "gloss": "something existing",
+        }
+        lines = ['{"offset": "0000', json.dumps({**synset, "offset": "bad"}), json.dumps(synset)]
+        (tmp_path / "data.noun.jsonl").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        loader = WordNetLoader(tmp_path)
+
+        assert list(loader.synsets) == ["00001740"]
+        assert capsys.readouterr().out.count("Error loading synset") == 2
+
+    def test_iter_jsonl_lines_skips_blank_lines(self, tmp_path):
+        """Test JSONL lines are yielded as bytes without blank lines."""
+        jsonl_file = tmp_path / "records.jsonl"
+        jsonl_file.write_bytes(b'{"a": 1}\n\n  \n{"b": 2}')
+
+        assert list(_iter_jsonl_lines(jsonl_file)) == [b'{"a": 1}\n', b'{"b": 2}']
+
+    def test_iter_jsonl_lines_empty_file(self, tmp_path):
+        """Test an empty JSONL file yields nothing."""
+        jsonl_file = tmp_path / "records.jsonl"
+        jsonl_file.touch()
+
+        assert list(_iter_jsonl_lines(jsonl_file)) == []
+
     def test_load_index(self, temp_data_dir):
         """Test loading index files."""
         loader = WordNetLoader(temp_data_dir)
@@ -227,6 +269,18 @@ class TestWordNetLoader:
         assert "ran" in loader.exceptions["v"]
         assert loader.exceptions["v"]["ran"] == ["run"]
 
+    def test_load_exceptions_native_format(self, tmp_path):
+        """Test exception files in WordNet's space-separated format."""
+        (tmp_path / "verb.exc.jsonl").write_text(
+            "ate eat\nbetter better well\nlonely\n", encoding="utf-8"
+        )
+        (tmp_path / "adj.exc.jsonl").touch()
+
+        loader = WordNetLoader(tmp_path)
+
+        assert loader.exceptions["v"] == {"ate": ["eat"], "better": ["better", "well"]}
+        assert loader.exceptions["a"] == {}
+
     def test_build_relation_indices(self, temp_data_dir):
         """Test building relation indices."""
         loader = WordNetLoader(temp_data_dir)
@@ -240,6 +294,47 @@ class TestWordNetLoader:
         assert "00001740" in loader.hyponym_index
         assert "00001930" in loader.hyponym_index["00001740"]
 
+    def test_build_relation_indices_both_directions(self, tmp_path):
+        """Test each relation is indexed once in each direction."""
+        pointers = {
+            "00000001": [("%p", "00000002"), ("@", "00000003")],
+            "00000002": [("#p", "00000001")],
+            "00000003": [("~", "00000001"), ("!", "00000002")],
+        }
+        with (tmp_path / "data.noun.jsonl").open("w") as f:
+            for offset, links in pointers.items():
+                synset = {
+                    "offset": offset,
+                    "lex_filenum": 3,
+                    "lex_filename": "noun.Tops",
+                    "ss_type": "n",
+                    "words": [{"lemma": "thing", "lex_id": 0}],
+                    "pointers": [
+                        {"symbol": symbol, "offset": target, "pos": "n", "source": 0, "target": 0}
+                        for symbol, target in links
+                    ],
+                    "gloss": "a thing",
+                }
+                f.write(json.dumps(synset) + "\n")
+
+        loader = WordNetLoader(tmp_path)
+
+        assert dict(loader.meronym_index) == {"00000001": ["00000002"]}
+        assert dict(loader.holonym_index) == {"00000002": ["00000001"]}
+        assert dict(loader.hypernym_index) == {"00000001": ["00000003"]}
+        assert dict(loader.hyponym_index) == {"00000003": ["00000001"]}
+
+    def test_relation_indices_share_interned_offsets(self, temp_data_dir):
+        """Test relation index offsets are the interned synset keys."""
+        loader = WordNetLoader(temp_data_dir)
+        keys = {offset: offset for offset in loader.synsets}
+
+        for index in (loader.hypernym_index, loader.hyponym_index):
+            for source, targets in index.items():
+                assert source is keys[source]
+                assert all(target is keys[target] for target in targets)
+        assert all(offset is sys.intern(offset) for offset in keys)
+
     def test_get_synset(self, temp_data_dir):
         """Test getting synset by offset."""
         loader = WordNetLoader(temp_data_dir)
@@ -277,6 +372,41 @@ class TestWordNetLoader:
         synsets = loader.get_synsets_by_lemma("nonexistent")
         assert len(synsets) == 0
 
+    def test_get_synsets_by_lemma_across_pos(self, tmp_path):
+        """Test a lemma indexed under several POS returns synsets in POS order."""
+        for pos_name, pos, offset, lex_filename in [
+            ("verb", "v", "00002325", "verb.motion"),
+            ("noun", "n", "00189565", "noun.act"),
+        ]:
+            synset = {
+                "offset": offset,
+                "lex_filenum": 0,
+                "lex_filename": lex_filename,
+                "ss_type": pos,
+                "words": [{"lemma": "run", "lex_id": 0}],
+                "pointers": [],
+                "gloss": f"run as a {pos_name}",
+            }
+            entry = {
+                "lemma": "run",
+                "pos": pos,
+                "synset_cnt": 1,
+                "p_cnt": 0,
+                "ptr_symbols": [],
+                "sense_cnt": 1,
+                "tagsense_cnt": 0,
+                "synset_offsets": [offset],
+            }
+            (tmp_path / f"data.{pos_name}.jsonl").write_text(json.dumps(synset) + "\n")
+            (tmp_path / f"index.{pos_name}.jsonl").write_text(json.dumps(entry) + "\n")
+
+        loader = WordNetLoader(tmp_path)
+
+        assert [s.offset for s in loader.get_synsets_by_lemma("run")] == ["00189565", "00002325"]
+        assert [s.offset for s in loader.get_synsets_by_lemma("run", "v")] == ["00002325"]
+        assert loader.get_synsets_by_lemma("run", "a") == []
+        assert list(loader.lemma_index["run"]) == ["n", "v"]
+
     def test_get_sense_by_key(self, temp_data_dir):
         """Test getting sense by key."""
         loader = WordNetLoader(temp_data_dir)
@@ -304,6 +434,55 @@ class TestWordNetLoader:
         assert len(senses) == 1
         assert senses[0].sense_key == "run%2:38:00::"
 
+    def test_get_senses_by_lemma_orders_by_sense_number(self, tmp_path):
+        """Test senses are matched by lemma and synset, then sorted by frequency."""
+        offsets = ["08420278", "09213565"]
+        with (tmp_path / "data.noun.jsonl").open("w") as f:
+            for offset in offsets:
+                synset = {
+                    "offset": offset,
+                    "lex_filenum": 14,
+                    "lex_filename": "noun.group",
+                    "ss_type": "n",
+                    "words": [{"lemma": "bank", "lex_id": 0}, {"lemma": "depository", "lex_id": 0}],
+                    "pointers": [],
+                    "gloss": "a bank",
+                }
+                f.write(json.dumps(synset) + "\n")
+        entry = {
+            "lemma": "bank",
+            "pos": "n",
+            "synset_cnt": 2,
+            "p_cnt": 0,
+            "ptr_symbols": [],
+            "sense_cnt": 2,
+            "tagsense_cnt": 0,
+            "synset_offsets": offsets,
+        }
+        (tmp_path / "index.noun.jsonl").write_text(json.dumps(entry) + "\n")
+        with (tmp_path / "index.sense.jsonl").open("w") as f:
+            for lemma, offset, lex_id, number in [
+                ("depository", offsets[0], 0, 1),
+                ("bank", offsets[0], 0, 2),
+                ("bank", offsets[1], 1, 1),
+            ]:
+                sense = {
+                    "sense_key": f"{lemma}%1:14:0{lex_id}::",
+                    "lemma": lemma,
+                    "ss_type": "n",
+                    "lex_filenum": 14,
+                    "lex_id": lex_id,
+                    "synset_offset": offset,
+                    "sense_number": number,
+                    "tag_count": 0,
+                }
+                f.write(json.dumps(sense) + "\n")
+
+        loader = WordNetLoader(tmp_path)
+        senses = loader.get_senses_by_lemma("bank", "n")
+
+        assert [sense.sense_key for sense in senses] == ["bank%1:14:01::", "bank%1:14:00::"]
+
     def test_get_hypernyms(self, temp_data_dir):
         """Test getting hypernyms."""
         loader = WordNetLoader(temp_data_dir)
@@ -324,6 +503,18 @@ class TestWordNetLoader:
         assert len(hyponyms) == 1
         assert hyponyms[0].offset == "00001930"
 
+    def test_get_hypernyms_cached(self, temp_data_dir):
+        """Test resolved hypernyms are cached but returned as fresh lists."""
+        loader = WordNetLoader(temp_data_dir)
+        synset = loader.get_synset("00001930")
+
+        first = loader.get_hypernyms(synset)
+        first.clear()
+        second = loader.get_hypernyms(synset)
+
+        assert [s.offset for s in second] == ["00001740"]
+        assert "00001930" in loader._hypernym_cache
+
     def test_lazy_loading(self, temp_data_dir):
         """Test lazy loading mode."""
         loader = WordNetLoader(temp_data_dir, lazy=True, cache_size=2)
@@ -346,6 +537,73 @@ class TestWordNetLoader:
         assert cached is not None
         assert cached.offset == "00001740"
 
+    def test_lazy_loading_byte_ranges(self, tmp_path):
+        """Test lazy loading slices records around blank lines and a missing final newline."""
+        records = [
+            {
+                "offset": offset,
+                "lex_filenum": 3,
+                "lex_filename": "noun.Tops",
+                "ss_type": "n",
+                "words": [{"lemma": lemma, "lex_id": 0}],
+                "pointers": [],
+                "gloss": f"a {lemma}",
+            }
+            for offset, lemma in [("00001740", "entity"), ("00001930", "thing")]
+        ]
+        (tmp_path / "data.noun.jsonl").write_text(
+            json.dumps(records[0]) + "\n\n" + json.dumps(records[1]), encoding="utf-8"
+        )
+
+        loader = WordNetLoader(tmp_path, lazy=True)
+        loader.load()
+
+        _, start, end = loader._synset_file_index[1930]
+        assert end - start == len(json.dumps(records[1]))
+        assert loader.get_synset("00001740").gloss == "a entity"
+        assert loader.get_synset("00001930").gloss == "a thing"
+
+    def test_lazy_loading_truncated_file(self, tmp_path):
+        """Test lazy lookups into a file truncated after indexing return None."""
+        record = {
+            "offset": "00001740",
+            "lex_filenum": 3,
+            "lex_filename": "noun.Tops",
+            "ss_type": "n",
+            "words": [{"lemma": "entity", "lex_id": 0}],
+            "pointers": [],
+            "gloss": "a entity",
+        }
+        synset_file = tmp_path / "data.noun.jsonl"
+        synset_file.write_text(json.dumps(record) + "\n", encoding="utf-8")
+
+        with WordNetLoader(tmp_path, lazy=True) as loader:
+            loader.load()
+            synset_file.write_text("", encoding="utf-8")
+
+            assert loader.get_synset("00001740") is None
+
+    def test_close_releases_maps(self, temp_data_dir):
+        """Test closing a lazy loader releases its maps and stops lazy lookups."""
+        with WordNetLoader(temp_data_dir, lazy=True) as loader:
+            loader.load()
+            assert loader.get_synset("00001740") is not None
+            mmaps = list(loader._mmaps)
+
+        assert mmaps
+        assert all(mm.closed for mm in mmaps)
+        assert loader._mmaps == []
+        assert loader.get_synset("00001740") is None
+
+    @pytest.mark.parametrize("offset", ["1740", "00001740 ", "+0001740", "0000174x", "٠٠٠٠١٧٤٠"])
+    def test_lazy_loading_rejects_malformed_offsets(self, temp_data_dir, offset):
+        """Test lazy lookups only match 8-digit ASCII offsets."""
+        loader = WordNetLoader(temp_data_dir, lazy=True)
+        loader.load()
+
+        assert loader.get_synset(offset) is None
+        assert loader.get_synset("00001740") is not None
+
     def test_get_exceptions(self, temp_data_dir):
         """Test getting morphological exceptions."""
         loader = WordNetLoader(temp_data_dir)
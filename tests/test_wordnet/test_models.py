@@ -34,6 +34,7 @@ class TestWord:
         Word(lemma="dog", lex_id=0)
         Word(lemma="run_up", lex_id=1)
         Word(lemma="mother-in-law", lex_id=0)
+        Word(lemma="o'clock", lex_id=0)
 
         # Invalid lemmas
         with pytest.raises(ValidationError):
@@ -53,6 +54,13 @@ class TestWord:
         with pytest.raises(ValidationError):
             Word(lemma="dog", lex_id=16)
 
+    def test_word_frozen(self):
+        """Test words are immutable and hashable."""
+        word = Word(lemma="dog", lex_id=0)
+        with pytest.raises(ValidationError):
+            word.lemma = "cat"
+        assert hash(word) == hash(Word(lemma="dog", lex_id=0))
+
 
 class TestPointer:
     """Test Pointer model."""
@@ -93,6 +101,13 @@ class TestPointer:
         with pytest.raises(ValidationError):
             Pointer(symbol="@", offset="00001740", pos="n", source=-1, target=0)
 
+    def test_pointer_frozen(self):
+        """Test pointers are immutable and hashable."""
+        pointer = Pointer(symbol="@", offset="00002084", pos="n", source=0, target=0)
+        with pytest.raises(ValidationError):
+            pointer.symbol = "~"
+        assert pointer in {Pointer(symbol="@", offset="00002084", pos="n", source=0, target=0)}
+
 
 class TestVerbFrame:
     """Test VerbFrame model."""
@@ -299,6 +314,19 @@ class TestSynset:
                 gloss="test",
             )
 
+    def test_synset_frozen(self):
+        """Test synset fields cannot be reassigned."""
+        synset = Synset(
+            offset="00001740",
+            lex_filenum=3,
+            lex_filename="adv.all",
+            ss_type="n",
+            words=[Word(lemma="entity", lex_id=0)],
+            gloss="something",
+        )
+        with pytest.raises(ValidationError):
+            synset.gloss = "changed"
+
 
 class TestSense:
     """Test Sense model."""
@@ -414,6 +442,22 @@ class TestIndexEntry:
         assert entry.synset_cnt == 7
         assert len(entry.synset_offsets) == 2
 
+    def test_index_entry_ptr_symbols_set(self):
+        """Test pointer symbols are a set serialized as a sorted list."""
+        entry = IndexEntry(
+            lemma="dog",
+            pos="n",
+            synset_cnt=1,
+            p_cnt=3,
+            ptr_symbols=["~", "@", "!", "@"],
+            sense_cnt=1,
+            tagsense_cnt=1,
+            synset_offsets=["00001740"],
+        )
+        assert entry.ptr_symbols == frozenset({"!", "@", "~"})
+        assert entry.model_dump()["ptr_symbols"] == ["!", "@", "~"]
+        assert IndexEntry.model_validate_json(entry.model_dump_json()) == entry
+
     def test_index_entry_validation(self):
         """Test index entry field validation."""
         # Valid entry